@@ -1,8 +1,8 @@
 import sys
 import re
-import numpy as np
 import traceback
 import gc
+import threading
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit,
     QPushButton, QHBoxLayout, QVBoxLayout, QMessageBox, QComboBox, QSizePolicy, QGridLayout, QStackedLayout
@@ -10,16 +10,13 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QPixmap, QImage, QDragEnterEvent, QDropEvent, QStandardItemModel, QStandardItem, QMovie
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QMimeData, QThread
 
-from PIL import Image, ImageOps, ImageEnhance, ImageFilter
-
 import os
 # Set PADDLEX_HOME globally as per your provided context
 os.environ['PADDLEX_HOME'] = r"C:\Users\VvV\Desktop\python code\Rollercoin Calculator"
 
-from paddleocr import PaddleOCR
-
-# Removed the global 'ocr' instance and 'OCR loaded successfully!' print,
-# as the reader will now be initialized within ImageAnalyzerWidget.
+# PaddleOCR, NumPy and PIL are not imported here: loading them (and the OCR models) takes
+# seconds, so the reader is created on a background thread once the window is up
+# (ImageAnalyzerWidget.start_ocr_reader_preload) and PIL is imported on the first pasted image.
 
 try:
     from Leagues_Info import (
@@ -49,6 +46,10 @@ except ImportError:
         return list(power_ranges.keys())[0] if power_ranges else "Bronze I"
 
 from Value_Paste import ValuePasteWidget
+from rollercoin_core.parsing import ocr_results_to_items, extract_numbers_with_units, associate_tickers_with_rates
+from rollercoin_core.ocr import create_ocr_reader, preprocess_image
+from IconCache import get_icon_cache
+from PerfMetrics import metrics
 
 class ClickToFocusLineEdit(QLineEdit):
     """
@@ -105,13 +106,14 @@ class AnalysisWorker(QThread):
     analysis_finished = pyqtSignal(dict, str, str)
     loading_status_changed = pyqtSignal(str)
 
-    def __init__(self, pil_image, user_power_str, known_tickers, selected_tier, ocr_reader, apply_preprocessing=True):
+    def __init__(self, pil_image, user_power_str, known_tickers, selected_tier, ocr_reader, apply_preprocessing=True, reader_factory=None):
         super().__init__()
         self.pil_image = pil_image
         self.user_power_str = user_power_str
         self.known_tickers = known_tickers
         self.selected_tier = selected_tier
         self.reader = ocr_reader
+        self.reader_factory = reader_factory # Called if ocr_reader is None, e.g. the models are still loading
         self.apply_preprocessing = apply_preprocessing
 
     def run(self):
@@ -119,44 +121,31 @@ class AnalysisWorker(QThread):
 
         detected_values = {}
         try:
-            # The reader is now passed in and should already be initialized
+            # The reader is passed in once the background preload has finished; before that,
+            # wait for (or do) the model loading here, off the GUI thread
             if self.reader is None:
-                # This fallback should ideally not be hit if initialized correctly in ImageAnalyzerWidget
-                self.reader = PaddleOCR(use_angle_cls=True, lang='en')
-
-            processed_pil_image = self.pil_image.copy()
-
-            if self.apply_preprocessing:
-                processed_pil_image = processed_pil_image.convert("L")
-                enhancer = ImageEnhance.Contrast(processed_pil_image)
-                processed_pil_image = enhancer.enhance(1.5)
-                MIN_OCR_WIDTH = 1000
-                if processed_pil_image.width < MIN_OCR_WIDTH:
-                    upscale_factor = MIN_OCR_WIDTH / processed_pil_image.width
-                    processed_pil_image = processed_pil_image.resize(
-                        (int(processed_pil_image.width * upscale_factor), int(processed_pil_image.height * upscale_factor)),
-                        Image.LANCZOS
-                    )
-                processed_pil_image = processed_pil_image.filter(ImageFilter.MedianFilter(3))
-                processed_pil_image = processed_pil_image.convert("RGB")
-            else:
-                processed_pil_image = self.pil_image.convert("RGB")
+                self.loading_status_changed.emit("Loading OCR models...")
+                with metrics.span("ocr.load_reader"):
+                    self.reader = self.reader_factory() if self.reader_factory else create_ocr_reader()
+                self.loading_status_changed.emit("Performing OCR...")
 
-            img_np_array = np.array(processed_pil_image)
-            del processed_pil_image
-            gc.collect()
+            with metrics.span("ocr.preprocess"):
+                img_np_array = preprocess_image(self.pil_image, self.apply_preprocessing)
 
-            ocr_results = self.reader.ocr(img_np_array)
+            with metrics.span("ocr.recognize"):
+                ocr_results = self.reader.ocr(img_np_array)
             del img_np_array
             gc.collect()
 
             self.loading_status_changed.emit("Processing OCR results...")
-            processed_ocr_data = self._process_ocr_raw_results(ocr_results)
-            del ocr_results
-            gc.collect()
+            with metrics.span("ocr.parse_results"):
+                processed_ocr_data = self._process_ocr_raw_results(ocr_results)
+                del ocr_results
+                gc.collect()
 
-            numbers_with_units = self._extract_numbers_with_units(processed_ocr_data)
-            detected_values = self._associate_tickers_with_rates(processed_ocr_data, numbers_with_units)
+                numbers_with_units = self._extract_numbers_with_units(processed_ocr_data)
+                detected_values = self._associate_tickers_with_rates(processed_ocr_data, numbers_with_units)
+            metrics.count("ocr.analyses")
 
             self.analysis_finished.emit(detected_values, self.user_power_str, self.selected_tier)
 
@@ -166,166 +155,15 @@ class AnalysisWorker(QThread):
         finally:
             pass
 
+    # OCR post-processing lives in the Qt-free core (rollercoin_core.parsing)
     def _process_ocr_raw_results(self, ocr_results):
-        processed_data = []
-        if ocr_results and ocr_results[0] is not None:
-            if isinstance(ocr_results[0], dict):
-                rec_texts = ocr_results[0].get('rec_texts', [])
-                rec_scores = ocr_results[0].get('rec_scores', [])
-                dt_polys = ocr_results[0].get('dt_polys', [])
-            else:
-                return []
-
-            min_len = min(len(rec_texts), len(rec_scores), len(dt_polys))
-            for i in range(min_len):
-                text = rec_texts[i].strip()
-                prob = rec_scores[i]
-                bbox = dt_polys[i]
-
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
-
-                x_min = int(min(x_coords))
-                y_min = int(min(y_coords))
-                x_max = int(max(x_coords))
-                y_max = int(max(y_coords))
-
-                width = x_max - x_min
-                height = y_max - y_min
-
-                if text:
-                    processed_data.append({
-                        'text': text,
-                        'left': x_min,
-                        'top': y_min,
-                        'width': width,
-                        'height': height,
-                        'conf': prob * 100
-                    })
-        return processed_data
+        return ocr_results_to_items(ocr_results)
 
     def _extract_numbers_with_units(self, processed_ocr_data):
-        numbers_with_units = []
-        known_units_pattern_regex = r"(GH/S|TH/S|PH/S|EH/S|ZH/S|GHS|THS|PHS|EHS|ZHS|T|P|B|E|ES|PVS)"
-        for item in processed_ocr_data:
-            text = item['text'].strip()
-            if not text:
-                continue
-
-            number_unit_match = re.search(r'(\d[\d,]*\.?\d*)\s*(' + known_units_pattern_regex + r')?', text, re.IGNORECASE)
-            value_str = None
-            unit_str = None
-
-            if number_unit_match:
-                value_str = number_unit_match.group(1).replace(',', '')
-                unit_part_from_regex = number_unit_match.group(2)
-
-                if unit_part_from_regex:
-                    unit_str = unit_part_from_regex.upper()
-                    if unit_str == 'T' or unit_str == 'THS': unit_str = 'Th/s'
-                    elif unit_str == 'P' or unit_str == 'PVS' or unit_str == 'PHS': unit_str = 'Ph/s'
-                    elif unit_str == 'E' or unit_str == 'ES' or unit_str == 'EHS': unit_str = 'Eh/s'
-                    elif unit_str == 'B' or unit_str == 'ZHS': unit_str = 'Zh/s'
-                    elif unit_str == 'GHS': unit_str = 'Gh/s'
-                else:
-                    unit_str = "Gh/s"
-
-            if value_str:
-                numbers_with_units.append({
-                    'value': value_str,
-                    'unit': unit_str,
-                    'x_scaled': item['left'],
-                    'y_scaled': item['top'],
-                    'width_scaled': item['width'],
-                    'height_scaled': item['height']
-                })
-        return numbers_with_units
+        return extract_numbers_with_units(processed_ocr_data)
 
     def _associate_tickers_with_rates(self, processed_ocr_data, numbers_with_units):
-        detected_values = {}
-        known_tickers = self.known_tickers
-
-        def _is_similar_ticker_internal(detected_text):
-            if detected_text in known_tickers:
-                return detected_text
-
-            error_mappings = {
-                "RRIUT": "RLT", "RRU": "RLT", "R.RU": "RLT", "RLJ": "RLT", "RLY": "RLT",
-                "RSTT": "RST", "RSTU": "RST",
-                "TRXY": "TRX", "YTRX": "TRX", "TX": "TRX",
-                "LIC": "LTC", "LTCC": "LTC",
-                "GC": "DOGE", "DOGE.": "DOGE",
-                "CC": "BTC", "BTCC": "BTC",
-                "EH": "ETH", "ETTH": "ETH",
-                "BNBV": "BNB", "BNN": "BNB",
-                "SOLL": "SOL", "5OL": "SOL",
-                "POOL": "POL", "PQOL": "POL",
-                "xrp": "XRP"
-            }
-
-            if detected_text in error_mappings:
-                return error_mappings[detected_text]
-
-            for known_ticker in known_tickers:
-                if len(detected_text) == len(known_ticker):
-                    diff_count = sum(1 for a, b in zip(detected_text, known_ticker) if a != b)
-                    if diff_count <= 1:
-                        return known_ticker
-                if known_ticker in detected_text and abs(len(detected_text) - len(known_ticker)) <= 2:
-                    return known_ticker
-                if detected_text.startswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
-                    return known_ticker
-                if known_ticker.startswith(detected_text) and abs(len(known_ticker) - len(detected_text)) <= 1:
-                    return known_ticker
-                if detected_text.endswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
-                    return known_ticker
-            return None
-
-        for item in processed_ocr_data:
-            text = item['text'].strip()
-            if not text:
-                continue
-
-            processed_text = text.upper()
-            matched_ticker = _is_similar_ticker_internal(processed_text)
-
-            if matched_ticker:
-                ticker_x_scaled = item['left']
-                ticker_y_scaled = item['top']
-                ticker_width_scaled = item['width']
-                ticker_height_scaled = item['height']
-
-                closest_rate_unit_info = None
-                min_distance = float('inf')
-
-                for num_unit_info in numbers_with_units:
-                    x_distance = abs(num_unit_info['x_scaled'] - ticker_x_scaled)
-                    y_distance = abs(num_unit_info['y_scaled'] - ticker_y_scaled)
-
-                    VERTICAL_ALIGNMENT_TOLERANCE = 50
-                    if y_distance > VERTICAL_ALIGNMENT_TOLERANCE:
-                        continue
-
-                    MAX_HORIZONTAL_DISTANCE = 900
-
-                    if num_unit_info['x_scaled'] > ticker_x_scaled and x_distance < MAX_HORIZONTAL_DISTANCE:
-                        current_distance = x_distance + y_distance * 5
-
-                        if current_distance < min_distance:
-                            min_distance = current_distance
-                            closest_rate_unit_info = num_unit_info
-
-                if closest_rate_unit_info:
-                    if matched_ticker not in detected_values:
-                        detected_values[matched_ticker] = {
-                            'rate': float(closest_rate_unit_info['value']),
-                            'unit': closest_rate_unit_info['unit'],
-                            'icon_box': None,
-                            'ticker_x': int(ticker_x_scaled / 1),
-                            'ticker_y': int(ticker_y_scaled / 1),
-                            'ticker_height': int(ticker_height_scaled / 1)
-                        }
-        return detected_values
+        return associate_tickers_with_rates(processed_ocr_data, numbers_with_units, self.known_tickers)
 
 class ImageAnalyzerWidget(QWidget):
     analysis_completed = pyqtSignal(dict, str, str)
@@ -336,14 +174,9 @@ class ImageAnalyzerWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setFocusPolicy(Qt.NoFocus)
-        # Initialize PaddleOCR reader once here with explicit model paths
-        self.reader = PaddleOCR(
-            use_angle_cls=True,
-            lang='en',
-            det_model_dir=os.path.join(os.environ['PADDLEX_HOME'], "official_models", "PP-OCRv5_server_det"),
-            rec_model_dir=os.path.join(os.environ['PADDLEX_HOME'], "official_models", "en_PP-OCRv5_mobile_rec"),
-            cls_model_dir=os.path.join(os.environ['PADDLEX_HOME'], "official_models", "PP-LCNet_x1_0_textline_ori")
-        )
+        # PaddleOCR reader with explicit model paths, created once by _get_ocr_reader()
+        self.reader = None
+        self._reader_lock = threading.Lock()
 
         self.pasted_image = None
         self._cached_ocr_results = {}
@@ -468,12 +301,9 @@ class ImageAnalyzerWidget(QWidget):
         self.loading_label.hide()
         image_container_layout.addWidget(self.loading_label, 0, 0)
 
-        gif_path = os.path.join(os.path.dirname(__file__), "CryptoIcon", "analyzeboxplaceholder.gif")
-        self.gif_movie = QMovie(gif_path)
-        if not self.gif_movie.isValid():
-            self.gif_movie = None
-        else:
-            self.gif_movie.setCacheMode(QMovie.CacheAll)
+        # Shared, already read by the IconCache preload; frames are cached after the first loop
+        self.gif_movie = get_icon_cache().movie("analyzeboxplaceholder.gif")
+        if self.gif_movie is not None:
             self.gif_movie.setSpeed(100)
             self.gif_label.setMovie(self.gif_movie)
             self.gif_movie.start()
@@ -624,7 +454,33 @@ class ImageAnalyzerWidget(QWidget):
             traceback.print_exc()
             QMessageBox.warning(self, "Paste Error", f"Failed to paste image: {e}")
 
+    def _get_ocr_reader(self):
+        """
+        Returns the OCR reader, creating it on first use. Thread-safe: a caller that comes
+        while the preload is running waits for it instead of loading the models twice.
+        """
+        with self._reader_lock:
+            if self.reader is None:
+                self.reader = create_ocr_reader(os.environ['PADDLEX_HOME'])
+            return self.reader
+
+    def start_ocr_reader_preload(self):
+        """
+        Imports PaddleOCR and loads its models on a background thread. Call once the window is shown.
+        """
+        def preload():
+            try:
+                self._get_ocr_reader()
+                if metrics.debug_logging:
+                    print("DEBUG: ImageAnalyzerWidget: OCR reader loaded")
+            except Exception as e:
+                print(f"ERROR: ImageAnalyzerWidget: Could not load the OCR reader: {e}")
+
+        threading.Thread(target=preload, name="OcrReaderPreload", daemon=True).start()
+
     def _display_image_and_analyze(self, source):
+        from PIL import Image
+
         if self.gif_movie and self.gif_movie.isValid() and self.gif_movie.state() == QMovie.Running:
             self.gif_movie.stop()
             self.gif_label.setMovie(None)
@@ -664,7 +520,8 @@ class ImageAnalyzerWidget(QWidget):
                 self.known_tickers,
                 selected_tier_val,
                 self.reader,
-                apply_preprocessing=True
+                apply_preprocessing=True,
+                reader_factory=self._get_ocr_reader
             )
             self.analysis_worker.analysis_finished.connect(self._on_ocr_analysis_finished)
             self.analysis_worker.loading_status_changed.connect(self._update_loading_status)
@@ -675,6 +532,8 @@ class ImageAnalyzerWidget(QWidget):
             QMessageBox.warning(self, "Image Load Error", "Could not load image for display.")
 
     def _qimage_to_pil(self, qimage):
+        from PIL import Image
+
         if qimage.format() != QImage.Format_RGBA8888:
             qimage = qimage.convertToFormat(QImage.Format_RGBA8888)
 
@@ -719,8 +578,9 @@ class ImageAnalyzerWidget(QWidget):
 
         try:
             if not self._is_tier_manual_override:
-                user_power_ghs = convert_power_to_ghs(user_power_str, "Gh/s", UNIT_MULTIPLIERS)
-                determined_tier = determine_tier_from_power(user_power_ghs, TIER_POWER_RANGES)
+                with metrics.span("tier.lookup"):
+                    user_power_ghs = convert_power_to_ghs(user_power_str, "Gh/s", UNIT_MULTIPLIERS)
+                    determined_tier = determine_tier_from_power(user_power_ghs, TIER_POWER_RANGES)
                 if determined_tier and self.global_tier_combo.currentText() != determined_tier:
                     self._setting_tier_programmatically = True
                     index = self.global_tier_combo.findText(determined_tier)
@@ -793,6 +653,7 @@ if __name__ == "__main__":
     main_window.setLayout(layout)
 
     main_window.show()
+    analyzer_widget.start_ocr_reader_preload()
     QTimer.singleShot(0, lambda: analyzer_widget._show_data_input())
     QTimer.singleShot(150, lambda: QApplication.instance().activeWindow().clearFocus() if QApplication.instance().activeWindow() else None)
     sys.exit(app.exec_())
@@ -1,93 +1,282 @@
 import os
 import json
 import re
+import atexit
+import hashlib
+import tempfile
+import threading
+
+from ConfigStore import ConfigStore
+from PerfMetrics import metrics
 
 class BlockDataPersistenceManager:
+    """
+    Keeps user-overridden block durations/rewards. The versioned ConfigStore is the
+    primary storage; the legacy text file is migrated into it on first run and is
+    kept as an optional, hand-editable export (see "block_data_text_export").
+    """
     HEADER_TEXT = (
         "if you wish, change appropriate values here and it will be adjusted in the calculator too\n"
         "--------------------------------------------------------------------------------------\n"
     )
 
-    def __init__(self, base_dir):
+    # Seconds of quiet after the last change before dirty entries are written
+    DEFAULT_SAVE_DEBOUNCE_SECONDS = 1.0
+
+    def __init__(self, base_dir, save_debounce_seconds=DEFAULT_SAVE_DEBOUNCE_SECONDS, config_store=None):
         self.config_dir = os.path.join(base_dir, "Calconfig")
         self.save_file_path = os.path.join(self.config_dir, "Save file for Block Reward and Duration.txt")
         self._ensure_config_dir_exists()
+        self.config_store = config_store if config_store is not None else ConfigStore(base_dir).load()
+
+        # Write-behind state: the last known full data set, the tickers changed since the
+        # last write, and the debounce timer that will write them in the background
+        self.save_debounce_seconds = save_debounce_seconds
+        self._data = {}
+        self._dirty_tickers = set()
+        self._save_timer = None
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock() # Serializes background and exit-time writes
+        self._last_known_digest = None # Hash of the file content last loaded or written by us
+        atexit.register(self.flush)
 
     def _ensure_config_dir_exists(self):
         if not os.path.exists(self.config_dir):
             try:
                 os.makedirs(self.config_dir)
-                print(f"DEBUG: BlockDataPersistenceManager: Created directory: {self.config_dir}")
+                if metrics.debug_logging:
+                    print(f"DEBUG: BlockDataPersistenceManager: Created directory: {self.config_dir}")
             except OSError as e:
                 print(f"ERROR: BlockDataPersistenceManager: Could not create config directory {self.config_dir}: {e}")
 
-    def load_block_data(self):
+    @staticmethod
+    def parse_block_data_text(text):
+        """
+        Parses the human-editable save file format into {TICKER: {'block_duration': ..., 'block_reward': ...}}.
+        """
         data = {}
-        if os.path.exists(self.save_file_path):
-            try:
-                with open(self.save_file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-
-                current_ticker = None
-                for line in lines:
-                    line_stripped_newline = line.strip('\n') # Strip newline, but preserve leading spaces for reward_match
-                    if not line_stripped_newline or line_stripped_newline.startswith("if you wish,") or line_stripped_newline.startswith("----"):
-                        continue
-
-                    # Try to match "TICKER - block duration: VALUE" (or "TICKER - block duration: --")
-                    duration_match = re.match(r'([a-zA-Z]+)\s+-\s+block duration:\s*(.*)', line_stripped_newline, re.IGNORECASE)
-                    if duration_match:
-                        current_ticker = duration_match.group(1).upper()
-                        duration_value = duration_match.group(2).strip()
-                        if current_ticker not in data:
-                            data[current_ticker] = {}
-                        data[current_ticker]['block_duration'] = duration_value
-                        continue
-
-                    # Match "      block reward: VALUE"
-                    reward_match = re.match(r'\s{6}block reward:\s*(.*)', line_stripped_newline, re.IGNORECASE)
-                    if reward_match and current_ticker:
-                        reward_value = reward_match.group(1).strip()
-                        if current_ticker not in data:
-                            data[current_ticker] = {}
-                        data[current_ticker]['block_reward'] = reward_value
-                        continue
-
-                print(f"DEBUG: BlockDataPersistenceManager: Loaded block data from {self.save_file_path}: {data}")
-            except IOError as e:
-                print(f"ERROR: BlockDataPersistenceManager: Failed to read from {self.save_file_path}: {e}")
-            except Exception as e:
-                print(f"ERROR: BlockDataPersistenceManager: Error parsing {self.save_file_path}: {e}")
-        else:
-            print(f"DEBUG: BlockDataPersistenceManager: Save file not found at {self.save_file_path}. Returning empty data.")
+        current_ticker = None
+        for line in text.splitlines():
+            line_stripped_newline = line.strip('\n') # Strip newline, but preserve leading spaces for reward_match
+            if not line_stripped_newline or line_stripped_newline.startswith("if you wish,") or line_stripped_newline.startswith("----"):
+                continue
+
+            # Try to match "TICKER - block duration: VALUE" (or "TICKER - block duration: --")
+            duration_match = re.match(r'([a-zA-Z]+)\s+-\s+block duration:\s*(.*)', line_stripped_newline, re.IGNORECASE)
+            if duration_match:
+                current_ticker = duration_match.group(1).upper()
+                duration_value = duration_match.group(2).strip()
+                if current_ticker not in data:
+                    data[current_ticker] = {}
+                data[current_ticker]['block_duration'] = duration_value
+                continue
+
+            # Match "      block reward: VALUE"
+            reward_match = re.match(r'\s{6}block reward:\s*(.*)', line_stripped_newline, re.IGNORECASE)
+            if reward_match and current_ticker:
+                reward_value = reward_match.group(1).strip()
+                if current_ticker not in data:
+                    data[current_ticker] = {}
+                data[current_ticker]['block_reward'] = reward_value
+                continue
         return data
 
+    def _read_save_file(self):
+        """
+        Returns the raw save file bytes, or None if it does not exist or cannot be read.
+        """
+        if not os.path.exists(self.save_file_path):
+            return None
+        try:
+            with open(self.save_file_path, 'rb') as f:
+                return f.read()
+        except IOError as e:
+            print(f"ERROR: BlockDataPersistenceManager: Failed to read from {self.save_file_path}: {e}")
+            return None
+
+    @property
+    def text_export_enabled(self):
+        return bool(self.config_store.get("block_data_text_export"))
+
+    def _parse_save_file(self, raw):
+        try:
+            return self.parse_block_data_text(raw.decode('utf-8'))
+        except Exception as e:
+            print(f"ERROR: BlockDataPersistenceManager: Error parsing {self.save_file_path}: {e}")
+            return None
+
+    def load_block_data(self):
+        data = self.config_store.get("block_data")
+        raw = self._read_save_file()
+        if data is None:
+            # First run with the structured store: migrate the legacy text file, if any
+            data = (self._parse_save_file(raw) if raw is not None else None) or {}
+            self.config_store.set("block_data", data)
+            self.config_store.flush()
+            if metrics.debug_logging:
+                print(f"DEBUG: BlockDataPersistenceManager: Migrated block data from {self.save_file_path} to {self.config_store.config_path}: {data}")
+        elif raw is not None and self.text_export_enabled and raw != self.format_block_data_text(data).encode('utf-8'):
+            # The export was hand-edited while the calculator was closed; the edit wins
+            edited_data = self._parse_save_file(raw)
+            if edited_data is not None:
+                data = edited_data
+                self.config_store.set("block_data", data)
+                if metrics.debug_logging:
+                    print(f"DEBUG: BlockDataPersistenceManager: Imported offline edits from {self.save_file_path}: {data}")
+        elif metrics.debug_logging:
+            print(f"DEBUG: BlockDataPersistenceManager: Loaded block data from {self.config_store.config_path}: {data}")
+
+        with self._state_lock:
+            self._data = {ticker: dict(block_data) for ticker, block_data in data.items()}
+            self._last_known_digest = hashlib.sha1(raw).hexdigest() if raw is not None else None
+
+        if raw is None and self.text_export_enabled and data:
+            with self._write_lock:
+                self._write_block_data(data)
+        return data
+
+    def reload_if_changed(self):
+        """
+        Re-parses the save file after an external edit. Returns the new data, or None
+        if the file content is the one this manager last loaded or wrote itself
+        (so our own writes never trigger a reload loop).
+        """
+        raw = self._read_save_file()
+        if raw is None:
+            return None
+        digest = hashlib.sha1(raw).hexdigest()
+        with self._state_lock:
+            if digest == self._last_known_digest:
+                return None
+        data = self._parse_save_file(raw)
+        if data is None:
+            return None
+        with self._state_lock:
+            self._last_known_digest = digest
+            # The file is now the source of truth for the tickers it lists; not-yet-written
+            # edits of any other ticker are kept over it and still written by the next flush
+            self._dirty_tickers.difference_update(data.keys())
+            merged = {ticker: dict(block_data) for ticker, block_data in data.items()}
+            for ticker in self._dirty_tickers:
+                if ticker in self._data:
+                    merged[ticker] = dict(self._data[ticker])
+            self._data = merged
+            data = {ticker: dict(block_data) for ticker, block_data in merged.items()}
+        self.config_store.set("block_data", data)
+        if metrics.debug_logging:
+            print(f"DEBUG: BlockDataPersistenceManager: Reloaded externally edited {self.save_file_path}: {data}")
+        return data
+
+    def mark_dirty(self, ticker, block_data):
+        """
+        Records the current block data of one ticker ({} or None removes it) and schedules
+        a debounced background write. Unchanged entries are ignored, so calls made for
+        edits that do not touch block data cost nothing.
+        """
+        new_entry = {key: value for key, value in (block_data or {}).items() if value}
+        with self._state_lock:
+            if self._data.get(ticker, {}) == new_entry:
+                return
+            if new_entry:
+                self._data[ticker] = new_entry
+            else:
+                self._data.pop(ticker, None)
+            self._dirty_tickers.add(ticker)
+
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_debounce_seconds, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """
+        Writes pending changes now, if there are any. Called by the debounce timer,
+        and on exit so no change is lost.
+        """
+        with self._write_lock:
+            with self._state_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty_tickers:
+                    return
+                dirty_tickers = sorted(self._dirty_tickers)
+                self._dirty_tickers.clear()
+                data_snapshot = {ticker: dict(block_data) for ticker, block_data in self._data.items()}
+            if metrics.debug_logging:
+                print(f"DEBUG: BlockDataPersistenceManager: Flushing changes for {dirty_tickers}")
+            self.config_store.set("block_data", data_snapshot)
+            self.config_store.flush()
+            if self.text_export_enabled:
+                self._write_block_data(data_snapshot)
+
     def save_block_data(self, data_to_save):
+        """
+        Synchronously replaces the saved data with data_to_save.
+        """
+        with self._state_lock:
+            self._data = {ticker: dict(block_data) for ticker, block_data in data_to_save.items()}
+            self._dirty_tickers.clear()
+        with self._write_lock:
+            self.config_store.set("block_data", data_to_save)
+            self.config_store.flush()
+            if self.text_export_enabled:
+                self._write_block_data(data_to_save)
+
+    def format_block_data_text(self, data_to_save):
+        """
+        Formats block data into the human-editable save file format.
+        """
+        lines = [self.HEADER_TEXT]
+
+        sorted_tickers = sorted(data_to_save.keys())
+
+        for ticker in sorted_tickers:
+            block_data = data_to_save[ticker]
+
+            duration = block_data.get('block_duration', '')
+            reward = block_data.get('block_reward', '')
+
+            # Only write an entry for the ticker if there's *any* data (duration or reward)
+            if duration or reward:
+                # Always write the "ticker - block duration" line.
+                # If duration is empty, use "--" to maintain a consistent format for loading.
+                display_duration = duration if duration else "--"
+                lines.append(f"{ticker} - block duration: {display_duration}\n")
+
+                if reward:
+                    lines.append(f"      block reward: {reward}\n")
+
+                lines.append("\n") # Add a blank line between crypto entries
+        return "".join(lines)
+
+    def _write_block_data(self, data_to_save):
+        with metrics.span("persist.block_text_write"):
+            self._write_block_data_file(data_to_save)
+
+    def _write_block_data_file(self, data_to_save):
+        # Writes the hand-editable text export.
+        # Written to a temp file in the same directory and renamed over the save file,
+        # so a crash mid-save leaves either the old or the new file, never a half-written one
         self._ensure_config_dir_exists()
+        content = self.format_block_data_text(data_to_save).encode('utf-8')
+        temp_path = None
         try:
-            with open(self.save_file_path, 'w', encoding='utf-8') as f:
-                f.write(self.HEADER_TEXT)
-                
-                sorted_tickers = sorted(data_to_save.keys())
-
-                for ticker in sorted_tickers:
-                    block_data = data_to_save[ticker]
-                    
-                    duration = block_data.get('block_duration', '')
-                    reward = block_data.get('block_reward', '')
-
-                    # Only write an entry for the ticker if there's *any* data (duration or reward)
-                    if duration or reward:
-                        # Always write the "ticker - block duration" line.
-                        # If duration is empty, use "--" to maintain a consistent format for loading.
-                        display_duration = duration if duration else "--"
-                        f.write(f"{ticker} - block duration: {display_duration}\n")
-                        
-                        if reward:
-                            f.write(f"      block reward: {reward}\n")
-                        
-                        f.write("\n") # Add a blank line between crypto entries
-                        
-            print(f"DEBUG: BlockDataPersistenceManager: Saved block data to {self.save_file_path}")
-        except IOError as e:
+            with tempfile.NamedTemporaryFile('wb', dir=self.config_dir, prefix=".blockdata-", suffix=".tmp", delete=False) as f:
+                temp_path = f.name
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            # Remember our own content first, so a file watcher firing on the rename ignores it
+            with self._state_lock:
+                self._last_known_digest = hashlib.sha1(content).hexdigest()
+            os.replace(temp_path, self.save_file_path)
+            temp_path = None
+            if metrics.debug_logging:
+                print(f"DEBUG: BlockDataPersistenceManager: Saved block data to {self.save_file_path}")
+        except (IOError, OSError) as e:
             print(f"ERROR: BlockDataPersistenceManager: Failed to write to {self.save_file_path}: {e}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
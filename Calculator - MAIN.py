@@ -1,10 +1,18 @@
 import sys
 import os
+
+# Imported and enabled before everything else so the other imports are timed too.
+# Run with --profile-startup (or RC_PROFILE_STARTUP=1) for a startup breakdown.
+from StartupProfiler import startup_profiler, call_after_first_paint
+startup_profiler.enable_if_requested(sys.argv)
+from PerfMetrics import metrics
+metrics.configure_from_environment(sys.argv) # --metrics records from startup, --debug-log prints the DEBUG lines
+
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpacerItem, QSizePolicy
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpacerItem, QSizePolicy, QShortcut
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon
+from PyQt5.QtGui import QPixmap, QIcon, QKeySequence
 
 # Get the absolute path of the current script's directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -12,15 +20,25 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Import the custom widgets from their respective files
 from Analyzer import ImageAnalyzerWidget
 from CryptoDisplayWidget import CryptoDisplayWidget
+from IconCache import get_icon_cache
+from MetricsPanel import MetricsPanel
+from StallWatchdog import start_stall_watchdog_if_requested
+from SessionReplay import start_session_recording_if_requested
+
+APP_ICON_NAME = "RCICON.ico" # In CryptoIcon/, served by the shared IconCache
+METRICS_PANEL_SHORTCUT = "Ctrl+Shift+M" # Opens the hidden performance metrics panel
 
 class MainWindow(QWidget):
     """
     The main application window for the Rollercoin Calculator.
     It integrates the ImageAnalyzerWidget and CryptoDisplayWidget
     into a structured layout.
+    data_dir and price_api_base_url are handed to CryptoDisplayWidget (see there).
     """
-    def __init__(self):
+    def __init__(self, data_dir=None, price_api_base_url=None):
         super().__init__()
+        self._data_dir = data_dir
+        self._price_api_base_url = price_api_base_url
         self.setWindowTitle("Rollercoin Calculator")
         self.setFocusPolicy(Qt.NoFocus)
 
@@ -39,22 +57,25 @@ class MainWindow(QWidget):
         self.setFixedSize(initial_width, initial_height)
 
         # 3. Set the icon, but with a slight delay
-        self.icon_path_main_window = os.path.join(SCRIPT_DIR, "CryptoIcon", "RCICON.ico")
         QTimer.singleShot(10, self._set_main_window_icon_delayed)
 
+        self.metrics_panel = None # Created on first use
+        QShortcut(QKeySequence(METRICS_PANEL_SHORTCUT), self, self._toggle_metrics_panel)
+
         self.init_ui()
 
     def _set_main_window_icon_delayed(self):
         """Helper function to set the main window icon after a short delay."""
-        if os.path.exists(self.icon_path_main_window):
-            try:
-                self.setWindowIcon(QIcon(self.icon_path_main_window))
-                self.update()
-            except Exception as e:
-                pass # Suppress print, consider logging to a file in a real application
-        else:
-            pass # Suppress print, consider logging to a file in a real application
+        app_icon = get_icon_cache().icon(APP_ICON_NAME) # Same decoded icon as the application-wide one
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
+            self.update()
+
 
+    def _toggle_metrics_panel(self):
+        if self.metrics_panel is None:
+            self.metrics_panel = MetricsPanel(SCRIPT_DIR, self)
+        self.metrics_panel.toggle()
 
     def init_ui(self):
         """
@@ -70,20 +91,26 @@ class MainWindow(QWidget):
         top_section_layout = QHBoxLayout()
         top_section_layout.setSpacing(15)
 
-        self.image_analyzer_widget = ImageAnalyzerWidget()
+        with startup_profiler.span("ImageAnalyzerWidget"):
+            self.image_analyzer_widget = ImageAnalyzerWidget()
         self.image_analyzer_widget.setFixedHeight(549) # ADDED: Set fixed height for the ImageAnalyzerWidget
         top_section_layout.addWidget(self.image_analyzer_widget)
 
 
-        self.crypto_display_widget = CryptoDisplayWidget(
-            pil_to_pixmap_func=self.image_analyzer_widget.pil_to_pixmap,
-            image_analyzer_widget_instance=self.image_analyzer_widget
-        )
+        with startup_profiler.span("CryptoDisplayWidget"):
+            self.crypto_display_widget = CryptoDisplayWidget(
+                pil_to_pixmap_func=self.image_analyzer_widget.pil_to_pixmap,
+                image_analyzer_widget_instance=self.image_analyzer_widget,
+                data_dir=self._data_dir,
+                price_api_base_url=self._price_api_base_url
+            )
         top_section_layout.addWidget(self.crypto_display_widget)
 
         self.image_analyzer_widget.analysis_completed.connect(self.crypto_display_widget.update_crypto_list)
         self.image_analyzer_widget.value_data_parsed.connect(self.crypto_display_widget.update_from_pasted_data)
         self.image_analyzer_widget.value_data_cleared.connect(self.crypto_display_widget.clear_pasted_data)
+        with startup_profiler.span("restore_saved_settings"):
+            self.crypto_display_widget.restore_saved_settings()
 
 
         main_layout.addLayout(top_section_layout)
@@ -106,6 +133,11 @@ class MainWindow(QWidget):
             }
         """)
 
+    def closeEvent(self, event):
+        # Make sure debounced block data writes hit the disk before the app exits
+        self.crypto_display_widget.shutdown()
+        super().closeEvent(event)
+
 # Helper function to explicitly clear focus from all potential input widgets
 def _clear_all_input_focus(main_window_instance: MainWindow):
     # Clear focus from the user power input box
@@ -129,21 +161,35 @@ def debug_focus_check():
     # print(f"DEBUG: Focus Check: Focused widget: {focused_widget.__class__.__name__ if focused_widget else 'None'}, Active window: {active_window.windowTitle() if active_window else 'None'}")
 
 
+def _on_first_paint(window):
+    # The window is on screen: now load the OCR models (seconds on a CPU) in the background
+    window.image_analyzer_widget.start_ocr_reader_preload()
+    if startup_profiler.enabled:
+        startup_profiler.disable()
+        startup_profiler.report()
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    with startup_profiler.span("QApplication"):
+        app = QApplication(sys.argv)
+
+    # --stall-watchdog (or RC_STALL_WATCHDOG=1) reports GUI event-loop stalls per call site on exit
+    stall_watchdog = start_stall_watchdog_if_requested(app, sys.argv)
+
+    # Icons and the placeholder GIF are decoded on a background thread while the widgets are built
+    get_icon_cache().preload()
 
     # Set Application-Wide Icon
-    app_icon_path = os.path.join(SCRIPT_DIR, "CryptoIcon", "RCICON.ico")
-    if os.path.exists(app_icon_path):
-        try:
-            app.setWindowIcon(QIcon(app_icon_path))
-        except Exception as e:
-            pass # Suppress print, consider logging to a file in a real application
-    else:
-        pass # Suppress print, consider logging to a file in a real application
-
-    window = MainWindow()
-    window.show()
+    app_icon = get_icon_cache().icon(APP_ICON_NAME)
+    if app_icon is not None:
+        app.setWindowIcon(app_icon)
+
+    with startup_profiler.span("MainWindow"):
+        window = MainWindow()
+    call_after_first_paint(window, lambda: _on_first_paint(window))
+    # --record-session FILE logs user input for the headless replay benchmark (SessionReplay.py)
+    session_recorder = start_session_recording_if_requested(app, window, sys.argv)
+    with startup_profiler.span("window.show"):
+        window.show()
 
     # Schedule initial display mode
     QTimer.singleShot(0, lambda: window.image_analyzer_widget._show_data_input())
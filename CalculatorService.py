@@ -0,0 +1,390 @@
+import argparse
+import asyncio
+import base64
+import io
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+
+from rollercoin_core import (
+    KNOWN_TICKERS,
+    CURRENCY_USDT,
+    CURRENCY_EUR,
+    classify_power,
+    coins_for_tier,
+    power_to_ghs,
+    compute_rewards,
+    parse_pasted_text,
+    create_price_source,
+    TIER_NAMES
+)
+
+MAX_REQUEST_BODY_BYTES = 16 * 1024 * 1024 # Screenshots included
+# The service keeps its price cache here, never in the GUI's Calconfig: two processes
+# rewriting the same whole-file config would overwrite each other's settings
+DEFAULT_SERVICE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CalculatorServiceData")
+LATENCY_SAMPLES_PER_ROUTE = 2048          # Recent requests kept per route for percentiles
+UNMATCHED_ROUTE = "<unmatched>"           # Metrics bucket for requests that reach no handler, so random URLs add no routes
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"
+}
+
+class HttpError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+class RequestMetrics:
+    """
+    Request counts, error counts and recent latencies per route.
+    Only touched from the event loop thread, so no locking.
+    """
+    def __init__(self, samples_per_route=LATENCY_SAMPLES_PER_ROUTE):
+        self.samples_per_route = samples_per_route
+        self.started_at = time.time()
+        self._routes = {}
+
+    def record(self, route, status, seconds):
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = {'count': 0, 'errors': 0, 'latencies': deque(maxlen=self.samples_per_route)}
+        stats['count'] += 1
+        if status >= 500:
+            stats['errors'] += 1
+        stats['latencies'].append(seconds)
+
+    @staticmethod
+    def _percentile(sorted_values, percentile):
+        index = min(len(sorted_values) - 1, int(round(percentile / 100.0 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def snapshot(self):
+        routes = {}
+        for route, stats in self._routes.items():
+            latencies = sorted(stats['latencies'])
+            routes[route] = {
+                'count': stats['count'],
+                'errors': stats['errors'],
+                'latency_ms': {
+                    'p50': round(self._percentile(latencies, 50) * 1000, 3),
+                    'p95': round(self._percentile(latencies, 95) * 1000, 3),
+                    'p99': round(self._percentile(latencies, 99) * 1000, 3),
+                    'max': round(latencies[-1] * 1000, 3)
+                } if latencies else None
+            }
+        return {'uptime_seconds': round(time.time() - self.started_at, 1), 'routes': routes}
+
+class CalculatorService:
+    """
+    JSON-over-HTTP front end for the calculator core, built on asyncio streams (standard library only).
+
+    Routes:
+        GET  /health
+        GET  /tier?power=5%20Eh/s        or  POST /tier    {"power": "5 Eh/s"}
+        POST /rewards  {"user_power": "5 Eh/s", "tier": optional, "currency": optional "USDT"/"EUR",
+                        "coins": {"BTC": {"rate": "700", "unit": "Eh/s", "block_reward": "0.0001", "block_duration": "10m 0s"}}}
+        POST /parse    {"text": "<pasted network power page>"}
+        POST /ocr      raw image bytes, or {"image_base64": "..."}   (only when started with OCR enabled)
+        GET  /metrics
+
+    One CryptoSlider is shared by all requests, so fiat conversions read one price cache.
+    OCR jobs go through a bounded queue served by a single warm model; a full queue answers 503.
+    """
+    def __init__(self, host="127.0.0.1", port=8080, base_dir=None, enable_ocr=False, ocr_queue_size=8,
+                 price_source=None, price_wait_seconds=5):
+        self.host = host
+        self.port = port
+        self.base_dir = base_dir
+        self.enable_ocr = enable_ocr
+        self.ocr_queue_size = ocr_queue_size
+        self.price_wait_seconds = price_wait_seconds
+        self.metrics = RequestMetrics()
+        self.price_source = price_source
+        self._server = None
+        self._ocr_reader = None
+        self._ocr_queue = None
+        self._ocr_worker_task = None
+        # PaddleOCR is not thread safe; one dedicated thread runs every OCR job
+        self._ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr") if enable_ocr else None
+        self._routes = {
+            ("GET", "/health"): self._handle_health,
+            ("GET", "/tier"): self._handle_tier,
+            ("POST", "/tier"): self._handle_tier,
+            ("POST", "/rewards"): self._handle_rewards,
+            ("POST", "/parse"): self._handle_parse,
+            ("POST", "/ocr"): self._handle_ocr,
+            ("GET", "/metrics"): self._handle_metrics
+        }
+
+    # --- Lifecycle ---
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        if self.price_source is None:
+            self.price_source = create_price_source(base_dir=self.base_dir)
+        if self.enable_ocr:
+            from rollercoin_core.ocr import create_ocr_reader
+            print("DEBUG: CalculatorService: Loading OCR model...")
+            # Loaded once up front and kept warm; requests never pay the model load
+            self._ocr_reader = await loop.run_in_executor(self._ocr_executor, create_ocr_reader)
+            self._ocr_queue = asyncio.Queue(maxsize=self.ocr_queue_size)
+            self._ocr_worker_task = asyncio.create_task(self._ocr_worker())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"DEBUG: CalculatorService: Listening on http://{self.host}:{self.port}")
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._ocr_worker_task is not None:
+            self._ocr_worker_task.cancel()
+        if self._ocr_executor is not None:
+            self._ocr_executor.shutdown(wait=False)
+        if self.price_source is not None:
+            self.price_source.shutdown()
+
+    # --- HTTP plumbing ---
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                started = time.perf_counter()
+                route = UNMATCHED_ROUTE
+                keep_alive = True
+                try:
+                    method, target, version = request_line.decode('latin-1').strip().split(" ", 2)
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode('latin-1').partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    keep_alive = headers.get('connection', '').lower() != 'close' and version == "HTTP/1.1"
+
+                    content_length = int(headers.get('content-length', 0) or 0)
+                    if content_length > MAX_REQUEST_BODY_BYTES:
+                        keep_alive = False # The unread body must never be parsed as the next request
+                        raise HttpError(413, f"Body larger than {MAX_REQUEST_BODY_BYTES} bytes")
+                    body = await reader.readexactly(content_length) if content_length else b""
+
+                    parsed = urlparse(target)
+                    handler = self._routes.get((method, parsed.path))
+                    if handler is None:
+                        if any(path == parsed.path for _, path in self._routes):
+                            raise HttpError(405, f"{method} not allowed on {parsed.path}")
+                        raise HttpError(404, f"No route {parsed.path}")
+                    route = parsed.path
+                    status, payload, extra_headers = 200, await handler(parse_qs(parsed.query), headers, body), {}
+                except HttpError as e:
+                    status, payload, extra_headers = e.status, {'error': e.message}, e.headers
+                except (ValueError, asyncio.IncompleteReadError) as e:
+                    status, payload, extra_headers, keep_alive = 400, {'error': f"Malformed request: {e}"}, {}, False
+                except Exception as e:
+                    print(f"ERROR: CalculatorService: {route} failed: {e}")
+                    status, payload, extra_headers = 500, {'error': str(e)}, {}
+
+                response_body = json.dumps(payload).encode('utf-8')
+                head = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+                        "Content-Type: application/json",
+                        f"Content-Length: {len(response_body)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head += [f"{name}: {value}" for name, value in extra_headers.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + response_body)
+                await writer.drain()
+                self.metrics.record(route, status, time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _json_body(body):
+        if not body:
+            return {}
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            raise HttpError(400, f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise HttpError(400, "JSON body must be an object")
+        return data
+
+    # --- Handlers ---
+
+    async def _handle_health(self, query, headers, body):
+        return {'status': 'ok', 'ocr': self._ocr_reader is not None}
+
+    async def _handle_tier(self, query, headers, body):
+        power = query.get('power', [None])[0] if query else None
+        if power is None:
+            power = self._json_body(body).get('power')
+        if not power:
+            raise HttpError(400, "Missing 'power'")
+        tier = classify_power(str(power))
+        return {'power': power, 'power_ghs': power_to_ghs(str(power)), 'tier': tier, 'coins': coins_for_tier(tier)}
+
+    async def _fiat_rates(self, currency):
+        """
+        Rates from the shared price cache; refreshes them first (bounded wait) only if some are stale.
+        """
+        if currency not in (CURRENCY_USDT, CURRENCY_EUR):
+            raise HttpError(400, f"Unsupported currency '{currency}' (use USDT or EUR)")
+        source = self.price_source
+        if source.get_stale_symbols(currency):
+            fetch = source.fetch_euro_conversion_rates if currency == CURRENCY_EUR else source.fetch_usdt_conversion_rates
+            done = fetch() # Concurrent requests coalesce into the one scheduler fetch
+            await asyncio.get_running_loop().run_in_executor(None, done.wait, self.price_wait_seconds)
+        return source.get_euro_rates() if currency == CURRENCY_EUR else source.get_usdt_rates()
+
+    async def _handle_rewards(self, query, headers, body):
+        data = self._json_body(body)
+        user_power = str(data.get('user_power', ''))
+        coins = data.get('coins')
+        if not user_power or not isinstance(coins, dict):
+            raise HttpError(400, "Expected 'user_power' and a 'coins' object")
+        tier = data.get('tier') or classify_power(user_power)
+        if tier not in TIER_NAMES:
+            raise HttpError(400, f"Unknown tier '{tier}'")
+        active_coins = coins_for_tier(tier)
+
+        results = {}
+        for ticker, row in coins.items():
+            if not isinstance(row, dict):
+                raise HttpError(400, f"Coin '{ticker}' must be an object")
+            results[ticker] = compute_rewards(
+                user_power, str(row.get('rate', '')), row.get('unit', 'Gh/s'),
+                str(row.get('block_reward', '--')), str(row.get('block_duration', '--'))
+            )
+            results[ticker]['in_tier'] = ticker in active_coins
+
+        response = {'tier': tier, 'rewards': results}
+        currency = data.get('currency')
+        if currency:
+            rates = await self._fiat_rates(currency)
+            ages = self.price_source.get_price_ages(currency)
+            response['currency'] = currency
+            response['fiat_rewards'] = {
+                ticker: {key: value * rates.get(ticker, 0.0) for key, value in rewards.items() if key != 'in_tier'}
+                for ticker, rewards in results.items()
+            }
+            response['price_age_seconds'] = {ticker: ages.get(ticker) for ticker in results}
+        return response
+
+    async def _handle_parse(self, query, headers, body):
+        data = self._json_body(body)
+        text = data.get('text')
+        if not isinstance(text, str):
+            raise HttpError(400, "Expected 'text'")
+        tickers = data.get('known_tickers') or KNOWN_TICKERS
+        if not isinstance(tickers, list) or not all(isinstance(ticker, str) for ticker in tickers):
+            raise HttpError(400, "'known_tickers' must be a list of strings")
+        return {'parsed': parse_pasted_text(text, [ticker.upper() for ticker in tickers])}
+
+    async def _handle_ocr(self, query, headers, body):
+        if self._ocr_queue is None:
+            raise HttpError(404, "OCR is not enabled on this service")
+        if headers.get('content-type', '').startswith('application/json'):
+            encoded = self._json_body(body).get('image_base64')
+            if not encoded:
+                raise HttpError(400, "Expected 'image_base64'")
+            try:
+                image_bytes = base64.b64decode(encoded)
+            except ValueError as e:
+                raise HttpError(400, f"Invalid base64: {e}")
+        else:
+            image_bytes = body
+        if not image_bytes:
+            raise HttpError(400, "Empty image")
+
+        job = asyncio.get_running_loop().create_future()
+        try:
+            self._ocr_queue.put_nowait((image_bytes, job))
+        except asyncio.QueueFull:
+            raise HttpError(503, "OCR queue is full, retry later", {'Retry-After': "2"})
+        return {'detected': await job}
+
+    async def _ocr_worker(self):
+        from rollercoin_core.ocr import recognize
+        from PIL import Image
+        loop = asyncio.get_running_loop()
+
+        def run_job(image_bytes):
+            image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+            return recognize(self._ocr_reader, image)
+
+        while True:
+            image_bytes, job = await self._ocr_queue.get()
+            try:
+                detected = await loop.run_in_executor(self._ocr_executor, run_job, image_bytes)
+                if not job.done():
+                    job.set_result(detected)
+            except Exception as e:
+                if not job.done():
+                    job.set_exception(HttpError(400, f"OCR failed: {e}"))
+            finally:
+                self._ocr_queue.task_done()
+
+    async def _handle_metrics(self, query, headers, body):
+        metrics = self.metrics.snapshot()
+        metrics['ocr_queue'] = {
+            'depth': self._ocr_queue.qsize(), 'capacity': self.ocr_queue_size
+        } if self._ocr_queue is not None else None
+        if self.price_source is not None:
+            metrics['price_cache_age_seconds'] = {
+                currency: self.price_source.get_price_ages(currency) for currency in (CURRENCY_USDT, CURRENCY_EUR)
+            }
+            metrics['price_refresh_breaker'] = self.price_source.scheduler.breaker_state
+        return metrics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RollerCoin calculator HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--ocr", action="store_true", help="Load PaddleOCR and enable POST /ocr")
+    parser.add_argument("--ocr-queue-size", type=int, default=8)
+    parser.add_argument("--stand-in", action="store_true", help="Serve prices from the local PriceApiStandIn")
+    parser.add_argument("--data-dir", default=DEFAULT_SERVICE_DATA_DIR,
+                        help="Where the service keeps its price cache (not the GUI's folder, whose config it would overwrite)")
+    args = parser.parse_args()
+
+    async def main():
+        price_source = None
+        stand_in = None
+        base_dir = args.data_dir
+        if args.stand_in:
+            from PriceApiStandIn import PriceApiStandIn
+            stand_in = PriceApiStandIn().start()
+            price_source = create_price_source(base_url=stand_in.base_url)
+        service = CalculatorService(args.host, args.port, base_dir=base_dir, enable_ocr=args.ocr,
+                                    ocr_queue_size=args.ocr_queue_size, price_source=price_source)
+        await service.start()
+        try:
+            await service.serve_forever()
+        finally:
+            await service.stop()
+            if stand_in is not None:
+                stand_in.stop()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,72 @@
+import heapq
+import itertools
+
+class CoinRanking:
+    """
+    Keeps coins ordered by a score (e.g. daily reward in USDT) with O(log n) updates.
+
+    Backed by a max-heap with lazy deletion: update() pushes a new entry and marks the
+    coin's previous entry stale instead of re-sorting; stale entries are dropped when
+    they reach the top, and the heap is compacted once they outnumber live ones.
+    """
+    def __init__(self):
+        self._heap = []    # (-score, sequence, coin)
+        self._entries = {} # coin -> the live heap entry
+        self._sequence = itertools.count() # Tie-breaker: earlier updates rank first among equal scores
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, coin):
+        return coin in self._entries
+
+    def score(self, coin):
+        entry = self._entries.get(coin)
+        return -entry[0] if entry is not None else None
+
+    def update(self, coin, score):
+        """
+        Sets a coin's score. Re-pushes only if the score actually changed.
+        """
+        entry = self._entries.get(coin)
+        if entry is not None and -entry[0] == score:
+            return
+        new_entry = (-score, next(self._sequence), coin)
+        self._entries[coin] = new_entry
+        heapq.heappush(self._heap, new_entry)
+        self._compact_if_needed()
+
+    def remove(self, coin):
+        if self._entries.pop(coin, None) is not None:
+            self._compact_if_needed()
+
+    def _is_live(self, entry):
+        return self._entries.get(entry[2]) is entry
+
+    def _compact_if_needed(self):
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def top(self, n=2):
+        """
+        Returns [(coin, score), ...] for the n best coins, best first.
+        Only the n winners are popped and pushed back; the rest of the heap is not touched.
+        """
+        winners = []
+        while self._heap and len(winners) < n:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                winners.append(entry)
+        for entry in winners:
+            heapq.heappush(self._heap, entry)
+        return [(entry[2], -entry[0]) for entry in winners]
+
+if __name__ == "__main__":
+    ranking = CoinRanking()
+    for coin, score in {"BTC": 1.2, "DOGE": 0.8, "LTC": 1.5, "RLT": 0.3}.items():
+        ranking.update(coin, score)
+    print(ranking.top())  # LTC, BTC
+    ranking.update("DOGE", 2.0)
+    ranking.remove("LTC")
+    print(ranking.top(3)) # DOGE, BTC, RLT
@@ -0,0 +1,133 @@
+import os
+import copy
+import json
+import atexit
+import tempfile
+import threading
+
+from PerfMetrics import metrics
+
+class ConfigStore:
+    """
+    Versioned JSON store for everything the calculator remembers between runs:
+    block rewards/durations, last user power, tier override, currency mode and
+    the price cache. The whole file is loaded with a single read and written
+    atomically (temp file + rename) on a debounce timer in the background.
+    """
+    CONFIG_FILE_NAME = "calculator_config.json"
+    CONFIG_VERSION = 1
+
+    DEFAULT_VALUES = {
+        "block_data": None,               # {TICKER: {'block_duration': ..., 'block_reward': ...}}; None until first saved/migrated
+        "block_data_text_export": True,   # Also write the hand-editable text file
+        "last_user_power": "",
+        "tier_override": None,            # Tier name when the user picked it manually, else None
+        "currency_mode": "Crypto",
+        "price_cache": None               # {"USDT": {...}, "EUR": {...}}; None until first fetch/migration
+    }
+
+    # Upgrade steps keyed by the version they upgrade *from*; each takes and returns the raw dict
+    MIGRATIONS = {}
+
+    DEFAULT_SAVE_DEBOUNCE_SECONDS = 1.0
+
+    def __init__(self, base_dir, save_debounce_seconds=DEFAULT_SAVE_DEBOUNCE_SECONDS):
+        self.config_dir = os.path.join(base_dir, "Calconfig")
+        self.config_path = os.path.join(self.config_dir, self.CONFIG_FILE_NAME)
+        self.save_debounce_seconds = save_debounce_seconds
+
+        self._values = copy.deepcopy(self.DEFAULT_VALUES)
+        self._dirty = False
+        self._save_timer = None
+        self._state_lock = threading.RLock()
+        self._write_lock = threading.Lock() # Serializes background and exit-time writes
+        self.loaded_from_disk = False
+        atexit.register(self.flush)
+
+    def load(self):
+        """
+        Reads the whole store in one go, upgrading older versions. Missing keys keep their defaults.
+        """
+        if not os.path.exists(self.config_path):
+            if metrics.debug_logging:
+                print(f"DEBUG: ConfigStore: No config at {self.config_path}, starting from defaults.")
+            return self
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            version = raw.get("version", 0)
+            while version < self.CONFIG_VERSION and version in self.MIGRATIONS:
+                raw = self.MIGRATIONS[version](raw)
+                version += 1
+                raw["version"] = version
+            if version != self.CONFIG_VERSION:
+                print(f"ERROR: ConfigStore: Unsupported config version {version} in {self.config_path}, using defaults.")
+                return self
+            with self._state_lock:
+                for key in self.DEFAULT_VALUES:
+                    if key in raw:
+                        self._values[key] = raw[key]
+                self.loaded_from_disk = True
+            if metrics.debug_logging:
+                print(f"DEBUG: ConfigStore: Loaded config version {version} from {self.config_path}")
+        except (IOError, ValueError, AttributeError) as e:
+            print(f"ERROR: ConfigStore: Could not read {self.config_path}: {e}")
+        return self
+
+    def get(self, key):
+        with self._state_lock:
+            return copy.deepcopy(self._values.get(key, self.DEFAULT_VALUES.get(key)))
+
+    def set(self, key, value):
+        """
+        Updates one value and schedules a debounced background write. Setting an
+        unchanged value does nothing.
+        """
+        if key not in self.DEFAULT_VALUES:
+            raise KeyError(f"Unknown config key '{key}'")
+        with self._state_lock:
+            if self._values.get(key) == value:
+                return
+            self._values[key] = copy.deepcopy(value)
+            self._dirty = True
+
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_debounce_seconds, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """
+        Writes pending changes now, if there are any.
+        """
+        with self._write_lock:
+            with self._state_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = dict(copy.deepcopy(self._values), version=self.CONFIG_VERSION)
+            with metrics.span("persist.config_write"):
+                self._write(snapshot)
+
+    def _write(self, snapshot):
+        temp_path = None
+        try:
+            os.makedirs(self.config_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.config_dir, prefix=".config-", suffix=".tmp", delete=False) as f:
+                temp_path = f.name
+                json.dump(snapshot, f, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_path)
+            temp_path = None
+            if metrics.debug_logging:
+                print(f"DEBUG: ConfigStore: Saved config to {self.config_path}")
+        except (IOError, OSError, TypeError) as e:
+            print(f"ERROR: ConfigStore: Failed to write {self.config_path}: {e}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -1,20 +1,13 @@
 import os
-import re
 import traceback
 from PyQt5.QtWidgets import (
-    QWidget, QLabel, QLineEdit, QHBoxLayout, QVBoxLayout, QGridLayout, QSizePolicy, QApplication, QComboBox
+    QWidget, QLabel, QHBoxLayout, QVBoxLayout, QSizePolicy, QComboBox, QTableView, QAbstractItemView,
+    QPushButton
 )
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from PyQt5.QtCore import Qt, pyqtSignal, QFileSystemWatcher, QTimer, QSize
 
 from reward_calculations import (
-    calculate_reward_per_block,
-    calculate_blocks_per_day,
-    calculate_reward_per_day,
-    calculate_reward_per_week,
-    calculate_reward_per_month,
-    calculate_reward_per_year
+    parse_duration_to_seconds
 )
 
 from Leagues_Info import (
@@ -25,16 +18,46 @@ from Leagues_Info import (
     determine_tier_from_power
 )
 
-from Crypto_Slider import CryptoSlider
+from Crypto_Slider import CryptoSlider, CURRENCY_USDT, CURRENCY_EUR, BINANCE_BASE_URL
 from BlockDurationRewardSave import BlockDataPersistenceManager
-
-class ClearOnFocusLineEdit(QLineEdit):
-    def focusInEvent(self, event):
-        self.selectAll()
-        super().focusInEvent(event)
+from ConfigStore import ConfigStore
+from rollercoin_core.compute import compute_rewards
+from rollercoin_core.portfolio import network_snapshot_entry
+from SnapshotHistory import SnapshotHistory, SNAPSHOT_SOURCE_OCR, SNAPSHOT_SOURCE_PASTE, SNAPSHOT_SOURCE_MANUAL
+from RollingAnalytics import RollingAnalytics, ROLLING_WINDOWS
+from CoinRanking import CoinRanking
+from RewardProjection import fit_network_growth, project_rewards, PROJECTION_HORIZON_DAYS, MAX_EXTRAPOLATION, CONFIDENCE_Z
+from IconCache import get_icon_cache
+from PerfMetrics import metrics
+from CryptoTableModel import (
+    CryptoTableModel, TierFilterProxyModel, CellLineEditDelegate,
+    CRYPTO_TABLE_COLUMNS, LOGO_ICON_SIZE
+)
 
 class CryptoDisplayWidget(QWidget):
-    def __init__(self, pil_to_pixmap_func, image_analyzer_widget_instance):
+    # Emitted (from the CryptoSlider fetch thread, delivered queued on the GUI thread)
+    # with {"USDT": {...}} and/or {"EUR": {...}} whenever a price fetch completes
+    conversion_rates_fetched = pyqtSignal(dict)
+    # Emitted (from the history writer thread, delivered queued) with the coins whose rolling stats changed
+    rolling_stats_updated = pyqtSignal(list)
+
+    # Maps CryptoSlider currency keys to the currency combo / conversion_rates keys
+    SLIDER_CURRENCY_TO_DISPLAY_MODE = {CURRENCY_USDT: "USDT", CURRENCY_EUR: "Euro"}
+    DISPLAY_MODE_TO_SLIDER_CURRENCY = {"USDT": CURRENCY_USDT, "Euro": CURRENCY_EUR}
+
+    STALE_PRICE_COLOR = "#faa61a"
+    BEST_COIN_COLOR = "#43b581"
+
+    # Recalculations within this window (e.g. one per keystroke) are recorded as one history snapshot
+    SNAPSHOT_DEBOUNCE_MS = 1000
+
+    OUTPUT_CELL_KEYS = ('reward_per_block_output', 'daily_reward_output', 'weekly_reward_output1', 'monthly_reward_output', 'yearly_reward_output')
+
+    def __init__(self, pil_to_pixmap_func, image_analyzer_widget_instance, data_dir=None, price_api_base_url=None):
+        """
+        data_dir holds Calconfig/ (the script's directory by default); price_api_base_url
+        replaces the Binance API, e.g. with a PriceApiStandIn for benchmarks.
+        """
         super().__init__()
         self.pil_to_pixmap = pil_to_pixmap_func
         self.image_analyzer_widget = image_analyzer_widget_instance
@@ -58,9 +81,18 @@ class CryptoDisplayWidget(QWidget):
             "POL": "--", "XRP": "--", "DOGE": "--", "ETH": "--", "TRX": "--", "SOL": "--"
         }
 
-        self.crypto_widgets = {}
+        script_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
+        # Everything remembered between runs is read from one versioned store, in a single read
+        self.config_store = ConfigStore(script_dir).load()
+
+        self.crypto_slider = CryptoSlider(base_url=price_api_base_url or BINANCE_BASE_URL, base_dir=script_dir, config_store=self.config_store)
+        self.conversion_rates_fetched.connect(self._on_conversion_rates_fetched)
+        self.crypto_slider.add_rates_listener(self.conversion_rates_fetched.emit)
+        self._stale_price_flags = {} # crypto -> whether its fiat outputs are currently flagged as stale
 
-        self.crypto_slider = CryptoSlider()
+        # Active coins ranked by daily reward value, one ranking per fiat currency; updated per row
+        self.coin_rankings = {"USDT": CoinRanking(), "Euro": CoinRanking()}
+        self._highlighted_best_coin = None
 
         self.conversion_rates = {
             "USDT": {
@@ -90,6 +122,9 @@ class CryptoDisplayWidget(QWidget):
                 "LTC": 65.0
             }
         }
+        # Last known prices from the on-disk cache replace the hardcoded guesses above
+        self.conversion_rates["USDT"].update(self.crypto_slider.get_usdt_rates())
+        self.conversion_rates["Euro"].update(self.crypto_slider.get_euro_rates())
         self._original_reward_values = {crypto: {
             'reward_per_block': 0.0,
             'daily_reward': 0.0,
@@ -101,11 +136,44 @@ class CryptoDisplayWidget(QWidget):
             "BTC", "ETH", "BNB", "POL", "SOL", "LTC"
         ]}
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.block_data_manager = BlockDataPersistenceManager(script_dir)
+        self.block_data_manager = BlockDataPersistenceManager(script_dir, config_store=self.config_store)
         self._user_overridden_block_data = self.block_data_manager.load_block_data()
 
+        # Network power / reward history; writes happen on the history's own thread
+        self.snapshot_history = SnapshotHistory(script_dir)
+        self._pending_snapshot_source = None
+        self._snapshot_network_inputs = {} # crypto -> (rate, unit, block reward, block duration) last seen
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(self.SNAPSHOT_DEBOUNCE_MS)
+        self._snapshot_timer.timeout.connect(self._record_snapshot)
+
+        # Rolling stats are seeded once from the history, then updated per committed snapshot
+        self.rolling_analytics = RollingAnalytics()
+        self.rolling_analytics.seed_from_history(self.snapshot_history, self.block_rewards_defaults.keys())
+        # Weekly/monthly/yearly rewards follow each coin's fitted network-power growth
+        self._network_growth = {}   # crypto -> (growth per day, stderr, fit span in days) in _growth_fit_tier
+        self._growth_fit_tier = None
+        self._projection_bands = {} # crypto -> {'weekly_reward': (low, high), ...} in crypto units
+        self._refit_network_growth()
+        self.rolling_stats_updated.connect(self._on_rolling_stats_updated)
+        self.snapshot_history.add_listener(
+            lambda snapshot: self.rolling_stats_updated.emit(self.rolling_analytics.add_snapshot(snapshot))
+        )
+
+        # Edits, pastes and tier/currency changes only mark rows dirty; one pass per event-loop
+        # iteration then recomputes (or just re-renders) each dirty row once
+        self._dirty_reward_cryptos = set()
+        self._dirty_display_cryptos = set()
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(0)
+        self._recalc_timer.timeout.connect(self._flush_recalculations)
+
         self.init_ui()
+        self._init_block_data_file_watcher()
+        for crypto_symbol in self.crypto_list:
+            self._apply_rolling_stats_tooltips(crypto_symbol)
 
 
     def init_ui(self):
@@ -113,12 +181,6 @@ class CryptoDisplayWidget(QWidget):
         overall_v_layout.setContentsMargins(10, 10, 10, 10)
         overall_v_layout.setSpacing(10)
 
-        main_grid_layout = QGridLayout()
-        main_grid_layout.setContentsMargins(0, 0, 0, 0)
-        main_grid_layout.setSpacing(5)
-
-        main_grid_layout.addWidget(QLabel(""), 0, 0)
-
         self.currency_combo = QComboBox()
         self.currency_combo.addItems(["Crypto", "USDT", "Euro"])
         self.currency_combo.setFixedSize(70, 25)
@@ -146,186 +208,250 @@ class CryptoDisplayWidget(QWidget):
         """)
         self.currency_combo.view().setTextElideMode(Qt.ElideNone)
         self.currency_combo.currentIndexChanged.connect(self._on_currency_combo_changed)
-        main_grid_layout.addWidget(self.currency_combo, 0, 1, Qt.AlignCenter)
-
-        network_power_header_label = QLabel("Network\n power")
-        network_power_header_label.setAlignment(Qt.AlignCenter)
-        network_power_header_label.setStyleSheet("font-weight: bold; padding-bottom: 5px;")
-        main_grid_layout.addWidget(network_power_header_label, 0, 2, Qt.AlignCenter)
-
-        header_labels = [
-            "Block\n Duration", "Block\n reward",
-            "Reward\n Per Block",
-            "Daily\n reward", "Weekly\n reward", "Monthly\n reward", "Yearly\n reward"
-        ]
-        for col_idx, header_text in enumerate(header_labels):
-            header_label = QLabel(header_text)
-            header_label.setAlignment(Qt.AlignCenter)
-            header_label.setStyleSheet("font-weight: bold; padding-bottom: 5px;")
-            main_grid_layout.addWidget(header_label, 0, col_idx + 3)
-
-
-        icon_width = 30
-        ticker_column_width = 70
-        data_column_width = 120
-
-        rate_unit_spacing = 5
-        rate_width = 70
-        unit_width = data_column_width - rate_width - rate_unit_spacing
+        currency_h_layout = QHBoxLayout()
+        currency_h_layout.setContentsMargins(0, 0, 0, 0)
+        currency_h_layout.addWidget(self.currency_combo)
+        currency_h_layout.addStretch(1)
+        self.portfolio_window = None # Created on first use
+        self.portfolio_btn = QPushButton("Portfolio")
+        self.portfolio_btn.setFixedHeight(25)
+        self.portfolio_btn.setToolTip("Rewards of many accounts against the network data in this table")
+        self.portfolio_btn.setStyleSheet("""
+            QPushButton { background-color: #2f3136; border: 1px solid #40444b; border-radius: 3px; padding: 0 8px; color: white; }
+            QPushButton:hover { background-color: #40444b; }
+        """)
+        self.portfolio_btn.clicked.connect(self._open_portfolio_window)
+        currency_h_layout.addWidget(self.portfolio_btn)
+        overall_v_layout.addLayout(currency_h_layout)
 
         self.crypto_list = [
             "RLT", "RST", "XRP", "TRX", "DOGE",
             "BTC", "ETH", "BNB", "POL", "SOL", "LTC"
         ]
 
-        for row_idx, crypto in enumerate(self.crypto_list):
-            current_grid_row = row_idx + 1
-            self.crypto_widgets[crypto] = {}
-
-            logo = QLabel()
-            logo.setFixedSize(icon_width, icon_width)
-            logo.setStyleSheet("border: none; padding: 2px;")
-            logo.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(logo, current_grid_row, 0, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['logo'] = logo
-
-            ticker = QLineEdit()
-            ticker.setFixedSize(ticker_column_width, 25)
-            ticker.setText(crypto)
-            ticker.setReadOnly(True)
-            ticker.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(ticker, current_grid_row, 1, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['ticker'] = ticker
-
-            network_power_h_layout = QHBoxLayout()
-            network_power_h_layout.setSpacing(rate_unit_spacing)
-            network_power_h_layout.setContentsMargins(0,0,0,0)
-
-            rate = ClearOnFocusLineEdit()
-            rate.blockSignals(True)
-            rate.setFixedSize(rate_width, 25)
-            rate.setPlaceholderText("Rate")
-            rate.setReadOnly(False)
-            rate.setAlignment(Qt.AlignCenter)
-            network_power_h_layout.addWidget(rate)
-            self.crypto_widgets[crypto]['rate'] = rate
-            rate.blockSignals(False)
-            rate.textChanged.connect(lambda text, c=crypto: self._recalculate_row_rewards(c))
-
-
-            unit = QLineEdit()
-            unit.blockSignals(True)
-            unit.setFixedSize(unit_width, 25)
-            unit.setReadOnly(False)
-            unit.setAlignment(Qt.AlignCenter)
-            unit.setText("")
-            network_power_h_layout.addWidget(unit)
-            self.crypto_widgets[crypto]['unit'] = unit
-            unit.blockSignals(False)
-            unit.textChanged.connect(lambda text, c=crypto: self._recalculate_row_rewards(c))
-
-            network_power_wrapper = QWidget()
-            network_power_wrapper.setLayout(network_power_h_layout)
-            network_power_wrapper.setFixedSize(data_column_width, 25)
-            main_grid_layout.addWidget(network_power_wrapper, current_grid_row, 2, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['network_power_wrapper'] = network_power_wrapper
-
-
-            block_duration_input = ClearOnFocusLineEdit()
-            block_duration_input.blockSignals(True)
-            block_duration_input.setFixedSize(80, 25)
-            block_duration_input.setReadOnly(False)
-            block_duration_input.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(block_duration_input, current_grid_row, 3, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['block_duration_input'] = block_duration_input
-            block_duration_input.blockSignals(False)
-            block_duration_input.textChanged.connect(lambda text, c=crypto: self._recalculate_row_rewards(c))
-
-
-            block_reward_output = ClearOnFocusLineEdit()
-            block_reward_output.blockSignals(True)
-            block_reward_output.setFixedSize(75, 25)
-            block_reward_output.setReadOnly(False)
-            block_reward_output.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(block_reward_output, current_grid_row, 4, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['block_reward_output'] = block_reward_output
-            block_reward_output.blockSignals(False)
-            block_reward_output.textChanged.connect(lambda text, c=crypto: self._recalculate_row_rewards(c))
-
-
-            reward_per_block_output = QLineEdit()
-            reward_per_block_output.setFixedSize(100, 25)
-            reward_per_block_output.setText("00")
-            reward_per_block_output.setReadOnly(True)
-            reward_per_block_output.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(reward_per_block_output, current_grid_row, 5, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['reward_per_block_output'] = reward_per_block_output
-
-
-            daily_reward_output = QLineEdit()
-            daily_reward_output.setFixedSize(100, 25)
-            daily_reward_output.setText("00")
-            daily_reward_output.setReadOnly(True)
-            daily_reward_output.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(daily_reward_output, current_grid_row, 6, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['daily_reward_output'] = daily_reward_output
-
-            weekly_reward_output1 = QLineEdit()
-            weekly_reward_output1.setFixedSize(100, 25)
-            weekly_reward_output1.setText("00")
-            weekly_reward_output1.setReadOnly(True)
-            weekly_reward_output1.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(weekly_reward_output1, current_grid_row, 7, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['weekly_reward_output1'] = weekly_reward_output1
-
-            monthly_reward_output = QLineEdit()
-            monthly_reward_output.setFixedSize(100, 25)
-            monthly_reward_output.setText("00")
-            monthly_reward_output.setReadOnly(True)
-            monthly_reward_output.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(monthly_reward_output, current_grid_row, 8, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['monthly_reward_output'] = monthly_reward_output
-
-            yearly_reward_output = QLineEdit()
-            yearly_reward_output.setFixedSize(100, 25)
-            yearly_reward_output.setText("00")
-            yearly_reward_output.setReadOnly(True)
-            yearly_reward_output.setAlignment(Qt.AlignCenter)
-            main_grid_layout.addWidget(yearly_reward_output, current_grid_row, 9, Qt.AlignCenter)
-            self.crypto_widgets[crypto]['yearly_reward_output'] = yearly_reward_output
-
-        main_grid_layout.setRowStretch(len(self.crypto_list) + 1, 1)
-        main_grid_layout.setColumnStretch(0, 0)
-        main_grid_layout.setColumnStretch(1, 0)
-        main_grid_layout.setColumnStretch(2, 0)
-        main_grid_layout.setColumnStretch(3, 0)
-        main_grid_layout.setColumnStretch(4, 0)
-        main_grid_layout.setColumnStretch(9, 1)
-
-        overall_v_layout.addLayout(main_grid_layout)
+        # One model row per coin; the proxy hides the coins outside the selected tier
+        self.table_model = CryptoTableModel(self.crypto_list, self)
+        self.table_model.cell_edited.connect(lambda crypto, key: self._schedule_recalculation(crypto))
+        self.tier_proxy = TierFilterProxyModel(self)
+        self.tier_proxy.setSourceModel(self.table_model)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.tier_proxy)
+        self.table_view.setItemDelegate(CellLineEditDelegate(self.table_view))
+        self.table_view.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.table_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_view.setIconSize(QSize(LOGO_ICON_SIZE, LOGO_ICON_SIZE))
+        self.table_view.setShowGrid(False)
+        self.table_view.setWordWrap(False)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(30)
+        horizontal_header = self.table_view.horizontalHeader()
+        horizontal_header.setHighlightSections(False)
+        for col_idx, (_, _, width) in enumerate(CRYPTO_TABLE_COLUMNS):
+            horizontal_header.resizeSection(col_idx, width)
+        horizontal_header.setStretchLastSection(True)
+        self.table_view.setStyleSheet("""
+            QTableView {
+                background-color: #202225;
+                border: none;
+            }
+            QTableView::item {
+                border: 1px solid #40444b;
+                border-radius: 3px;
+                background-color: #2f3136;
+            }
+            QHeaderView::section {
+                background-color: #202225;
+                border: none;
+                padding-bottom: 5px;
+            }
+        """)
+        self.table_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        overall_v_layout.addWidget(self.table_view)
+
+        self.best_coin_label = QLabel("")
+        self.best_coin_label.setAlignment(Qt.AlignCenter)
+        self.best_coin_label.setStyleSheet("font-weight: bold;")
+        overall_v_layout.addWidget(self.best_coin_label)
 
         self._load_all_crypto_icons()
         self._update_crypto_row_visibility()
 
         self.setFocusPolicy(Qt.StrongFocus)
 
+    def _init_block_data_file_watcher(self):
+        """
+        Watches the block data save file so hand edits are picked up while the app runs.
+        The directory is watched too: atomic saves replace the file, which drops it from the watcher.
+        """
+        self.block_data_file_watcher = QFileSystemWatcher(self)
+        self.block_data_file_watcher.addPath(self.block_data_manager.config_dir)
+        if os.path.exists(self.block_data_manager.save_file_path):
+            self.block_data_file_watcher.addPath(self.block_data_manager.save_file_path)
+        self.block_data_file_watcher.fileChanged.connect(self._on_block_data_file_changed)
+        self.block_data_file_watcher.directoryChanged.connect(self._on_block_data_file_changed)
+
+        # Editors often save in several steps; wait for the file to settle before re-parsing
+        self.block_data_reload_timer = QTimer(self)
+        self.block_data_reload_timer.setSingleShot(True)
+        self.block_data_reload_timer.setInterval(150)
+        self.block_data_reload_timer.timeout.connect(self._reload_block_data_from_file)
+
+    def _on_block_data_file_changed(self, path):
+        save_file_path = self.block_data_manager.save_file_path
+        if os.path.exists(save_file_path) and save_file_path not in self.block_data_file_watcher.files():
+            self.block_data_file_watcher.addPath(save_file_path)
+        self.block_data_reload_timer.start()
+
+    def _reload_block_data_from_file(self):
+        """
+        Re-parses the save file after an external edit and recomputes only the rows
+        whose block duration or reward changed. Our own writes are ignored by the manager.
+        """
+        new_data = self.block_data_manager.reload_if_changed()
+        if new_data is None:
+            return
+
+        old_data = self._user_overridden_block_data
+        changed_cryptos = [
+            crypto for crypto in self.crypto_list
+            if new_data.get(crypto, {}) != old_data.get(crypto, {})
+        ]
+        self._user_overridden_block_data = new_data
+        if metrics.debug_logging:
+            print(f"DEBUG: CryptoDisplayWidget: Save file edited externally, updating rows: {changed_cryptos}")
+
+        active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(self.image_analyzer_widget.global_tier_combo.currentText(), [])
+        for crypto in changed_cryptos:
+            if crypto not in active_cryptos_for_tier:
+                continue # Inactive rows show defaults; they pick up saved data when they become visible
+            saved = new_data.get(crypto, {})
+            duration_text = saved.get('block_duration') or self.block_durations_defaults.get(crypto, "--")
+            reward_text = saved.get('block_reward') or self.block_rewards_defaults.get(crypto, "--")
+            self._set_cell_text(crypto, 'block_duration_input', duration_text)
+            self._set_cell_text(crypto, 'block_reward_output', reward_text)
+            self._schedule_recalculation(crypto)
+
+    @property
+    def ui_property_writes(self):
+        """
+        Number of cell values actually changed in the table model so far.
+        """
+        return self.table_model.cell_writes
+
+    def _cell_text(self, crypto_symbol, key):
+        return self.table_model.cell_text(crypto_symbol, key)
+
+    def _set_cell_text(self, crypto_symbol, key, text):
+        return self.table_model.set_text(crypto_symbol, key, text)
+
+    def _set_cell_tooltip(self, crypto_symbol, key, tooltip):
+        return self.table_model.set_tooltip(crypto_symbol, key, tooltip)
+
+    def _set_cell_color(self, crypto_symbol, key, color):
+        return self.table_model.set_color(crypto_symbol, key, color)
+
+    def _set_cell_logo(self, crypto_symbol, source_key, load_pixmap):
+        """
+        Shows the logo identified by source_key, e.g. ("icon", "BTC"). load_pixmap() returns it at
+        LOGO_ICON_SIZE and is only called if a different logo is shown; when it returns None or a
+        null pixmap the current logo is kept. Returns whether the requested logo is shown.
+        """
+        if self.table_model.logo_source(crypto_symbol) == source_key:
+            return True
+        pixmap = load_pixmap()
+        if pixmap is None or pixmap.isNull():
+            return False
+        self.table_model.set_logo(crypto_symbol, source_key, pixmap)
+        return True
+
+    def _clear_cell_logo(self, crypto_symbol):
+        self.table_model.set_logo(crypto_symbol, None, None)
+
     def _load_crypto_icon(self, crypto_symbol):
-        base_path = os.path.dirname(__file__)
-        icon_path = os.path.join(base_path, "CryptoIcon", f"{crypto_symbol}.png")
-
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    self.crypto_widgets[crypto_symbol]['logo'].size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.crypto_widgets[crypto_symbol]['logo'].setPixmap(scaled_pixmap)
-            else:
-                self.crypto_widgets[crypto_symbol]['logo'].clear()
-        else:
-            self.crypto_widgets[crypto_symbol]['logo'].clear()
+        """
+        Shows the coin's bundled icon, or clears the logo if there is none. Nothing is reloaded if it is already shown.
+        The icon is decoded and scaled once per process by the shared IconCache.
+        """
+        if not self._set_cell_logo(crypto_symbol, ("icon", crypto_symbol), lambda: get_icon_cache().pixmap(crypto_symbol, LOGO_ICON_SIZE)):
+            self._clear_cell_logo(crypto_symbol)
+
+    def _load_ocr_logo(self, crypto_symbol, info):
+        """
+        Shows the coin's icon as cropped from the pasted screenshot. Returns False if none could be cut out.
+        """
+        if not self.image_analyzer_widget or not self.image_analyzer_widget.pasted_image:
+            return False
+        pasted_image = self.image_analyzer_widget.pasted_image
+
+        def crop_icon():
+            icon_box = self.image_analyzer_widget.find_icon_box(
+                pasted_image,
+                info['ticker_x'],
+                info['ticker_y'],
+                info['ticker_height']
+            )
+            if not icon_box:
+                return None
+            try:
+                x, y, w, h = icon_box
+                icon_pixmap = self.pil_to_pixmap(pasted_image.crop((x, y, x+w, y+h)))
+                return icon_pixmap.scaled(LOGO_ICON_SIZE, LOGO_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            except Exception:
+                return None
+
+        source_key = ("ocr", id(pasted_image), info['ticker_x'], info['ticker_y'], info['ticker_height'])
+        return self._set_cell_logo(crypto_symbol, source_key, crop_icon)
+
+    def _render_row_inputs(self, crypto_symbol, detected_values):
+        """
+        Fills an active row's network power, block duration/reward and logo by priority (OCR,
+        then pasted text, then saved block data, then defaults), writing only the cells that changed.
+        """
+        targets = {
+            'rate': "",
+            'unit': "",
+            'block_duration_input': self.block_durations_defaults.get(crypto_symbol, "--"),
+            'block_reward_output': self.block_rewards_defaults.get(crypto_symbol, "--")
+        }
+        # Priority 1: OCR data, priority 2: manually pasted data (for network rate/unit)
+        ocr_info = detected_values.get(crypto_symbol)
+        if ocr_info is not None:
+            targets['rate'] = str(ocr_info['rate'])
+            targets['unit'] = ocr_info.get('unit', '')
+        elif crypto_symbol in self._last_pasted_values:
+            info = self._last_pasted_values[crypto_symbol]
+            if info['rate']: targets['rate'] = str(info['rate'])
+            if info['unit']: targets['unit'] = info.get('unit', '')
+
+        # Priority 3: user-overridden (saved) block duration/reward, over the "--" defaults
+        user_saved_data = self._user_overridden_block_data.get(crypto_symbol, {})
+        if user_saved_data.get('block_duration'):
+            targets['block_duration_input'] = user_saved_data['block_duration']
+        if user_saved_data.get('block_reward'):
+            targets['block_reward_output'] = user_saved_data['block_reward']
+
+        for key, text in targets.items():
+            self._set_cell_text(crypto_symbol, key, text)
+
+        # The icon cropped by OCR if there is one, otherwise the bundled icon
+        if ocr_info is None or not self._load_ocr_logo(crypto_symbol, ocr_info):
+            self._load_crypto_icon(crypto_symbol)
+
+    def _render_inactive_row(self, crypto_symbol):
+        """
+        Resets a hidden row to its defaults: no network power, "--" block data, "00" rewards and no logo.
+        """
+        targets = {
+            'rate': "",
+            'unit': "",
+            'block_duration_input': self.block_durations_defaults.get(crypto_symbol, "--"),
+            'block_reward_output': self.block_rewards_defaults.get(crypto_symbol, "--")
+        }
+        targets.update({key: "00" for key in self.OUTPUT_CELL_KEYS})
+        for key, text in targets.items():
+            self._set_cell_text(crypto_symbol, key, text)
+        self._clear_cell_logo(crypto_symbol)
 
     def _load_all_crypto_icons(self):
         for crypto_symbol in self.crypto_list:
@@ -335,127 +461,84 @@ class CryptoDisplayWidget(QWidget):
         selected_tier = self.image_analyzer_widget.global_tier_combo.currentText()
         active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(selected_tier, [])
 
-        for crypto_symbol in self.crypto_list:
-            is_active = crypto_symbol in active_cryptos_for_tier
-
-            widgets_to_control = [
-                self.crypto_widgets[crypto_symbol]['logo'],
-                self.crypto_widgets[crypto_symbol]['ticker'],
-                self.crypto_widgets[crypto_symbol]['network_power_wrapper'],
-                self.crypto_widgets[crypto_symbol]['block_duration_input'],
-                self.crypto_widgets[crypto_symbol]['block_reward_output'],
-                self.crypto_widgets[crypto_symbol]['reward_per_block_output'],
-                self.crypto_widgets[crypto_symbol]['daily_reward_output'],
-                self.crypto_widgets[crypto_symbol]['weekly_reward_output1'],
-                self.crypto_widgets[crypto_symbol]['monthly_reward_output'],
-                self.crypto_widgets[crypto_symbol]['yearly_reward_output']
-            ]
-
-            for widget in widgets_to_control:
-                widget.setVisible(is_active)
-
-            widgets = self.crypto_widgets[crypto_symbol]
-            widgets['rate'].blockSignals(True)
-            widgets['unit'].blockSignals(True)
-            widgets['block_duration_input'].blockSignals(True)
-            widgets['block_reward_output'].blockSignals(True)
-            widgets['reward_per_block_output'].blockSignals(True)
-            widgets['daily_reward_output'].blockSignals(True)
-            widgets['weekly_reward_output1'].blockSignals(True)
-            widgets['monthly_reward_output'].blockSignals(True)
-            widgets['yearly_reward_output'].blockSignals(True)
-
-            if not is_active:
-                # When a row becomes inactive, ensure all its fields are cleared and set to "--" defaults
-                widgets['rate'].setText("")
-                widgets['unit'].setText("")
-                widgets['block_duration_input'].setText(self.block_durations_defaults.get(crypto_symbol, "--"))
-                widgets['block_reward_output'].setText(self.block_rewards_defaults.get(crypto_symbol, "--"))
-                widgets['reward_per_block_output'].setText("00")
-                widgets['daily_reward_output'].setText("00")
-                widgets['weekly_reward_output1'].setText("00")
-                widgets['monthly_reward_output'].setText("00")
-                widgets['yearly_reward_output'].setText("00")
-                widgets['logo'].clear()
-            else: # if the row is active
-                # Reset display to its universal default state before applying priority logic
-                widgets['rate'].setText("")
-                widgets['unit'].setText("")
-                widgets['logo'].clear()
-                widgets['block_reward_output'].setText(self.block_rewards_defaults.get(crypto_symbol, "--"))
-                widgets['block_duration_input'].setText(self.block_durations_defaults.get(crypto_symbol, "--"))
-
-
-                # 1. Populate Network Power/Unit (from OCR or pasted data)
-                if crypto_symbol in self._last_detected_values:
-                    info = self._last_detected_values[crypto_symbol]
-                    widgets['rate'].setText(str(info['rate']))
-                    widgets['unit'].setText(info.get('unit', ''))
-                    # Icon logic from OCR
-                    if self.image_analyzer_widget and self.image_analyzer_widget.pasted_image:
-                        icon_box = self.image_analyzer_widget.find_icon_box(
-                            self.image_analyzer_widget.pasted_image,
-                            info['ticker_x'],
-                            info['ticker_y'],
-                            info['ticker_height']
-                        )
-                        if icon_box:
-                            try:
-                                x, y, w, h = icon_box
-                                icon_img = self.image_analyzer_widget.pasted_image.crop((x, y, x+w, y+h))
-                                icon_pixmap = self.pil_to_pixmap(icon_img)
-                                scaled_pixmap = icon_pixmap.scaled(
-                                    widgets['logo'].size(),
-                                    Qt.KeepAspectRatio,
-                                    Qt.SmoothTransformation
-                                )
-                                self.crypto_widgets[crypto_symbol]['logo'].setPixmap(scaled_pixmap)
-                            except Exception:
-                                pass
-                elif crypto_symbol in self._last_pasted_values:
-                    info = self._last_pasted_values[crypto_symbol]
-                    if info['rate']: widgets['rate'].setText(str(info['rate']))
-                    if info['unit']: widgets['unit'].setText(info.get('unit', ''))
-                
-                # 2. Populate Block Duration/Reward (from saved data, overriding the "--" default)
-                if crypto_symbol in self._user_overridden_block_data:
-                    user_saved_data = self._user_overridden_block_data[crypto_symbol]
-                    if user_saved_data.get('block_duration'):
-                        widgets['block_duration_input'].setText(user_saved_data['block_duration'])
-                    if user_saved_data.get('block_reward'):
-                        widgets['block_reward_output'].setText(user_saved_data['block_reward'])
-                
-                # Ensure there's an icon for active rows (either OCR's or default)
-                if widgets['logo'].pixmap() is None or widgets['logo'].pixmap().isNull():
-                     self._load_crypto_icon(crypto_symbol)
-
-            widgets['rate'].blockSignals(False)
-            widgets['unit'].blockSignals(False)
-            widgets['block_duration_input'].blockSignals(False)
-            widgets['block_reward_output'].blockSignals(False)
-            widgets['reward_per_block_output'].blockSignals(False)
-            widgets['daily_reward_output'].blockSignals(False)
-            widgets['weekly_reward_output1'].blockSignals(False)
-            widgets['monthly_reward_output'].blockSignals(False)
-            widgets['yearly_reward_output'].blockSignals(False)
+        self.tier_proxy.set_visible_coins(active_cryptos_for_tier)
+        self._refit_if_tier_changed(selected_tier)
+        with self.table_model.batched_updates():
+            for crypto_symbol in self.crypto_list:
+                if crypto_symbol not in active_cryptos_for_tier:
+                    # When a row becomes inactive, ensure all its fields are cleared and set to "--" defaults
+                    self._remove_from_ranking(crypto_symbol)
+                    self._render_inactive_row(crypto_symbol)
+                else:
+                    self._render_row_inputs(crypto_symbol, self._last_detected_values)
 
         # Trigger recalculations for all *currently active* rows based on the selected tier
         for crypto_symbol in self.crypto_list:
             if crypto_symbol in TIER_CRYPTO_MAPPING.get(selected_tier, []):
-                self._recalculate_row_rewards(crypto_symbol)
+                self._schedule_recalculation(crypto_symbol)
             else:
                 pass
 
 
+    def _schedule_recalculation(self, crypto_symbol):
+        """
+        Marks a row's reward math as dirty. All dirty rows are recomputed together once
+        control returns to the event loop, so a burst of edits costs one recompute per row.
+        """
+        self._dirty_reward_cryptos.add(crypto_symbol)
+        if not self._recalc_timer.isActive():
+            self._recalc_timer.start()
+
+    def _schedule_display_refresh(self, crypto_symbol):
+        """
+        Marks a row's displayed values (currency conversion, price age) as dirty without re-running its reward math.
+        """
+        self._dirty_display_cryptos.add(crypto_symbol)
+        if not self._recalc_timer.isActive():
+            self._recalc_timer.start()
+
+    def _flush_recalculations(self):
+        self._recalc_timer.stop()
+        reward_dirty, self._dirty_reward_cryptos = self._dirty_reward_cryptos, set()
+        display_dirty, self._dirty_display_cryptos = self._dirty_display_cryptos, set()
+        if not reward_dirty and not display_dirty:
+            return
+        writes_before = self.ui_property_writes
+
+        # Inactive rows are hidden and reset; they are recomputed when they become visible again
+        active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(self.image_analyzer_widget.global_tier_combo.currentText(), [])
+        with metrics.span("rewards.recalculate"), self.table_model.batched_updates():
+            recalculated = []
+            for crypto_symbol in self.crypto_list:
+                if crypto_symbol in active_cryptos_for_tier and crypto_symbol in reward_dirty:
+                    if self._recalculate_row_rewards(crypto_symbol):
+                        recalculated.append(crypto_symbol)
+                    metrics.count("rewards.rows_recalculated")
+            self._apply_projections(recalculated) # Weekly/monthly/yearly for the whole pass in one call
+            for crypto_symbol in self.crypto_list:
+                if crypto_symbol not in active_cryptos_for_tier:
+                    continue
+                if crypto_symbol in recalculated:
+                    self._update_displayed_rewards(crypto_symbol)
+                elif crypto_symbol in display_dirty and crypto_symbol not in reward_dirty:
+                    self._update_displayed_rewards(crypto_symbol)
+                    metrics.count("rewards.rows_redisplayed")
+        if metrics.debug_logging:
+            print(f"DEBUG: CryptoDisplayWidget: Recalculation pass wrote {self.ui_property_writes - writes_before} widget properties")
+
     def _recalculate_row_rewards(self, crypto_symbol):
+        """
+        Recomputes one row's reward per block and daily reward. Returns True if the row still
+        needs projecting and rendering; on bad input its outputs are reset and False is returned.
+        """
         try:
             user_power_str = self.image_analyzer_widget.power_input_box.text()
             
-            network_hashrate_str = self.crypto_widgets[crypto_symbol]['rate'].text()
-            network_unit = self.crypto_widgets[crypto_symbol]['unit'].text()
+            network_hashrate_str = self._cell_text(crypto_symbol, 'rate')
+            network_unit = self._cell_text(crypto_symbol, 'unit')
 
-            coin_block_reward_str = self.crypto_widgets[crypto_symbol]['block_reward_output'].text()
-            block_duration_str = self.crypto_widgets[crypto_symbol]['block_duration_input'].text()
+            coin_block_reward_str = self._cell_text(crypto_symbol, 'block_reward_output')
+            block_duration_str = self._cell_text(crypto_symbol, 'block_duration_input')
 
             # MODIFIED: Always assign current_duration_text and current_reward_text
             current_duration_text = block_duration_str.strip()
@@ -481,81 +564,91 @@ class CryptoDisplayWidget(QWidget):
                 if not self._user_overridden_block_data.get(crypto_symbol):
                     self._user_overridden_block_data.pop(crypto_symbol, None)
 
-                self.block_data_manager.save_block_data(self._user_overridden_block_data)
-
+                # Write-behind: only marks the entry dirty; the file is written later, off the GUI thread
+                self.block_data_manager.mark_dirty(crypto_symbol, self._user_overridden_block_data.get(crypto_symbol))
 
-            # Use "00" for calculation if the input string is empty or "--", to prevent ValueError
-            duration_for_calc = current_duration_text if current_duration_text and current_duration_text != "--" else "00"
-            reward_for_calc = current_reward_text if current_reward_text and current_reward_text != "--" else "00"
 
-            reward_per_block = calculate_reward_per_block(
-                user_power_str, "Gh/s",
-                reward_for_calc,
-                network_hashrate_str, network_unit
+            # Reward math is shared with the headless core; "--"/empty block data counts as zero
+            rewards = compute_rewards(
+                user_power_str, network_hashrate_str, network_unit,
+                current_reward_text, current_duration_text
             )
-            blocks_per_day = calculate_blocks_per_day(duration_for_calc)
-
-            daily_reward = calculate_reward_per_day(reward_per_block, blocks_per_day)
-            weekly_reward = daily_reward * 7
-            monthly_reward = daily_reward * 30.44
-            yearly_reward = daily_reward * 365.25
 
             self._original_reward_values[crypto_symbol] = {
-                'reward_per_block': reward_per_block,
-                'daily_reward': daily_reward,
-                'weekly_reward': weekly_reward,
-                'monthly_reward': monthly_reward,
-                'yearly_reward': yearly_reward
+                'reward_per_block': rewards['reward_per_block'],
+                'daily_reward': rewards['daily_reward']
             }
-
-            self._update_displayed_rewards(crypto_symbol)
+            # Only new network data is worth a snapshot; power, tier and currency changes are not
+            network_inputs = (network_hashrate_str.strip(), network_unit.strip(), current_reward_text, current_duration_text)
+            if self._snapshot_network_inputs.get(crypto_symbol) != network_inputs:
+                self._snapshot_network_inputs[crypto_symbol] = network_inputs
+                if network_inputs[0]: # A row without network power is not recorded anyway
+                    self._schedule_snapshot(SNAPSHOT_SOURCE_MANUAL)
+            return True
 
         except ValueError:
-            widgets = self.crypto_widgets[crypto_symbol]
-            widgets['reward_per_block_output'].setText("00")
-            widgets['daily_reward_output'].setText("00")
-            widgets['weekly_reward_output1'].setText("00")
-            widgets['monthly_reward_output'].setText("00")
-            widgets['yearly_reward_output'].setText("00")
+            for output_key in self.OUTPUT_CELL_KEYS:
+                self._set_cell_text(crypto_symbol, output_key, "00")
             self._original_reward_values[crypto_symbol] = {
                 'reward_per_block': 0.0, 'daily_reward': 0.0, 'weekly_reward': 0.0,
                 'monthly_reward': 0.0, 'yearly_reward': 0.0
             }
+            self._projection_bands.pop(crypto_symbol, None)
+            return False
         except Exception as e:
             traceback.print_exc()
-            widgets = self.crypto_widgets[crypto_symbol]
-            widgets['reward_per_block_output'].setText("00")
-            widgets['daily_reward_output'].setText("00")
-            widgets['weekly_reward_output1'].setText("00")
-            widgets['monthly_reward_output'].setText("00")
-            widgets['yearly_reward_output'].setText("00")
+            for output_key in self.OUTPUT_CELL_KEYS:
+                self._set_cell_text(crypto_symbol, output_key, "00")
             self._original_reward_values[crypto_symbol] = {
                 'reward_per_block': 0.0, 'daily_reward': 0.0, 'weekly_reward': 0.0,
                 'monthly_reward': 0.0, 'yearly_reward': 0.0
             }
+            self._projection_bands.pop(crypto_symbol, None)
+            return False
 
     def _on_currency_combo_changed(self, index):
         selected_currency = self.currency_combo.itemText(index)
         self._currency_display_mode = selected_currency
+        self.config_store.set("currency_mode", selected_currency)
+        # Cached prices are shown immediately; expired ones are refreshed in the background
+        # and arrive via conversion_rates_fetched.
         if selected_currency == "USDT":
-            self.crypto_slider.fetch_usdt_conversion_rates()
-            QApplication.processEvents()
-            fetched_usdt_rates = self.crypto_slider.get_usdt_rates()
-            self.conversion_rates["USDT"].update(fetched_usdt_rates)
+            self.conversion_rates["USDT"].update(self.crypto_slider.get_usdt_rates())
+            self.crypto_slider.refresh_if_stale(CURRENCY_USDT)
         elif selected_currency == "Euro":
-            self.crypto_slider.fetch_euro_conversion_rates()
-            QApplication.processEvents()
-            fetched_eur_rates = self.crypto_slider.get_euro_rates()
-            self.conversion_rates["Euro"].update(fetched_eur_rates)
+            self.conversion_rates["Euro"].update(self.crypto_slider.get_euro_rates())
+            self.crypto_slider.refresh_if_stale(CURRENCY_EUR)
 
+        # Only the display conversion changes; reward math is not re-run
+        for crypto in self.crypto_list:
+            self._schedule_display_refresh(crypto)
 
+    def _on_conversion_rates_fetched(self, updated_rates):
+        """
+        Applies freshly fetched prices and re-renders only the fiat outputs of coins
+        whose price changed. Reward math is not re-run; only the display conversion is.
+        """
         active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(self.image_analyzer_widget.global_tier_combo.currentText(), [])
-        for crypto in self.crypto_list:
-            if crypto in active_cryptos_for_tier:
-                self._update_displayed_rewards(crypto)
+        for slider_currency, rates in updated_rates.items():
+            display_mode = self.SLIDER_CURRENCY_TO_DISPLAY_MODE.get(slider_currency)
+            if display_mode is None:
+                continue
+            current_rates = self.conversion_rates[display_mode]
+            changed_cryptos = [crypto for crypto, rate in rates.items() if current_rates.get(crypto) != rate]
+            current_rates.update(rates)
+
+            if display_mode != self._currency_display_mode:
+                # Not on screen, but the ranking in this currency still follows the price
+                for crypto in changed_cryptos:
+                    if crypto in active_cryptos_for_tier:
+                        self._update_ranking(crypto)
+                continue
+            for crypto in self.crypto_list:
+                # Also re-render rows flagged stale, so the flag clears once the price is fresh again
+                if crypto in active_cryptos_for_tier and (crypto in changed_cryptos or self._stale_price_flags.get(crypto)):
+                    self._schedule_display_refresh(crypto)
 
     def _update_displayed_rewards(self, crypto_symbol):
-        widgets = self.crypto_widgets[crypto_symbol]
         current_currency_mode = self._currency_display_mode
 
         original_rewards = self._original_reward_values.get(crypto_symbol, {
@@ -568,9 +661,9 @@ class CryptoDisplayWidget(QWidget):
 
         reward_per_block = original_rewards['reward_per_block']
         daily_reward = original_rewards['daily_reward']
-        weekly_reward = original_rewards['daily_reward'] * 7
-        monthly_reward = original_rewards['daily_reward'] * 30.44
-        yearly_reward = original_rewards['daily_reward'] * 365.25
+        weekly_reward = original_rewards['weekly_reward']
+        monthly_reward = original_rewards['monthly_reward']
+        yearly_reward = original_rewards['yearly_reward']
 
         if current_currency_mode == "USDT":
             conversion_rate = self.conversion_rates["USDT"].get(crypto_symbol, 1.0)
@@ -597,182 +690,300 @@ class CryptoDisplayWidget(QWidget):
                  return formatted_str[:10]
             return formatted_str
 
-        widgets['reward_per_block_output'].setText(format_reward_output(reward_per_block))
-        widgets['daily_reward_output'].setText(format_reward_output(daily_reward))
-        widgets['weekly_reward_output1'].setText(format_reward_output(weekly_reward))
-        widgets['monthly_reward_output'].setText(format_reward_output(monthly_reward))
-        widgets['yearly_reward_output'].setText(format_reward_output(yearly_reward))
+        self._set_cell_text(crypto_symbol, 'reward_per_block_output', format_reward_output(reward_per_block))
+        self._set_cell_text(crypto_symbol, 'daily_reward_output', format_reward_output(daily_reward))
+        self._set_cell_text(crypto_symbol, 'weekly_reward_output1', format_reward_output(weekly_reward))
+        self._set_cell_text(crypto_symbol, 'monthly_reward_output', format_reward_output(monthly_reward))
+        self._set_cell_text(crypto_symbol, 'yearly_reward_output', format_reward_output(yearly_reward))
+
+        self._apply_price_age_flag(crypto_symbol)
+        self._update_ranking(crypto_symbol)
+
+    def _update_ranking(self, crypto_symbol):
+        """
+        Re-scores one coin in the rankings from its daily reward and live prices, then refreshes the highlight.
+        """
+        if crypto_symbol not in TIER_CRYPTO_MAPPING.get(self.image_analyzer_widget.global_tier_combo.currentText(), []):
+            self._remove_from_ranking(crypto_symbol)
+            return
+        daily_reward = self._original_reward_values.get(crypto_symbol, {}).get('daily_reward', 0.0)
+        for display_mode, ranking in self.coin_rankings.items():
+            ranking.update(crypto_symbol, daily_reward * self.conversion_rates[display_mode].get(crypto_symbol, 0.0))
+        self._refresh_best_coin_highlight()
+
+    def _remove_from_ranking(self, crypto_symbol):
+        for ranking in self.coin_rankings.values():
+            ranking.remove(crypto_symbol)
+        self._refresh_best_coin_highlight()
+
+    def _refresh_best_coin_highlight(self):
+        """
+        Highlights the best coin's ticker and shows its margin over the runner-up.
+        Crypto amounts of different coins are not comparable, so Crypto mode ranks by USDT value.
+        """
+        if not hasattr(self, 'best_coin_label'):
+            return # Rows are being built
+        display_mode = self._currency_display_mode if self._currency_display_mode in self.coin_rankings else "USDT"
+        top = self.coin_rankings[display_mode].top(2)
+        best_coin = top[0][0] if top and top[0][1] > 0 else None
+
+        if best_coin != self._highlighted_best_coin:
+            if self._highlighted_best_coin is not None:
+                self._set_cell_color(self._highlighted_best_coin, 'ticker', None)
+                self.table_model.set_bold(self._highlighted_best_coin, 'ticker', False)
+            if best_coin is not None:
+                self._set_cell_color(best_coin, 'ticker', self.BEST_COIN_COLOR)
+                self.table_model.set_bold(best_coin, 'ticker', True)
+            self._highlighted_best_coin = best_coin
+
+        if best_coin is None:
+            self.best_coin_label.setText("")
+            return
+        best_score = top[0][1]
+        best_daily = self._original_reward_values[best_coin]['daily_reward']
+        text = f"Best coin: {best_coin} - {best_daily:.8g} {best_coin} ({best_score:.6g} {display_mode}) per day"
+        if len(top) > 1:
+            runner_up, runner_up_score = top[1]
+            margin = best_score - runner_up_score
+            margin_pct = f" (+{margin / runner_up_score * 100:.1f}%)" if runner_up_score > 0 else ""
+            text += f", {margin:.6g} {display_mode}{margin_pct} ahead of {runner_up}"
+        self.best_coin_label.setText(text)
+
+    def _refit_network_growth(self):
+        """
+        Refits network-power growth for all coins in one batched call from the 30d rolling
+        window samples of the selected tier. Returns the coins whose fit changed.
+        """
+        tier = self.image_analyzer_widget.global_tier_combo.currentText()
+        self._growth_fit_tier = tier
+        series_by_coin = {
+            crypto: self.rolling_analytics.get_window_samples(tier, crypto, 'network_ghs', "30d")
+            for crypto in self.block_rewards_defaults
+        }
+        new_growth = fit_network_growth(series_by_coin)
+        changed = [crypto for crypto, fit in new_growth.items() if self._network_growth.get(crypto) != fit]
+        self._network_growth = new_growth
+        return changed
+
+    def _refit_if_tier_changed(self, selected_tier):
+        """
+        History and trends are per league: on a tier switch, refits the growth of the new tier
+        and shows its rolling stats. The rows recalculated next are projected with the new fits.
+        """
+        if selected_tier == self._growth_fit_tier:
+            return
+        self._refit_network_growth()
+        for crypto_symbol in TIER_CRYPTO_MAPPING.get(selected_tier, []):
+            self._apply_rolling_stats_tooltips(crypto_symbol)
+
+    def _apply_projections(self, crypto_symbols):
+        """
+        Projects weekly/monthly/yearly rewards (and their confidence bands) from the daily
+        reward of each given coin, batched into one NumPy call.
+        """
+        crypto_symbols = [crypto for crypto in crypto_symbols if crypto in self._original_reward_values]
+        if not crypto_symbols:
+            return
+        fits = [self._network_growth.get(crypto, (0.0, 0.0, 0.0)) for crypto in crypto_symbols]
+        projections = project_rewards(
+            [self._original_reward_values[crypto]['daily_reward'] for crypto in crypto_symbols],
+            [growth for growth, _, _ in fits],
+            [stderr for _, stderr, _ in fits],
+            [span for _, _, span in fits]
+        )
+        for i, crypto in enumerate(crypto_symbols):
+            bands = {}
+            for key, (expected, low, high) in projections.items():
+                self._original_reward_values[crypto][key] = float(expected[i])
+                bands[key] = (float(low[i]), float(high[i]))
+            self._projection_bands[crypto] = bands
+
+    def network_snapshot(self):
+        """
+        Returns (network, usdt_prices) for rollercoin_core.portfolio.compute_portfolio: the
+        network power, block reward and block duration currently in the table for every coin,
+        and the USDT prices.
+        """
+        network = {
+            crypto: network_snapshot_entry(
+                self._cell_text(crypto, 'rate'), self._cell_text(crypto, 'unit'),
+                self._cell_text(crypto, 'block_reward_output'), self._cell_text(crypto, 'block_duration_input')
+            )
+            for crypto in self.crypto_list
+        }
+        return network, dict(self.conversion_rates["USDT"])
+
+    def _open_portfolio_window(self):
+        if self.portfolio_window is None:
+            from PortfolioWindow import PortfolioWindow
+            self.portfolio_window = PortfolioWindow(self.network_snapshot, self)
+        else:
+            self.portfolio_window.recalculate()
+        self.portfolio_window.show()
+        self.portfolio_window.raise_()
+
+    def _display_conversion_rate(self, crypto_symbol):
+        if self._currency_display_mode == "USDT":
+            return self.conversion_rates["USDT"].get(crypto_symbol, 1.0)
+        if self._currency_display_mode == "Euro":
+            return self.conversion_rates["Euro"].get(crypto_symbol, 1.0)
+        return 1.0
+
+    def _projection_tooltip(self, crypto_symbol, reward_key):
+        """
+        Describes the confidence band of one projected reward in the current display currency.
+        """
+        band = self._projection_bands.get(crypto_symbol, {}).get(reward_key)
+        growth, stderr, span = self._network_growth.get(crypto_symbol, (0.0, 0.0, 0.0))
+        if band is None or (growth == 0.0 and stderr == 0.0):
+            return "Projected with flat network power (not enough history for a trend)"
+        if PROJECTION_HORIZON_DAYS[reward_key] > MAX_EXTRAPOLATION * span:
+            return f"Projected with flat network power (only {span:.1f} days of history for this horizon)"
+        rate = self._display_conversion_rate(crypto_symbol)
+        return (
+            f"Network power trend: {growth * 100:+.2f}%/day\n"
+            f"Projected range ({CONFIDENCE_Z:g} sigma): {band[0] * rate:.8g} - {band[1] * rate:.8g}"
+        )
+
+    def _apply_price_age_flag(self, crypto_symbol):
+        """
+        Flags fiat outputs converted with a price older than its TTL (or never fetched)
+        and shows the price age in their tooltip.
+        """
+        slider_currency = self.DISPLAY_MODE_TO_SLIDER_CURRENCY.get(self._currency_display_mode)
+
+        is_stale = False
+        tooltip = ""
+        if slider_currency is not None:
+            age = self.crypto_slider.get_price_ages(slider_currency).get(crypto_symbol)
+            is_stale = self.crypto_slider.is_price_stale(slider_currency, crypto_symbol)
+            if age is None:
+                tooltip = f"{crypto_symbol} price is a default estimate, not a live price"
+            else:
+                tooltip = f"{crypto_symbol} price is {int(age // 60)} min {int(age % 60)} sec old"
+                if is_stale:
+                    tooltip += " (stale, refreshing)"
+
+        if self._stale_price_flags.get(crypto_symbol) != is_stale:
+            self._stale_price_flags[crypto_symbol] = is_stale
+            color = self.STALE_PRICE_COLOR if is_stale else None
+            for key in self.OUTPUT_CELL_KEYS:
+                self._set_cell_color(crypto_symbol, key, color)
+        self._set_cell_tooltip(crypto_symbol, 'reward_per_block_output', tooltip)
+        for output_key, reward_key in (('weekly_reward_output1', 'weekly_reward'), ('monthly_reward_output', 'monthly_reward'), ('yearly_reward_output', 'yearly_reward')):
+            projection_tooltip = self._projection_tooltip(crypto_symbol, reward_key)
+            self._set_cell_tooltip(crypto_symbol, output_key, "\n\n".join(part for part in (tooltip, projection_tooltip) if part))
+        daily_stats_tooltip = self._rolling_stats_tooltip(crypto_symbol, 'daily_reward', f"Daily reward ({crypto_symbol})")
+        self._set_cell_tooltip(crypto_symbol, 'daily_reward_output', "\n\n".join(part for part in (tooltip, daily_stats_tooltip) if part))
+
+    def _rolling_stats_tooltip(self, crypto_symbol, metric, title):
+        """
+        Formats the rolling average/min/max per window and the EWMA of one metric, or "" if none recorded.
+        """
+        lines = []
+        ewma = None
+        tier = self.image_analyzer_widget.global_tier_combo.currentText()
+        for window_name in ROLLING_WINDOWS:
+            stats = self.rolling_analytics.get_stats(tier, crypto_symbol, metric, window_name)
+            if not stats or not stats['count']:
+                continue
+            ewma = stats['ewma']
+            lines.append(
+                f"{window_name}: avg {stats['mean']:.6g}, min {stats['min']:.6g}, max {stats['max']:.6g} ({stats['count']} snapshots)"
+            )
+        if not lines:
+            return ""
+        return "\n".join([f"{title} history:"] + lines + [f"EWMA: {ewma:.6g}"])
+
+    def _apply_rolling_stats_tooltips(self, crypto_symbol):
+        tooltip = self._rolling_stats_tooltip(crypto_symbol, 'network_ghs', "Network power (Gh/s)")
+        self._set_cell_tooltip(crypto_symbol, 'rate', tooltip)
+        self._set_cell_tooltip(crypto_symbol, 'unit', tooltip)
+
+    def _on_rolling_stats_updated(self, coins):
+        for crypto_symbol in coins:
+            if self.table_model.has_coin(crypto_symbol):
+                self._apply_rolling_stats_tooltips(crypto_symbol)
+
+        # New history can move the growth fits; re-project only the active coins whose fit moved
+        active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(self.image_analyzer_widget.global_tier_combo.currentText(), [])
+        refit_cryptos = [crypto for crypto in self._refit_network_growth() if crypto in active_cryptos_for_tier]
+        self._apply_projections(refit_cryptos)
+        for crypto_symbol in self.crypto_list:
+            if crypto_symbol in refit_cryptos:
+                self._schedule_display_refresh(crypto_symbol)
+            elif crypto_symbol in coins and self.table_model.has_coin(crypto_symbol):
+                self._apply_price_age_flag(crypto_symbol)
 
 
     def _update_crypto_row_visibility_only(self):
         selected_tier = self.image_analyzer_widget.global_tier_combo.currentText()
         active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(selected_tier, [])
 
+        self.tier_proxy.set_visible_coins(active_cryptos_for_tier)
+        self._refit_if_tier_changed(selected_tier)
         for crypto_symbol in self.crypto_list:
-            is_active = crypto_symbol in active_cryptos_for_tier
-
-            widgets_to_control = [
-                self.crypto_widgets[crypto_symbol]['logo'],
-                self.crypto_widgets[crypto_symbol]['ticker'],
-                self.crypto_widgets[crypto_symbol]['network_power_wrapper'],
-                self.crypto_widgets[crypto_symbol]['block_duration_input'],
-                self.crypto_widgets[crypto_symbol]['block_reward_output'],
-                self.crypto_widgets[crypto_symbol]['reward_per_block_output'],
-                self.crypto_widgets[crypto_symbol]['daily_reward_output'],
-                self.crypto_widgets[crypto_symbol]['weekly_reward_output1'],
-                self.crypto_widgets[crypto_symbol]['monthly_reward_output'],
-                self.crypto_widgets[crypto_symbol]['yearly_reward_output']
-            ]
-
-            for widget in widgets_to_control:
-                widget.setVisible(is_active)
-
-            widgets = self.crypto_widgets[crypto_symbol]
-            if not is_active:
-                widgets['rate'].blockSignals(True)
-                widgets['unit'].blockSignals(True)
-                widgets['block_duration_input'].blockSignals(True)
-                widgets['block_reward_output'].blockSignals(True)
-
-                widgets['rate'].setText("")
-                widgets['unit'].setText("")
-                widgets['block_duration_input'].setText(self.block_durations_defaults.get(crypto_symbol, "--"))
-                widgets['block_reward_output'].setText(self.block_rewards_defaults.get(crypto_symbol, "--"))
-                widgets['reward_per_block_output'].setText("00")
-                widgets['daily_reward_output'].setText("00")
-                widgets['weekly_reward_output1'].setText("00")
-                widgets['monthly_reward_output'].setText("00")
-                widgets['yearly_reward_output'].setText("00")
-                widgets['logo'].clear()
-
-                widgets['rate'].blockSignals(False)
-                widgets['unit'].blockSignals(False)
-                widgets['block_duration_input'].blockSignals(False)
-                widgets['block_reward_output'].blockSignals(False)
-            else:
-                if widgets['logo'].pixmap() is None or widgets['logo'].pixmap().isNull():
-                     self._load_crypto_icon(crypto_symbol)
-
+            if crypto_symbol not in active_cryptos_for_tier:
+                self._remove_from_ranking(crypto_symbol)
+                self._render_inactive_row(crypto_symbol)
+            elif self.table_model.logo_source(crypto_symbol) is None:
+                self._load_crypto_icon(crypto_symbol)
 
     def update_crypto_list(self, detected_values, user_power_input_str, selected_tier):
         is_clear_image_event = (self.image_analyzer_widget.pasted_image is None) and (not detected_values)
+        if detected_values:
+            self._schedule_snapshot(SNAPSHOT_SOURCE_OCR)
 
         if not is_clear_image_event:
             self._last_detected_values.update(detected_values)
         else:
             self._last_detected_values = {}
 
-        for crypto_symbol_key in self.crypto_list:
-            widgets = self.crypto_widgets[crypto_symbol_key]
-            widgets['rate'].blockSignals(True)
-            widgets['unit'].blockSignals(True)
-            widgets['block_duration_input'].blockSignals(True)
-            widgets['block_reward_output'].blockSignals(True)
-
-            widgets['rate'].setText("")
-            widgets['unit'].setText("")
-            widgets['logo'].clear()
-            
-            # --- Initialize Block Duration and Reward to their defaults first ---
-            # These lines are crucial to ensure that if no saved data, "--" is the starting point.
-            widgets['block_duration_input'].setText(self.block_durations_defaults.get(crypto_symbol_key, "--"))
-            widgets['block_reward_output'].setText(self.block_rewards_defaults.get(crypto_symbol_key, "--"))
-            
-            widgets['reward_per_block_output'].setText("00")
-            widgets['daily_reward_output'].setText("00")
-            widgets['weekly_reward_output1'].setText("00")
-            widgets['monthly_reward_output'].setText("00")
-            widgets['yearly_reward_output'].setText("00")
-
-            # --- Populating input fields (Rate, Unit, Duration, Reward) based on priority ---
-            # Priority 1: OCR Data (for network rate/unit)
-            if crypto_symbol_key in detected_values:
-                info = detected_values[crypto_symbol_key]
-                widgets['rate'].setText(str(info['rate']))
-                widgets['unit'].setText(info.get('unit', ''))
-                if self.image_analyzer_widget and self.image_analyzer_widget.pasted_image:
-                    icon_box = self.image_analyzer_widget.find_icon_box(
-                        self.image_analyzer_widget.pasted_image,
-                        info['ticker_x'],
-                        info['ticker_y'],
-                        info['ticker_height']
-                    )
-                    if icon_box:
-                        try:
-                            x, y, w, h = icon_box
-                            icon_img = self.image_analyzer_widget.pasted_image.crop((x, y, x+w, y+h))
-                            icon_pixmap = self.pil_to_pixmap(icon_img)
-                            scaled_pixmap = icon_pixmap.scaled(
-                                widgets['logo'].size(),
-                                Qt.KeepAspectRatio,
-                                Qt.SmoothTransformation
-                            )
-                            widgets['logo'].setPixmap(scaled_pixmap)
-                        except Exception:
-                            pass
-            # Priority 2: Manually Pasted Data (for network rate/unit, if no OCR data)
-            elif crypto_symbol_key in self._last_pasted_values:
-                info = self._last_pasted_values[crypto_symbol_key]
-                if info['rate']: widgets['rate'].setText(str(info['rate']))
-                if info['unit']: widgets['unit'].setText(info.get('unit', ''))
-            
-            # Priority 3: User-Overridden (Saved) Block Duration/Reward
-            # This applies if the saved data exists, overriding the "--" default already set.
-            if crypto_symbol_key in self._user_overridden_block_data:
-                user_saved_data = self._user_overridden_block_data[crypto_symbol_key]
-                if user_saved_data.get('block_duration'):
-                    widgets['block_duration_input'].setText(user_saved_data['block_duration'])
-                if user_saved_data.get('block_reward'):
-                    widgets['block_reward_output'].setText(user_saved_data['block_reward'])
-            
-            # Icon fallback if no custom icon was set by OCR
-            if widgets['logo'].pixmap() is None or widgets['logo'].pixmap().isNull():
-                 self._load_crypto_icon(crypto_symbol_key)
+        writes_before = self.ui_property_writes
+        # Only active rows are filled in (inactive ones are reset by the visibility pass below), and only
+        # cells whose value changed are written. Outputs keep their values until the scheduled
+        # recalculation re-renders the ones that differ.
+        active_cryptos_for_tier = TIER_CRYPTO_MAPPING.get(selected_tier, [])
+        with metrics.span("rows.render_inputs"), self.table_model.batched_updates():
+            for crypto_symbol_key in self.crypto_list:
+                if crypto_symbol_key in active_cryptos_for_tier:
+                    self._render_row_inputs(crypto_symbol_key, detected_values)
 
-            widgets['rate'].blockSignals(False)
-            widgets['unit'].blockSignals(False)
-            widgets['block_duration_input'].blockSignals(False)
-            widgets['block_reward_output'].blockSignals(False)
+            self._update_crypto_row_visibility_only()
+        if metrics.debug_logging:
+            print(f"DEBUG: CryptoDisplayWidget: Row update wrote {self.ui_property_writes - writes_before} widget properties")
 
-        self._update_crypto_row_visibility_only()
-        
         for crypto_symbol in self.crypto_list:
             if crypto_symbol in TIER_CRYPTO_MAPPING.get(selected_tier, []):
-                self._recalculate_row_rewards(crypto_symbol)
+                self._schedule_recalculation(crypto_symbol)
             else:
                 pass
 
+        if self._is_initializing:
+            self._flush_recalculations() # The first fill runs now, before saving block data is enabled
         self._is_initializing = False # NEW: Initialization complete, allow saving from now on
 
     def update_from_pasted_data(self, pasted_data):
         self._last_pasted_values.update(pasted_data)
+        if pasted_data:
+            self._schedule_snapshot(SNAPSHOT_SOURCE_PASTE)
 
         selected_tier = self.image_analyzer_widget.global_tier_combo.currentText()
 
-        for crypto_symbol_key in self.crypto_list:
-            widgets = self.crypto_widgets[crypto_symbol_key]
-            widgets['rate'].blockSignals(True)
-            widgets['unit'].blockSignals(True)
-
-            if crypto_symbol_key in TIER_CRYPTO_MAPPING.get(selected_tier, []) and crypto_symbol_key not in self._last_detected_values:
-                widgets['rate'].setText("")
-                widgets['unit'].setText("")
-
-                if crypto_symbol_key in pasted_data:
-                    info = pasted_data[crypto_symbol_key]
-                    if info['rate']: widgets['rate'].setText(str(info['rate']))
-                    if info['unit']: widgets['unit'].setText(info.get('unit', ''))
-                elif crypto_symbol_key in self._last_pasted_values:
-                    info = self._last_pasted_values[crypto_symbol_key]
-                    if info['rate']: widgets['rate'].setText(str(info['rate']))
-                    if info['unit']: widgets['unit'].setText(info.get('unit', ''))
-            
-            widgets['rate'].blockSignals(False)
-            widgets['unit'].blockSignals(False)
-        
+        with self.table_model.batched_updates():
+            for crypto_symbol_key in self.crypto_list:
+                if crypto_symbol_key in TIER_CRYPTO_MAPPING.get(selected_tier, []) and crypto_symbol_key not in self._last_detected_values:
+                    rate_text, unit_text = "", ""
+                    info = self._last_pasted_values.get(crypto_symbol_key) # Already updated with pasted_data
+                    if info:
+                        if info['rate']: rate_text = str(info['rate'])
+                        if info['unit']: unit_text = info.get('unit', '')
+                    self._set_cell_text(crypto_symbol_key, 'rate', rate_text)
+                    self._set_cell_text(crypto_symbol_key, 'unit', unit_text)
+
         for crypto_symbol in self.crypto_list:
             if crypto_symbol in TIER_CRYPTO_MAPPING.get(selected_tier, []):
-                self._recalculate_row_rewards(crypto_symbol)
+                self._schedule_recalculation(crypto_symbol)
 
 
     def clear_pasted_data(self):
@@ -780,12 +991,102 @@ class CryptoDisplayWidget(QWidget):
         self.update_crypto_list(self._last_detected_values, self.image_analyzer_widget.power_input_box.text(), self.image_analyzer_widget.global_tier_combo.currentText())
 
 
+    def _schedule_snapshot(self, source):
+        """
+        Arranges for the current rows to be recorded to the history once recalculation settles.
+        An OCR or paste source is kept over the "manual" recalculations it triggers.
+        """
+        if self._is_initializing:
+            return
+        if self._pending_snapshot_source is None or source != SNAPSHOT_SOURCE_MANUAL:
+            self._pending_snapshot_source = source
+        self._snapshot_timer.start()
+
+    def _record_snapshot(self):
+        """
+        Collects network power, block data, prices and computed rewards of the active rows
+        and hands them to the history writer. Only reads widget state; never touches the database.
+        """
+        source = self._pending_snapshot_source or SNAPSHOT_SOURCE_MANUAL
+        self._pending_snapshot_source = None
+
+        user_power_str = self.image_analyzer_widget.power_input_box.text()
+        selected_tier = self.image_analyzer_widget.global_tier_combo.currentText()
+        user_power_ghs = convert_power_to_ghs(user_power_str, "Gh/s", UNIT_MULTIPLIERS) if user_power_str.strip() else None
+
+        coins = {}
+        for crypto_symbol in TIER_CRYPTO_MAPPING.get(selected_tier, []):
+            if not self.table_model.has_coin(crypto_symbol):
+                continue
+            rate_text = self._cell_text(crypto_symbol, 'rate').strip()
+            if not rate_text:
+                continue # Nothing observed for this coin
+            network_ghs = convert_power_to_ghs(rate_text, self._cell_text(crypto_symbol, 'unit'), UNIT_MULTIPLIERS)
+            try:
+                block_reward = float(self._cell_text(crypto_symbol, 'block_reward_output'))
+            except ValueError:
+                block_reward = None
+            duration_text = self._cell_text(crypto_symbol, 'block_duration_input').strip()
+            block_duration_s = parse_duration_to_seconds(duration_text) if duration_text and duration_text != "--" else None
+            rewards = self._original_reward_values.get(crypto_symbol, {})
+            coins[crypto_symbol] = {
+                'network_ghs': network_ghs,
+                'block_reward': block_reward,
+                'block_duration_s': block_duration_s,
+                'price_usdt': self.conversion_rates["USDT"].get(crypto_symbol),
+                'price_eur': self.conversion_rates["Euro"].get(crypto_symbol),
+                'reward_per_block': rewards.get('reward_per_block'),
+                'daily_reward': rewards.get('daily_reward')
+            }
+
+        if not coins:
+            return
+        self.snapshot_history.record_snapshot(source, user_power_ghs, selected_tier, coins)
+
+    def restore_saved_settings(self):
+        """
+        Restores the last user power, manual tier override and currency mode from the
+        config store, then starts remembering changes to them.
+        Called once both widgets exist.
+        """
+        analyzer = self.image_analyzer_widget
+        last_user_power = self.config_store.get("last_user_power")
+        tier_override = self.config_store.get("tier_override")
+        currency_mode = self.config_store.get("currency_mode")
+
+        if last_user_power:
+            analyzer.power_input_box.setText(last_user_power)
+        if tier_override and analyzer.global_tier_combo.findText(tier_override) != -1:
+            # Set like a user pick, so the analyzer treats it as a manual override
+            analyzer.global_tier_combo.setCurrentIndex(analyzer.global_tier_combo.findText(tier_override))
+        if currency_mode and self.currency_combo.findText(currency_mode) != -1:
+            self.currency_combo.setCurrentIndex(self.currency_combo.findText(currency_mode))
+
+        analyzer.power_input_box.textChanged.connect(self._on_saved_power_or_tier_changed)
+        analyzer.global_tier_combo.currentIndexChanged.connect(self._on_saved_power_or_tier_changed)
+
+    def _on_saved_power_or_tier_changed(self, *args):
+        analyzer = self.image_analyzer_widget
+        self.config_store.set("last_user_power", analyzer.power_input_box.text())
+        self.config_store.set(
+            "tier_override",
+            analyzer.global_tier_combo.currentText() if analyzer._is_tier_manual_override else None
+        )
+
+    def shutdown(self):
+        """
+        Flushes pending block data, config and history writes and stops background price fetching. Called on exit.
+        """
+        self._flush_recalculations()
+        if self._snapshot_timer.isActive():
+            self._snapshot_timer.stop()
+            self._record_snapshot()
+        self.snapshot_history.close()
+        self.block_data_manager.flush()
+        self.crypto_slider.shutdown()
+        self.config_store.flush()
+
     def set_block_durations(self, durations_dict):
         for ticker, duration_text in durations_dict.items():
-            if ticker in self.crypto_widgets:
-                current_text = self.crypto_widgets[ticker]['block_duration_input'].text()
-                if current_text != duration_text:
-                    self.crypto_widgets[ticker]['block_duration_input'].blockSignals(True)
-                    self.crypto_widgets[ticker]['block_duration_input'].setText(duration_text)
-                    self.crypto_widgets[ticker]['block_duration_input'].blockSignals(False)
-                    self._recalculate_row_rewards(ticker)
+            if self.table_model.has_coin(ticker) and self._set_cell_text(ticker, 'block_duration_input', duration_text):
+                self._schedule_recalculation(ticker)
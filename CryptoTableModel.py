@@ -0,0 +1,263 @@
+from contextlib import contextmanager
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QLineEdit, QStyledItemDelegate
+
+# (key, header, width in px). The keys are the names the per-row widgets used to have,
+# so CryptoDisplayWidget keeps addressing cells as (coin, key).
+CRYPTO_TABLE_COLUMNS = (
+    ('logo', "", 34),
+    ('ticker', "", 70),
+    ('rate', "Network\n power", 70),
+    ('unit', "Unit", 50),
+    ('block_duration_input', "Block\n Duration", 80),
+    ('block_reward_output', "Block\n reward", 75),
+    ('reward_per_block_output', "Reward\n Per Block", 100),
+    ('daily_reward_output', "Daily\n reward", 100),
+    ('weekly_reward_output1', "Weekly\n reward", 100),
+    ('monthly_reward_output', "Monthly\n reward", 100),
+    ('yearly_reward_output', "Yearly\n reward", 100)
+)
+
+# Columns the user can type into
+EDITABLE_COLUMN_KEYS = ('rate', 'unit', 'block_duration_input', 'block_reward_output')
+
+LOGO_ICON_SIZE = 26 # Logo pixmaps are scaled to fit this square
+LOGO_SOURCE_ROLE = Qt.UserRole # Identifies which logo a cell shows, e.g. ("icon", "BTC")
+
+class ClearOnFocusLineEdit(QLineEdit):
+    def focusInEvent(self, event):
+        self.selectAll()
+        super().focusInEvent(event)
+
+class CryptoTableModel(QAbstractTableModel):
+    """
+    One row per coin and one column per CRYPTO_TABLE_COLUMNS entry. Stores the text, tooltip,
+    colour, boldness and logo of every cell.
+
+    The setters only notify views when a value actually changes. Inside batched_updates() the
+    notifications are collected and sent as one dataChanged range per changed row, so a
+    mass update costs what it changes. User edits come in through setData() and are reported
+    via cell_edited; programmatic writes are not.
+    """
+    cell_edited = pyqtSignal(str, str) # coin, column key
+
+    def __init__(self, coins, parent=None):
+        super().__init__(parent)
+        self.coins = list(coins)
+        self._row_of = {coin: row for row, coin in enumerate(self.coins)}
+        self._column_of = {key: col for col, (key, _, _) in enumerate(CRYPTO_TABLE_COLUMNS)}
+        self._cells = {} # (row, column, role) -> value; missing means unset
+        for row, coin in enumerate(self.coins):
+            self._cells[(row, self._column_of['ticker'], Qt.DisplayRole)] = coin
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._batch_depth = 0
+        self._pending_changes = {} # row -> [first column, last column, roles]
+        self.cell_writes = 0 # Cell values actually changed, for measuring update cost
+
+    def has_coin(self, coin):
+        return coin in self._row_of
+
+    def column_of(self, key):
+        return self._column_of[key]
+
+    def coin_at(self, row):
+        return self.coins[row]
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.coins)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(CRYPTO_TABLE_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.EditRole:
+            role = Qt.DisplayRole
+        value = self._cells.get((index.row(), index.column(), role))
+        if value is None:
+            return None
+        if role == Qt.ForegroundRole:
+            return QColor(value)
+        if role == Qt.FontRole:
+            return self._bold_font if value else None
+        return value
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return CRYPTO_TABLE_COLUMNS[section][1]
+        if role == Qt.FontRole:
+            return self._bold_font
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if CRYPTO_TABLE_COLUMNS[index.column()][0] in EDITABLE_COLUMN_KEYS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or not (self.flags(index) & Qt.ItemIsEditable):
+            return False
+        coin = self.coins[index.row()]
+        key = CRYPTO_TABLE_COLUMNS[index.column()][0]
+        if self.set_text(coin, key, str(value)):
+            self.cell_edited.emit(coin, key)
+        return True
+
+    # --- Programmatic access ---
+
+    def cell_text(self, coin, key):
+        return self._cells.get((self._row_of[coin], self._column_of[key], Qt.DisplayRole)) or ""
+
+    def logo_source(self, coin):
+        return self._cells.get((self._row_of[coin], self._column_of['logo'], LOGO_SOURCE_ROLE))
+
+    def set_text(self, coin, key, text):
+        return self._set_cell(coin, key, Qt.DisplayRole, text if text else None)
+
+    def set_tooltip(self, coin, key, tooltip):
+        return self._set_cell(coin, key, Qt.ToolTipRole, tooltip if tooltip else None)
+
+    def set_color(self, coin, key, color):
+        """
+        Sets a cell's text colour (e.g. "#faa61a"); None restores the default.
+        """
+        return self._set_cell(coin, key, Qt.ForegroundRole, color)
+
+    def set_bold(self, coin, key, is_bold):
+        return self._set_cell(coin, key, Qt.FontRole, True if is_bold else None)
+
+    def set_logo(self, coin, source_key, pixmap):
+        """
+        Shows pixmap in the coin's logo cell, identified by source_key; (None, None) clears it.
+        Nothing happens if the cell already shows that source.
+        """
+        if self.logo_source(coin) == source_key:
+            return False
+        row, col = self._row_of[coin], self._column_of['logo']
+        self._store(row, col, LOGO_SOURCE_ROLE, source_key)
+        self._store(row, col, Qt.DecorationRole, pixmap)
+        self._cell_changed(row, col, Qt.DecorationRole)
+        return True
+
+    @contextmanager
+    def batched_updates(self):
+        """
+        Collects change notifications while active and emits one dataChanged range per
+        changed row when the outermost batch ends.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._emit_pending_changes()
+
+    def _store(self, row, col, role, value):
+        if value is None:
+            self._cells.pop((row, col, role), None)
+        else:
+            self._cells[(row, col, role)] = value
+
+    def _set_cell(self, coin, key, role, value):
+        row, col = self._row_of[coin], self._column_of[key]
+        if self._cells.get((row, col, role)) == value:
+            return False
+        self._store(row, col, role, value)
+        self._cell_changed(row, col, role)
+        return True
+
+    def _cell_changed(self, row, col, role):
+        self.cell_writes += 1
+        if self._batch_depth == 0:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, [role])
+            return
+        pending = self._pending_changes.get(row)
+        if pending is None:
+            self._pending_changes[row] = [col, col, {role}]
+        else:
+            pending[0] = min(pending[0], col)
+            pending[1] = max(pending[1], col)
+            pending[2].add(role)
+
+    def _emit_pending_changes(self):
+        pending_changes, self._pending_changes = self._pending_changes, {}
+        for row, (first_col, last_col, roles) in sorted(pending_changes.items()):
+            self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col), sorted(roles))
+
+class TierFilterProxyModel(QSortFilterProxyModel):
+    """
+    Shows only the rows of the coins active in the selected tier.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._visible_coins = None # None shows every row
+
+    def set_visible_coins(self, coins):
+        """
+        Returns True if the set of visible coins changed (and the filter was re-run).
+        """
+        coins = frozenset(coins)
+        if coins == self._visible_coins:
+            return False
+        self._visible_coins = coins
+        self.invalidateFilter()
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._visible_coins is None:
+            return True
+        return self.sourceModel().coin_at(source_row) in self._visible_coins
+
+class CellLineEditDelegate(QStyledItemDelegate):
+    """
+    Edits text cells in a line edit that selects its contents on focus. Every keystroke is
+    committed to the model, so rewards follow the typing as they did with the per-cell inputs.
+    """
+    def createEditor(self, parent, option, index):
+        editor = ClearOnFocusLineEdit(parent)
+        editor.setAlignment(Qt.AlignCenter)
+        if CRYPTO_TABLE_COLUMNS[index.column()][0] == 'rate':
+            editor.setPlaceholderText("Rate")
+        editor.textEdited.connect(lambda text, e=editor: self.commitData.emit(e))
+        return editor
+
+    def setEditorData(self, editor, index):
+        if editor.text() != (index.data(Qt.EditRole) or ""):
+            editor.setText(index.data(Qt.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.text(), Qt.EditRole)
+
+if __name__ == "__main__":
+    import sys
+    from PyQt5.QtWidgets import QApplication, QTableView
+    app = QApplication(sys.argv)
+    model = CryptoTableModel(["RLT", "RST", "BTC", "LTC"])
+    proxy = TierFilterProxyModel()
+    proxy.setSourceModel(model)
+    with model.batched_updates():
+        for coin in model.coins:
+            model.set_text(coin, 'daily_reward_output', "00")
+    model.set_color("BTC", 'daily_reward_output', "#faa61a")
+    proxy.set_visible_coins(["RLT", "BTC"])
+    print(f"Visible rows: {proxy.rowCount()}, cell writes: {model.cell_writes}")
+    view = QTableView()
+    view.setModel(proxy)
+    view.setItemDelegate(CellLineEditDelegate(view))
+    view.show()
+    sys.exit(app.exec_())
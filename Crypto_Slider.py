@@ -1,104 +1,596 @@
-import requests
+import os
+import sys
 import json
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ConfigStore import ConfigStore
+from PerfMetrics import metrics
+
+BINANCE_BASE_URL = "https://api.binance.com"
+TICKER_PRICE_PATH = "/api/v3/ticker/price"
+
+# Cross pair used to derive EUR prices from USDT prices (price = USDT per 1 EUR)
+EUR_USDT_CROSS_PAIR = "EURUSDT"
+
+# EUR pricing modes:
+#   "derived" - fetch every coin once against USDT plus the EUR/USDT cross rate
+#               and compute EUR prices locally (one request for both currencies)
+#   "direct"  - fetch the *EUR pairs directly (some pairs do not exist on Binance)
+EUR_PRICING_DERIVED = "derived"
+EUR_PRICING_DIRECT = "direct"
+
+# Where each stored price came from
+PRICE_SOURCE_DIRECT = "direct"
+PRICE_SOURCE_DERIVED = "derived"
+PRICE_SOURCE_DEFAULT = "default"
+
+# Currency keys used in rate-update notifications
+CURRENCY_USDT = "USDT"
+CURRENCY_EUR = "EUR"
+
+# Price cache defaults: how long a fetched price is considered fresh. The cache itself
+# lives in the ConfigStore; the standalone file is only read to migrate older installs.
+DEFAULT_PRICE_TTL_SECONDS = 120
+LEGACY_PRICE_CACHE_FILE_NAME = "Price cache.json"
+LEGACY_PRICE_CACHE_VERSION = 1
+
+# HTTP statuses Binance uses for rate limiting (418 = IP banned after ignoring 429s)
+RATE_LIMIT_STATUS_CODES = (429, 418)
+
+# Circuit breaker states of the price refresh scheduler
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+class PriceRefreshScheduler:
+    """
+    One long-lived background thread that performs every price fetch for a CryptoSlider.
+
+    - Concurrent requests for the same currency are coalesced into one in-flight fetch
+      (in derived EUR mode USDT and EUR share a single fetch).
+    - Currencies that were requested at least once are refreshed every refresh_interval
+      seconds, so with an interval no longer than the price TTL they never go stale.
+    - Failed or rate-limited fetches back off exponentially (with jitter); after
+      failure_threshold consecutive failures the circuit breaker opens and no request
+      is sent for breaker_cooldown seconds, after which one trial fetch is allowed.
+    """
+    def __init__(self, slider, refresh_interval=DEFAULT_PRICE_TTL_SECONDS, base_backoff=2.0, max_backoff=300.0,
+                 failure_threshold=5, breaker_cooldown=600.0):
+        self.slider = slider
+        self.refresh_interval = refresh_interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.breaker_cooldown = breaker_cooldown
+
+        self._condition = threading.Condition()
+        self._pending = {}          # job key -> threading.Event set when that fetch completes
+        self._in_flight = {}        # job key -> threading.Event of the running fetch
+        self._tracked_currencies = set()
+        self._consecutive_failures = 0
+        self._not_before = 0.0      # no request is sent before this time (backoff / breaker)
+        self._next_periodic = 0.0
+        self.breaker_state = BREAKER_CLOSED
+        self._stopped = False
+        self._thread = None
+
+    def _job_key(self, currency):
+        if self.slider.eur_pricing_mode == EUR_PRICING_DERIVED:
+            return (CURRENCY_USDT, CURRENCY_EUR)
+        return (currency,)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="PriceRefreshScheduler", daemon=True)
+            self._thread.start()
+
+    def request_refresh(self, currency):
+        """
+        Asks for a refresh of "USDT" or "EUR" prices. Returns a threading.Event that is
+        set when the fetch serving this request completes (successfully or not).
+        """
+        key = self._job_key(currency)
+        with self._condition:
+            self._tracked_currencies.add(currency)
+            if key in self._in_flight:
+                if metrics.debug_logging:
+                    print(f"DEBUG: PriceRefreshScheduler: Coalesced {currency} request into in-flight fetch.")
+                return self._in_flight[key]
+            if key not in self._pending:
+                self._pending[key] = threading.Event()
+            done_event = self._pending[key]
+            self._ensure_started()
+            self._condition.notify()
+        return done_event
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=self.slider.request_timeout * 2)
+
+    def _queue_periodic_refreshes(self, now):
+        # Must be called with _condition held
+        if not self.refresh_interval or now < self._next_periodic:
+            return
+        self._next_periodic = now + self.refresh_interval
+        # Queued whether or not the prices are stale yet: the last fetch is always slightly
+        # less than one interval old here, so a staleness check would skip every other tick
+        for currency in self._tracked_currencies:
+            key = self._job_key(currency)
+            if key not in self._pending and key not in self._in_flight:
+                self._pending[key] = threading.Event()
+
+    def _next_job(self):
+        """
+        Blocks until a job may run; returns (key, done_event) or None when stopped.
+        """
+        with self._condition:
+            while True:
+                if self._stopped:
+                    return None
+                now = time.time()
+                if self._next_periodic == 0.0:
+                    self._next_periodic = now + (self.refresh_interval or 0)
+                self._queue_periodic_refreshes(now)
+
+                if self._pending and now >= self._not_before:
+                    if self.breaker_state == BREAKER_OPEN:
+                        self.breaker_state = BREAKER_HALF_OPEN
+                        if metrics.debug_logging:
+                            print("DEBUG: PriceRefreshScheduler: Circuit half-open, allowing one trial fetch.")
+                    key = next(iter(self._pending))
+                    done_event = self._pending.pop(key)
+                    self._in_flight[key] = done_event
+                    return key, done_event
+
+                wake_times = []
+                if self.refresh_interval:
+                    wake_times.append(self._next_periodic)
+                if self._pending:
+                    wake_times.append(self._not_before)
+                timeout = max(0.0, min(wake_times) - now) if wake_times else None
+                self._condition.wait(timeout)
+
+    def _record_result(self, success, retry_after):
+        with self._condition:
+            if success:
+                if self.breaker_state != BREAKER_CLOSED:
+                    if metrics.debug_logging:
+                        print("DEBUG: PriceRefreshScheduler: Fetch succeeded, circuit closed.")
+                self._consecutive_failures = 0
+                self._not_before = 0.0
+                self.breaker_state = BREAKER_CLOSED
+                return
+
+            self._consecutive_failures += 1
+            if self.breaker_state == BREAKER_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self.breaker_state = BREAKER_OPEN
+                delay = self.breaker_cooldown
+                print(f"ERROR: PriceRefreshScheduler: Circuit open after {self._consecutive_failures} failures, pausing {delay:.0f}s.")
+            else:
+                delay = min(self.max_backoff, self.base_backoff * (2 ** (self._consecutive_failures - 1)))
+                delay *= random.uniform(0.8, 1.2) # Jitter so restarts do not retry in lockstep
+                print(f"ERROR: PriceRefreshScheduler: Fetch failed ({self._consecutive_failures} in a row), backing off {delay:.1f}s.")
+            if retry_after:
+                delay = max(delay, retry_after)
+            self._not_before = time.time() + delay
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            key, done_event = job
+            success, retry_after = False, None
+            try:
+                success, retry_after = self.slider._run_refresh(key)
+            except Exception as e:
+                print(f"ERROR: PriceRefreshScheduler: Refresh of {key} raised: {e}")
+            finally:
+                self._record_result(success, retry_after)
+                with self._condition:
+                    self._in_flight.pop(key, None)
+                done_event.set()
 
 class CryptoSlider:
     """
     Manages fetching cryptocurrency conversion rates from Binance API
     and provides methods to access these rates.
     """
-    def __init__(self):
-        # Binance API endpoints for USDT conversion
-        self.usdt_api_endpoints = {
-            "BTC": "https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT",
-            "LTC": "https://api.binance.com/api/v3/ticker/price?symbol=LTCUSDT",
-            "BNB": "https://api.binance.com/api/v3/ticker/price?symbol=BNBUSDT",
-            "POL": "https://api.binance.com/api/v3/ticker/price?symbol=POLYXUSDT", # POLYX is the symbol for POL
-            "XRP": "https://api.binance.com/api/v3/ticker/price?symbol=XRPUSDT",
-            "DOGE": "https://api.binance.com/api/v3/ticker/price?symbol=DOGEUSDT",
-            "ETH": "https://api.binance.com/api/v3/ticker/price?symbol=ETHUSDT",
-            "TRX": "https://api.binance.com/api/v3/ticker/price?symbol=TRXUSDT",
-            "SOL": "https://api.binance.com/api/v3/ticker/price?symbol=SOLUSDT"
+    def __init__(self, base_url=BINANCE_BASE_URL, request_timeout=5, max_workers=9, eur_pricing_mode=EUR_PRICING_DERIVED,
+                 base_dir=None, price_ttl=DEFAULT_PRICE_TTL_SECONDS, price_ttls=None, refresh_interval=DEFAULT_PRICE_TTL_SECONDS,
+                 config_store=None):
+        self.base_url = base_url.rstrip("/")
+        self.request_timeout = request_timeout
+        self.eur_pricing_mode = eur_pricing_mode
+
+        # Per-symbol TTL overrides (seconds); symbols not listed use price_ttl
+        self.price_ttl = price_ttl
+        self.price_ttls = dict(price_ttls or {})
+
+        # Binance trading pairs for USDT conversion
+        self.usdt_pair_symbols = {
+            "BTC": "BTCUSDT",
+            "LTC": "LTCUSDT",
+            "BNB": "BNBUSDT",
+            "POL": "POLYXUSDT", # POLYX is the symbol for POL
+            "XRP": "XRPUSDT",
+            "DOGE": "DOGEUSDT",
+            "ETH": "ETHUSDT",
+            "TRX": "TRXUSDT",
+            "SOL": "SOLUSDT"
         }
 
-        # Binance API endpoints for EUR conversion (NEW)
-        self.eur_api_endpoints = {
-            "BTC": "https://api.binance.com/api/v3/ticker/price?symbol=BTCEUR",
-            "LTC": "https://api.binance.com/api/v3/ticker/price?symbol=LTCEUR",
-            "BNB": "https://api.binance.com/api/v3/ticker/price?symbol=BNBEUR",
-            "POL": "https://api.binance.com/api/v3/ticker/price?symbol=POLYXEUR", # POLYX is the symbol for POL
-            "XRP": "https://api.binance.com/api/v3/ticker/price?symbol=XRPEUR",
-            "DOGE": "https://api.binance.com/api/v3/ticker/price?symbol=DOGEEUR",
-            "ETH": "https://api.binance.com/api/v3/ticker/price?symbol=ETHEUR",
-            "TRX": "https://api.binance.com/api/v3/ticker/price?symbol=TRXEUR",
-            "SOL": "https://api.binance.com/api/v3/ticker/price?symbol=SOLEUR"
+        # Binance trading pairs for EUR conversion
+        self.eur_pair_symbols = {
+            "BTC": "BTCEUR",
+            "LTC": "LTCEUR",
+            "BNB": "BNBEUR",
+            "POL": "POLYXEUR", # POLYX is the symbol for POL
+            "XRP": "XRPEUR",
+            "DOGE": "DOGEEUR",
+            "ETH": "ETHEUR",
+            "TRX": "TRXEUR",
+            "SOL": "SOLEUR"
         }
 
         # Initialize dictionaries to store fetched rates
         self._usdt_rates = {}
         self._eur_rates = {} # New: To store EUR rates
+        # Per-price source ("direct", "derived" or "default"), keyed like the rate dicts
+        self._usdt_sources = {}
+        self._eur_sources = {}
+        # Per-price fetch time (epoch seconds); dummy default rates have none
+        self._usdt_fetched_at = {}
+        self._eur_fetched_at = {}
 
         # Lock for thread-safe access to rates
         self._rates_lock = threading.Lock()
 
-        print("DEBUG: CryptoSlider: Initialized with Binance API URLs.")
+        # Callbacks notified when a fetch completes (see add_rates_listener)
+        self._rates_listeners = []
+
+        # One pooled session (keep-alive) shared by every fetch, sized so the
+        # per-symbol fallback requests can all run at once without opening new connections.
+        # Created by the first fetch, so importing requests stays off the GUI thread at startup
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="CryptoSliderFetch")
+
+        # Rate-limit state reported by the last fetch (Retry-After seconds, or None)
+        self._retry_after = None
+
+        # Every fetch goes through this single scheduler thread
+        self.scheduler = PriceRefreshScheduler(self, refresh_interval=refresh_interval)
+
+        # Last known prices are persisted in the ConfigStore so launches can show them instantly
+        self.config_store = config_store
+        self.legacy_price_cache_path = None
+        if base_dir is not None:
+            self.legacy_price_cache_path = os.path.join(base_dir, "Calconfig", LEGACY_PRICE_CACHE_FILE_NAME)
+            if self.config_store is None:
+                self.config_store = ConfigStore(base_dir).load()
+        if self.config_store is not None:
+            self._load_price_cache()
+
+        if metrics.debug_logging:
+            print(f"DEBUG: CryptoSlider: Initialized with Binance API at {self.base_url}.")
+
+    def _tables(self, currency):
+        """
+        Returns the (rates, sources, fetched_at) dicts for "USDT" or "EUR".
+        """
+        if currency == CURRENCY_EUR:
+            return self._eur_rates, self._eur_sources, self._eur_fetched_at
+        return self._usdt_rates, self._usdt_sources, self._usdt_fetched_at
+
+    def _read_legacy_price_cache(self):
+        if self.legacy_price_cache_path is None or not os.path.exists(self.legacy_price_cache_path):
+            return None
+        try:
+            with open(self.legacy_price_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("version") != LEGACY_PRICE_CACHE_VERSION:
+                return None
+            cache.pop("version")
+            if metrics.debug_logging:
+                print(f"DEBUG: CryptoSlider: Migrating price cache from {self.legacy_price_cache_path}")
+            return cache
+        except (IOError, ValueError, AttributeError) as e:
+            print(f"ERROR: CryptoSlider: Could not read legacy price cache {self.legacy_price_cache_path}: {e}")
+            return None
 
-    def _fetch_rates_for_currency(self, endpoints, target_rates_dict):
+    def _load_price_cache(self):
+        cache = self.config_store.get("price_cache")
+        if cache is None:
+            cache = self._read_legacy_price_cache()
+            if cache is None:
+                if metrics.debug_logging:
+                    print("DEBUG: CryptoSlider: No cached prices yet.")
+                return
+            self.config_store.set("price_cache", cache)
+        try:
+            with self._rates_lock:
+                for currency in (CURRENCY_USDT, CURRENCY_EUR):
+                    rates, sources, fetched_at = self._tables(currency)
+                    for crypto_symbol, entry in cache.get(currency, {}).items():
+                        rates[crypto_symbol] = float(entry['price'])
+                        sources[crypto_symbol] = entry.get('source', PRICE_SOURCE_DIRECT)
+                        if entry.get('fetched_at') is not None:
+                            fetched_at[crypto_symbol] = float(entry['fetched_at'])
+            if metrics.debug_logging:
+                print(f"DEBUG: CryptoSlider: Loaded cached prices from {self.config_store.config_path}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"ERROR: CryptoSlider: Could not read cached prices: {e}")
+
+    def _save_price_cache(self):
+        if self.config_store is None:
+            return
+        with self._rates_lock:
+            cache = {}
+            for currency in (CURRENCY_USDT, CURRENCY_EUR):
+                rates, sources, fetched_at = self._tables(currency)
+                cache[currency] = {
+                    crypto_symbol: {
+                        "price": price,
+                        "source": sources.get(crypto_symbol, PRICE_SOURCE_DIRECT),
+                        "fetched_at": fetched_at.get(crypto_symbol)
+                    }
+                    for crypto_symbol, price in rates.items()
+                }
+        # The store writes it atomically on its debounce timer
+        self.config_store.set("price_cache", cache)
+
+    @property
+    def ticker_price_url(self):
+        return f"{self.base_url}{TICKER_PRICE_PATH}"
+
+    def _get_session(self):
         """
-        Internal helper to fetch rates for a given set of endpoints and store them
-        in the specified target dictionary.
+        Returns the shared requests session, creating it (and importing requests) on first use.
         """
-        fetched_data = {}
-        for crypto_symbol, url in endpoints.items():
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _fetch_batch(self, pair_symbols):
+        """
+        Fetches every pair in one request using the multi-symbol
+        `ticker/price?symbols=[...]` form. Returns {pair: price}; an empty dict
+        means the batch failed (Binance rejects the whole batch if one pair is unknown).
+        """
+        import requests
+        symbols_param = json.dumps(sorted(set(pair_symbols)), separators=(",", ":"))
+        url = self.ticker_price_url
+        prices = {}
+        try:
+            metrics.count("prices.http_requests")
+            with metrics.span("prices.fetch_batch"):
+                response = self._get_session().get(url, params={"symbols": symbols_param}, timeout=self.request_timeout)
+            response.raise_for_status()
+            for entry in response.json():
+                prices[entry['symbol']] = float(entry['price'])
+            if metrics.debug_logging:
+                print(f"DEBUG: Fetched {len(prices)} prices in one batch from {url}")
+        except requests.exceptions.RequestException as e:
+            self._note_rate_limit(e)
+            print(f"ERROR: Batch price fetch from {url} failed, falling back to per-symbol requests: {e}")
+        except json.JSONDecodeError:
+            print(f"ERROR: Could not decode JSON from batch response for {url}")
+        except (KeyError, TypeError):
+            print(f"ERROR: Unexpected batch response format from {url}")
+        except ValueError:
+            print(f"ERROR: Could not convert a batch price to float for {url}")
+        return prices
+
+    def _fetch_single(self, pair_symbol):
+        """
+        Fetches one pair with the single-symbol form. Returns the price or None.
+        """
+        import requests
+        url = self.ticker_price_url
+        try:
+            metrics.count("prices.http_requests")
+            with metrics.span("prices.fetch_single"):
+                response = self._get_session().get(url, params={"symbol": pair_symbol}, timeout=self.request_timeout)
+            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+            data = response.json()
+            price = float(data['price'])
+            if metrics.debug_logging:
+                print(f"DEBUG: Fetched {pair_symbol} price from {url}: {price}")
+            return price
+        except requests.exceptions.RequestException as e:
+            self._note_rate_limit(e)
+            print(f"ERROR: Failed to fetch {pair_symbol} price from {url}: {e}")
+        except json.JSONDecodeError:
+            print(f"ERROR: Could not decode JSON from response for {pair_symbol}")
+        except KeyError:
+            print(f"ERROR: 'price' key not found in JSON response for {pair_symbol}")
+        except ValueError:
+            print(f"ERROR: Could not convert price to float for {pair_symbol}")
+        return None
+
+    def _note_rate_limit(self, exception):
+        response = getattr(exception, 'response', None)
+        if response is not None and response.status_code in RATE_LIMIT_STATUS_CODES:
             try:
-                response = requests.get(url, timeout=5) # 5-second timeout
-                response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-                data = response.json()
-                price = float(data['price'])
-                fetched_data[crypto_symbol] = price
-                print(f"DEBUG: Fetched {crypto_symbol} price from {url}: {price}")
-            except requests.exceptions.RequestException as e:
-                print(f"ERROR: Failed to fetch {crypto_symbol} price from {url}: {e}")
-            except json.JSONDecodeError:
-                print(f"ERROR: Could not decode JSON from response for {url}")
-            except KeyError:
-                print(f"ERROR: 'price' key not found in JSON response for {url}")
+                self._retry_after = float(response.headers.get('Retry-After', 60))
             except ValueError:
-                print(f"ERROR: Could not convert price to float for {url}")
+                self._retry_after = 60.0
+            print(f"ERROR: CryptoSlider: Rate limited by Binance (HTTP {response.status_code}), retry after {self._retry_after}s.")
+
+    def _fetch_pair_prices(self, pair_symbols):
+        """
+        Fetches {pair: price} for the given pairs: one batched request first, then
+        concurrent per-symbol requests for whatever the batch did not return.
+        """
+        prices = self._fetch_batch(pair_symbols)
+        missing = [pair for pair in pair_symbols if pair not in prices]
+        if missing and self._retry_after is not None:
+            return prices # Rate limited: do not hammer the API with per-symbol requests
+        if missing:
+            for pair, price in zip(missing, self._executor.map(self._fetch_single, missing)):
+                if price is not None:
+                    prices[pair] = price
+        return prices
+
+    def _store_rates(self, currency, fetched_data, source, fetched_at_time):
+        """
+        Stores fetched prices, their source and fetch time. Must be called with _rates_lock held.
+        """
+        target_rates_dict, target_sources_dict, target_fetched_at_dict = self._tables(currency)
+        target_rates_dict.update(fetched_data)
+        target_sources_dict.update({crypto_symbol: source for crypto_symbol in fetched_data})
+        target_fetched_at_dict.update({crypto_symbol: fetched_at_time for crypto_symbol in fetched_data})
+        # Add RLT and RST dummy rates as they are not on Binance
+        if "RLT" not in target_rates_dict:
+            target_rates_dict["RLT"] = 0.5 # Default dummy rate for RLT
+            target_sources_dict["RLT"] = PRICE_SOURCE_DEFAULT
+        if "RST" not in target_rates_dict:
+            target_rates_dict["RST"] = 0.0001 # Default dummy rate for RST
+            target_sources_dict["RST"] = PRICE_SOURCE_DEFAULT
+
+    def _fetch_rates_for_currency(self, pair_symbols, currency):
+        """
+        Internal helper to fetch rates for a given {crypto: pair} table and store them
+        in the rate table of the specified currency.
+        """
+        pair_prices = self._fetch_pair_prices(list(pair_symbols.values()))
+        fetched_data = {
+            crypto_symbol: pair_prices[pair]
+            for crypto_symbol, pair in pair_symbols.items()
+            if pair in pair_prices
+        }
+
+        with self._rates_lock:
+            self._store_rates(currency, fetched_data, PRICE_SOURCE_DIRECT, time.time())
+        if metrics.debug_logging:
+            print(f"DEBUG: Updated {currency} rates: {self._tables(currency)[0]}")
+        return bool(fetched_data)
+
+    def _fetch_usdt_and_derived_eur_rates(self):
+        """
+        Fetches every coin once against USDT plus the EUR/USDT cross rate in the same
+        batch, then derives the EUR prices locally. Fills both the USDT and EUR tables.
+        Falls back to the direct EUR pairs if the cross rate is unavailable.
+        Returns True if any price was fetched.
+        """
+        pair_prices = self._fetch_pair_prices(list(self.usdt_pair_symbols.values()) + [EUR_USDT_CROSS_PAIR])
+        usdt_data = {
+            crypto_symbol: pair_prices[pair]
+            for crypto_symbol, pair in self.usdt_pair_symbols.items()
+            if pair in pair_prices
+        }
+        eur_usdt = pair_prices.get(EUR_USDT_CROSS_PAIR)
+        fetched_at_time = time.time()
 
         with self._rates_lock:
-            target_rates_dict.update(fetched_data)
-            # Add RLT and RST dummy rates as they are not on Binance
-            if "RLT" not in target_rates_dict:
-                target_rates_dict["RLT"] = 0.5 # Default dummy rate for RLT
-            if "RST" not in target_rates_dict:
-                target_rates_dict["RST"] = 0.0001 # Default dummy rate for RST
-        print(f"DEBUG: Updated rates: {target_rates_dict}")
+            self._store_rates(CURRENCY_USDT, usdt_data, PRICE_SOURCE_DIRECT, fetched_at_time)
+            if eur_usdt:
+                # Only prices refreshed by this fetch are converted, so stale USDT entries stay stale in EUR too
+                eur_data = {crypto_symbol: self._usdt_rates[crypto_symbol] / eur_usdt for crypto_symbol in usdt_data}
+                self._store_rates(CURRENCY_EUR, eur_data, PRICE_SOURCE_DERIVED, fetched_at_time)
+                for crypto_symbol in ("RLT", "RST"):
+                    # Dummy USDT rates are converted too but stay marked as defaults
+                    if self._usdt_sources.get(crypto_symbol) == PRICE_SOURCE_DEFAULT:
+                        self._eur_rates[crypto_symbol] = self._usdt_rates[crypto_symbol] / eur_usdt
+                        self._eur_sources[crypto_symbol] = PRICE_SOURCE_DEFAULT
+        if metrics.debug_logging:
+            print(f"DEBUG: Updated USDT rates: {self._usdt_rates}")
+
+        if eur_usdt:
+            if metrics.debug_logging:
+                print(f"DEBUG: Derived EUR rates with {EUR_USDT_CROSS_PAIR}={eur_usdt}: {self._eur_rates}")
+        elif usdt_data and self._retry_after is None:
+            print(f"ERROR: {EUR_USDT_CROSS_PAIR} cross rate unavailable, fetching EUR pairs directly.")
+            self._fetch_rates_for_currency(self.eur_pair_symbols, CURRENCY_EUR)
+        return bool(usdt_data)
+
+    def add_rates_listener(self, callback):
+        """
+        Registers callback(updated_rates) to be called when a fetch completes, where
+        updated_rates is {"USDT": {...}} and/or {"EUR": {...}} for the tables that fetch refreshed.
+        The callback runs on the fetch thread; GUI code should hop to its own thread
+        (e.g. by emitting a Qt signal, which is queued across threads).
+        """
+        self._rates_listeners.append(callback)
+
+    def remove_rates_listener(self, callback):
+        if callback in self._rates_listeners:
+            self._rates_listeners.remove(callback)
+
+    def _notify_rates_listeners(self, currencies):
+        with self._rates_lock:
+            updated_rates = {}
+            if CURRENCY_USDT in currencies:
+                updated_rates[CURRENCY_USDT] = self._usdt_rates.copy()
+            if CURRENCY_EUR in currencies:
+                updated_rates[CURRENCY_EUR] = self._eur_rates.copy()
+        for callback in list(self._rates_listeners):
+            try:
+                callback(updated_rates)
+            except Exception as e:
+                print(f"ERROR: CryptoSlider: Rates listener {callback} failed: {e}")
+
+    def _run_refresh(self, currencies):
+        """
+        Called on the scheduler thread: runs one fetch for the given currency tuple, persists
+        the cache and pushes the refreshed tables to the listeners.
+        Returns (success, retry_after_seconds or None).
+        """
+        self._retry_after = None
+        if currencies == (CURRENCY_USDT, CURRENCY_EUR):
+            # The cross rate rides along in the same batch, so EUR prices come for free
+            success = self._fetch_usdt_and_derived_eur_rates()
+        elif currencies == (CURRENCY_EUR,):
+            success = self._fetch_rates_for_currency(self.eur_pair_symbols, CURRENCY_EUR)
+        else:
+            success = self._fetch_rates_for_currency(self.usdt_pair_symbols, CURRENCY_USDT)
+        if success:
+            self._save_price_cache()
+        self._notify_rates_listeners(currencies)
+        return success, self._retry_after
 
     def fetch_usdt_conversion_rates(self):
         """
-        Fetches the latest USDT conversion rates in a separate thread.
+        Requests a refresh of the USDT conversion rates from the background scheduler.
+        Returns a threading.Event set when the fetch completes.
         """
-        print("DEBUG: CryptoSlider: Starting USDT conversion rate fetch.")
-        fetch_thread = threading.Thread(
-            target=self._fetch_rates_for_currency,
-            args=(self.usdt_api_endpoints, self._usdt_rates)
-        )
-        fetch_thread.daemon = True # Allow the thread to exit with the main program
-        fetch_thread.start()
+        if metrics.debug_logging:
+            print("DEBUG: CryptoSlider: Requesting USDT conversion rate fetch.")
+        return self.scheduler.request_refresh(CURRENCY_USDT)
 
     def fetch_euro_conversion_rates(self):
         """
-        Fetches the latest EUR conversion rates in a separate thread. (NEW)
+        Requests a refresh of the EUR conversion rates from the background scheduler. (NEW)
+        Returns a threading.Event set when the fetch completes.
+        """
+        if metrics.debug_logging:
+            print("DEBUG: CryptoSlider: Requesting EUR conversion rate fetch.")
+        return self.scheduler.request_refresh(CURRENCY_EUR)
+
+    def shutdown(self):
+        """
+        Stops the refresh scheduler and the per-symbol request pool.
         """
-        print("DEBUG: CryptoSlider: Starting EUR conversion rate fetch.")
-        fetch_thread = threading.Thread(
-            target=self._fetch_rates_for_currency,
-            args=(self.eur_api_endpoints, self._eur_rates)
-        )
-        fetch_thread.daemon = True # Allow the thread to exit with the main program
-        fetch_thread.start()
+        self.scheduler.stop()
+        self._executor.shutdown(wait=False)
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
 
     def get_usdt_rates(self):
         """
@@ -114,20 +606,99 @@ class CryptoSlider:
         with self._rates_lock:
             return self._eur_rates.copy() # Return a copy to prevent external modification
 
+    def get_price_ttl(self, crypto_symbol):
+        return self.price_ttls.get(crypto_symbol, self.price_ttl)
+
+    def get_price_ages(self, currency):
+        """
+        Returns {crypto: age in seconds} for the stored prices of "USDT" or "EUR".
+        Dummy default rates that were never fetched have an age of None.
+        """
+        now = time.time()
+        with self._rates_lock:
+            rates, _, fetched_at = self._tables(currency)
+            return {
+                crypto_symbol: (now - fetched_at[crypto_symbol]) if crypto_symbol in fetched_at else None
+                for crypto_symbol in rates
+            }
+
+    def get_stale_symbols(self, currency):
+        """
+        Returns the Binance-listed coins whose price for "USDT" or "EUR" is missing
+        or older than its TTL.
+        """
+        pair_symbols = self.eur_pair_symbols if currency == CURRENCY_EUR else self.usdt_pair_symbols
+        ages = self.get_price_ages(currency)
+        return [
+            crypto_symbol for crypto_symbol in pair_symbols
+            if ages.get(crypto_symbol) is None or ages[crypto_symbol] > self.get_price_ttl(crypto_symbol)
+        ]
+
+    def is_price_stale(self, currency, crypto_symbol):
+        """
+        True if the price is older than its TTL or was never fetched (dummy defaults included).
+        """
+        age = self.get_price_ages(currency).get(crypto_symbol)
+        return age is None or age > self.get_price_ttl(crypto_symbol)
+
+    def refresh_if_stale(self, currency):
+        """
+        Stale-while-revalidate: callers keep reading the cached prices immediately,
+        and a background fetch is started only if some price is missing or expired.
+        Returns True if a fetch was started.
+        """
+        stale_symbols = self.get_stale_symbols(currency)
+        if not stale_symbols:
+            return False
+        if metrics.debug_logging:
+            print(f"DEBUG: CryptoSlider: {currency} prices stale for {stale_symbols}, refreshing in background.")
+        if currency == CURRENCY_EUR:
+            self.fetch_euro_conversion_rates()
+        else:
+            self.fetch_usdt_conversion_rates()
+        return True
+
+    def get_usdt_rate_sources(self):
+        """
+        Returns {crypto: source} for the stored USDT rates ("direct" or "default").
+        """
+        with self._rates_lock:
+            return self._usdt_sources.copy()
+
+    def get_euro_rate_sources(self):
+        """
+        Returns {crypto: source} for the stored EUR rates ("direct", "derived" or "default").
+        """
+        with self._rates_lock:
+            return self._eur_sources.copy()
+
 if __name__ == "__main__":
-    # Example usage for testing
-    slider = CryptoSlider()
+    # Example usage for testing. Pass --stand-in to run against the local
+    # PriceApiStandIn server (simulated latency and an unknown EUR pair) instead of Binance.
+    stand_in = None
+    if "--stand-in" in sys.argv:
+        from PriceApiStandIn import PriceApiStandIn
+        stand_in = PriceApiStandIn(latency=0.5, unknown_symbols={"POLYXEUR", "TRXEUR"}).start()
+        slider = CryptoSlider(base_url=stand_in.base_url)
+    else:
+        slider = CryptoSlider()
 
     print("Fetching USDT rates...")
-    slider.fetch_usdt_conversion_rates()
-    time.sleep(3) # Give thread time to fetch
+    slider.fetch_usdt_conversion_rates().wait(30) # Wait for the fetch to complete
     print("Current USDT Rates:", slider.get_usdt_rates())
 
-    print("\nFetching EUR rates...")
-    slider.fetch_euro_conversion_rates()
-    time.sleep(3) # Give thread time to fetch
+    print("\nFetching EUR rates (5 rapid requests, coalesced into one fetch)...")
+    done_events = [slider.fetch_euro_conversion_rates() for _ in range(5)]
+    for done_event in done_events:
+        done_event.wait(30)
     print("Current EUR Rates:", slider.get_euro_rates())
+    print("EUR Rate Sources:", slider.get_euro_rate_sources())
 
-    # Keep the main thread alive for a bit to allow daemon threads to finish
-    time.sleep(5)
+    slider.shutdown()
+    if stand_in:
+        print(f"Stand-in served {stand_in.request_count} requests.")
+        stand_in.stop()
+    else:
+        # Keep the main thread alive for a bit to allow daemon threads to finish
+        time.sleep(5)
     print("Exiting test.")
@@ -0,0 +1,196 @@
+import os
+import threading
+
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QIcon, QMovie
+
+from PerfMetrics import metrics
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CryptoIcon")
+ANIMATION_EXTENSIONS = (".gif",)
+
+class IconCache:
+    """
+    Process-wide cache of the images in CryptoIcon/.
+
+    Every file is read and decoded once: stills into QImages (which, unlike QPixmaps, may be
+    created off the GUI thread; one per size an .ico holds), animations into their raw bytes.
+    Scaled QPixmaps are cached per (name, width, height), QIcons and QMovies per name, so every
+    caller shares one copy.
+    preload() does the reading and decoding on a background thread at startup; a lookup that
+    comes first simply decodes the file itself.
+
+    Names are looked up case-insensitively, with or without extension: "BTC" finds btc.png.
+    """
+    def __init__(self, icon_dir=ICON_DIR):
+        self.icon_dir = icon_dir
+        self._lock = threading.Lock()
+        self._paths = None   # lowercase file name and stem -> path
+        self._images = {}    # path -> [QImage, ...], empty if it could not be decoded
+        self._raw = {}       # path -> bytes, for animations
+        self._pixmaps = {}   # (path, width, height) -> QPixmap
+        self._icons = {}     # path -> QIcon
+        self._movies = {}    # path -> (QMovie, QBuffer)
+        self._preload_thread = None
+
+    def _list_paths(self):
+        with self._lock:
+            if self._paths is None:
+                paths = {}
+                try:
+                    file_names = sorted(os.listdir(self.icon_dir))
+                except OSError as e:
+                    print(f"ERROR: IconCache: Cannot list {self.icon_dir}: {e}")
+                    file_names = []
+                for file_name in file_names:
+                    path = os.path.join(self.icon_dir, file_name)
+                    key = file_name.lower()
+                    paths[key] = path
+                    paths.setdefault(os.path.splitext(key)[0], path)
+                self._paths = paths
+            return self._paths
+
+    def _path_for(self, name):
+        return self._list_paths().get(name.lower())
+
+    def _decode(self, path):
+        """
+        Reads one file into the cache. Safe to call from any thread.
+        """
+        with self._lock:
+            if path in self._images or path in self._raw:
+                return
+            if path.lower().endswith(ANIMATION_EXTENSIONS):
+                try:
+                    with open(path, "rb") as f:
+                        self._raw[path] = f.read()
+                except OSError as e:
+                    print(f"ERROR: IconCache: Cannot read {path}: {e}")
+                    self._raw[path] = b""
+            else:
+                reader = QImageReader(path)
+                images = []
+                for _ in range(max(1, reader.imageCount())):
+                    image = reader.read()
+                    if image.isNull():
+                        break
+                    images.append(image)
+                    if not reader.jumpToNextImage():
+                        break
+                if not images:
+                    print(f"ERROR: IconCache: Cannot decode {path}: {reader.errorString()}")
+                self._images[path] = images
+
+    def preload(self):
+        """
+        Starts reading and decoding every file of the icon directory on a background thread.
+        Returns immediately; call once the QApplication exists.
+        """
+        if self._preload_thread is not None:
+            return
+        self._preload_thread = threading.Thread(target=self._preload_all, name="IconCachePreload", daemon=True)
+        self._preload_thread.start()
+
+    def _preload_all(self):
+        for path in sorted(set(self._list_paths().values())):
+            self._decode(path)
+        if metrics.debug_logging:
+            print(f"DEBUG: IconCache: Preloaded {len(self._images)} images and {len(self._raw)} animations")
+
+    def wait_for_preload(self, timeout=None):
+        if self._preload_thread is not None:
+            self._preload_thread.join(timeout)
+
+    def image(self, name):
+        """
+        Returns the decoded QImage for name (the largest, for an .ico), or None if there is no such
+        (decodable) file.
+        """
+        path = self._path_for(name)
+        if path is None:
+            return None
+        self._decode(path)
+        images = self._images.get(path)
+        return max(images, key=lambda image: image.width()) if images else None
+
+    def pixmap(self, name, width, height=None):
+        """
+        Returns name scaled to fit width x height (keeping its aspect ratio), or None. GUI thread only.
+        """
+        height = width if height is None else height
+        path = self._path_for(name)
+        if path is None:
+            return None
+        cache_key = (path, width, height)
+        pixmap = self._pixmaps.get(cache_key)
+        if pixmap is None:
+            image = self.image(name)
+            if image is None:
+                return None
+            pixmap = QPixmap.fromImage(image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self._pixmaps[cache_key] = pixmap
+        return pixmap
+
+    def icon(self, name):
+        """
+        Returns a QIcon of name (every size an .ico holds), or None. GUI thread only.
+        """
+        path = self._path_for(name)
+        if path is None:
+            return None
+        icon = self._icons.get(path)
+        if icon is None:
+            self._decode(path)
+            images = self._images.get(path)
+            if not images:
+                return None
+            icon = QIcon()
+            for image in images:
+                icon.addPixmap(QPixmap.fromImage(image))
+            self._icons[path] = icon
+        return icon
+
+    def movie(self, name):
+        """
+        Returns the shared QMovie of an animation (frames cached after the first loop), or None
+        if it is missing or invalid. GUI thread only.
+        """
+        path = self._path_for(name)
+        if path is None or not path.lower().endswith(ANIMATION_EXTENSIONS):
+            return None
+        if path not in self._movies:
+            self._decode(path)
+            buffer = QBuffer()
+            buffer.setData(QByteArray(self._raw.get(path, b"")))
+            buffer.open(QIODevice.ReadOnly)
+            movie = QMovie(buffer, QByteArray())
+            movie.setCacheMode(QMovie.CacheAll)
+            self._movies[path] = (movie, buffer) if movie.isValid() else (None, None)
+        return self._movies[path][0]
+
+_shared_icon_cache = None
+
+def get_icon_cache():
+    """
+    Returns the process-wide IconCache.
+    """
+    global _shared_icon_cache
+    if _shared_icon_cache is None:
+        _shared_icon_cache = IconCache()
+    return _shared_icon_cache
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    cache = get_icon_cache()
+    start = time.perf_counter()
+    cache.preload()
+    cache.wait_for_preload()
+    print(f"Preload: {(time.perf_counter() - start) * 1000:.1f} ms")
+    start = time.perf_counter()
+    for _ in range(1000):
+        cache.pixmap("BTC", 26)
+    print(f"1000 cached lookups: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print("Window icon:", cache.icon("RCICON.ico") is not None, "- GIF:", cache.movie("analyzeboxplaceholder.gif") is not None)
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from PerfMetrics import metrics
+
+class MetricsPanel(QWidget):
+    """
+    Hidden debug window listing p50/p95 latency per span and the counters recorded by
+    PerfMetrics. Opened with Ctrl+Shift+M in the main window; showing it turns recording on.
+    While visible it refreshes once a second; "Export JSON" writes the summary and the raw
+    samples to Calconfig/ for offline analysis.
+    """
+    REFRESH_INTERVAL_MS = 1000
+    SPAN_COLUMNS = ("Span", "Count", "p50 ms", "p95 ms", "Max ms", "Total ms")
+
+    def __init__(self, base_dir, parent=None):
+        super().__init__(parent, Qt.Tool)
+        self.setWindowTitle("Performance Metrics")
+        self.resize(620, 420)
+        self.export_dir = os.path.join(base_dir, "Calconfig")
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.span_table = QTableWidget(0, len(self.SPAN_COLUMNS))
+        self.span_table.setHorizontalHeaderLabels(self.SPAN_COLUMNS)
+        self.span_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.span_table.verticalHeader().setVisible(False)
+        self.span_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.span_table, 3)
+
+        self.counter_table = QTableWidget(0, 2)
+        self.counter_table.setHorizontalHeaderLabels(("Counter", "Value"))
+        self.counter_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.counter_table.verticalHeader().setVisible(False)
+        self.counter_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.counter_table, 1)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        button_layout.addWidget(self.status_label, 1)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        button_layout.addWidget(reset_btn)
+        export_btn = QPushButton("Export JSON")
+        export_btn.clicked.connect(self.export_json)
+        button_layout.addWidget(export_btn)
+        layout.addLayout(button_layout)
+
+    def toggle(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            metrics.enabled = True
+            self.show()
+            self.raise_()
+
+    def showEvent(self, event):
+        self.refresh()
+        self._refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    @staticmethod
+    def _fill_row(table, row, values):
+        for col, value in enumerate(values):
+            text = value if isinstance(value, str) else (f"{value:.2f}" if isinstance(value, float) else str(value))
+            item = table.item(row, col)
+            if item is None:
+                item = QTableWidgetItem()
+                if col > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, col, item)
+            if item.text() != text:
+                item.setText(text)
+
+    def refresh(self):
+        summary = metrics.summary()
+        spans = summary["spans"]
+        self.span_table.setRowCount(len(spans))
+        for row, (name, stats) in enumerate(spans.items()):
+            self._fill_row(self.span_table, row, (
+                name, stats["count"], stats["p50_ms"], stats["p95_ms"], stats["max_ms"], stats["total_ms"]
+            ))
+        counters = summary["counters"]
+        self.counter_table.setRowCount(len(counters))
+        for row, (name, value) in enumerate(counters.items()):
+            self._fill_row(self.counter_table, row, (name, value))
+
+    def _reset(self):
+        metrics.reset()
+        self.refresh()
+
+    def export_json(self):
+        try:
+            os.makedirs(self.export_dir, exist_ok=True)
+            path = os.path.join(self.export_dir, time.strftime("metrics-%Y%m%d-%H%M%S.json"))
+            metrics.export_json(path)
+            self.status_label.setText(f"Exported to {path}")
+            if metrics.debug_logging:
+                print(f"DEBUG: MetricsPanel: Exported metrics to {path}")
+        except (IOError, OSError, TypeError) as e:
+            self.status_label.setText(f"Export failed: {e}")
+            print(f"ERROR: MetricsPanel: Failed to export metrics: {e}")
+
+if __name__ == "__main__":
+    import random
+    app = QApplication(sys.argv)
+    panel = MetricsPanel(os.path.dirname(os.path.abspath(__file__)))
+    panel.toggle()
+
+    def record_demo_samples():
+        with metrics.span("demo.work"):
+            time.sleep(random.uniform(0.0, 0.003))
+        metrics.count("demo.ticks")
+
+    demo_timer = QTimer()
+    demo_timer.timeout.connect(record_demo_samples)
+    demo_timer.start(50)
+    sys.exit(app.exec_())
@@ -0,0 +1,152 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+METRICS_FLAG = "--metrics"
+METRICS_ENV_VAR = "RC_METRICS"       # Set to 1 to record metrics from startup
+DEBUG_LOG_FLAG = "--debug-log"
+DEBUG_LOG_ENV_VAR = "RC_DEBUG_LOG"   # Set to 1 to print the DEBUG lines of the hot paths
+MAX_SAMPLES_PER_SPAN = 1000          # Percentiles are over the most recent samples of each span
+
+_DISABLED_SPAN = nullcontext() # Shared by every span() call while recording is off
+
+class _Span:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class PerfMetrics:
+    """
+    Process-wide latency spans and counters for the hot paths (OCR, parsing, tier lookup,
+    recalculation, persistence, price fetches).
+
+    `with metrics.span("ocr.recognize"):` times a block and `metrics.count("prices.requests")`
+    bumps a counter. While disabled both cost one attribute check; the samples of each span
+    are kept in a bounded deque, so memory stays flat however long the app runs. Safe to use
+    from worker threads.
+
+    debug_logging gates the per-call DEBUG prints of the hot paths, which are off by default
+    because formatting and printing them costs more than the work they describe.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.debug_logging = False
+        self._lock = threading.Lock()
+        self._samples = {}  # span name -> deque of recent durations (s)
+        self._totals = {}   # span name -> [count, total s, max s] over every sample
+        self._counters = {} # counter name -> value
+        self._started_at = time.time()
+
+    def configure_from_environment(self, argv=None):
+        """
+        Turns on recording with --metrics / RC_METRICS=1 and the DEBUG prints with
+        --debug-log / RC_DEBUG_LOG=1. The flags are removed from argv.
+        """
+        argv = sys.argv if argv is None else argv
+        for flag, env_var, attribute in ((METRICS_FLAG, METRICS_ENV_VAR, "enabled"),
+                                         (DEBUG_LOG_FLAG, DEBUG_LOG_ENV_VAR, "debug_logging")):
+            if flag in argv:
+                argv.remove(flag)
+                setattr(self, attribute, True)
+            elif os.environ.get(env_var) == "1":
+                setattr(self, attribute, True)
+
+    def span(self, name):
+        if not self.enabled:
+            return _DISABLED_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=MAX_SAMPLES_PER_SPAN)
+                self._totals[name] = [0, 0.0, 0.0]
+            samples.append(seconds)
+            totals = self._totals[name]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] = max(totals[2], seconds)
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+            self._counters.clear()
+            self._started_at = time.time()
+
+    @staticmethod
+    def _percentile(sorted_values, fraction):
+        # Nearest-rank percentile
+        index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+        return sorted_values[index]
+
+    def summary(self):
+        """
+        Returns {"spans": {name: {count, total_ms, max_ms, p50_ms, p95_ms}}, "counters": {...}},
+        with the percentiles over the last MAX_SAMPLES_PER_SPAN samples of each span.
+        """
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            totals = {name: list(values) for name, values in self._totals.items()}
+            counters = dict(self._counters)
+        spans = {}
+        for name in sorted(samples):
+            count, total, longest = totals[name]
+            spans[name] = {
+                "count": count,
+                "total_ms": total * 1000,
+                "max_ms": longest * 1000,
+                "p50_ms": self._percentile(samples[name], 0.50) * 1000,
+                "p95_ms": self._percentile(samples[name], 0.95) * 1000
+            }
+        return {"spans": spans, "counters": dict(sorted(counters.items()))}
+
+    def export_json(self, path):
+        """
+        Writes the summary plus the raw recent samples (ms) of every span to path.
+        """
+        with self._lock:
+            raw_samples = {name: [value * 1000 for value in values] for name, values in self._samples.items()}
+        export = dict(self.summary(), started_at=self._started_at, exported_at=time.time(), samples_ms=raw_samples)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(export, f, indent=2)
+        return path
+
+metrics = PerfMetrics()
+
+if __name__ == "__main__":
+    import random
+    metrics.enabled = True
+    for _ in range(200):
+        with metrics.span("demo.sleep"):
+            time.sleep(random.uniform(0.0, 0.002))
+        metrics.count("demo.iterations")
+    print(json.dumps(metrics.summary(), indent=2))
+    metrics.enabled = False
+    start = time.perf_counter()
+    for _ in range(100000):
+        with metrics.span("demo.disabled"):
+            pass
+    print(f"Disabled span overhead: {(time.perf_counter() - start) * 10:.3f} us per call")
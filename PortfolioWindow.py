@@ -0,0 +1,256 @@
+import os
+import sys
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView, QLineEdit,
+    QFileDialog, QMessageBox, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from rollercoin_core.portfolio import load_accounts, compute_portfolio
+from PerfMetrics import metrics
+
+class PortfolioTableModel(QAbstractTableModel):
+    """
+    Read-only view of a PortfolioResult: one row per account, then one daily reward column
+    per coin. Cells are formatted on demand from the result's arrays, so the view only
+    pays for the rows on screen, however many accounts there are.
+
+    Sorting and the name filter are done here on the arrays (an index permutation) rather
+    than by a QSortFilterProxyModel, which would call data() for every comparison.
+    """
+    FIXED_COLUMNS = ("Account", "Power (Gh/s)", "Tier", "Best coin", "Best USDT/day")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result = None
+        self._order = []      # Result rows in sort order
+        self._rows = []       # Shown rows: _order without the filtered-out accounts
+        self._sort = None     # (column, Qt.SortOrder)
+        self._filter_text = ""
+
+    def set_result(self, result):
+        self.beginResetModel()
+        self.result = result
+        self._order = list(range(len(result)))
+        if self._sort is not None:
+            self._order = self._sorted_rows(*self._sort)
+        self._rows = self._filtered_rows()
+        self.endResetModel()
+
+    def _column_keys(self, column):
+        import numpy as np
+        result = self.result
+        if column == 0:
+            return np.array([name.lower() for name in result.names])
+        if column == 1:
+            return result.powers_ghs
+        if column == 2:
+            return result.tier_index
+        if column == 3:
+            return np.array(result.coins + [""])[result.best_coin_index] # -1 (no best coin) picks ""
+        if column == 4:
+            return result.daily_value.max(axis=1, initial=0.0)
+        return result.daily[:, column - len(self.FIXED_COLUMNS)]
+
+    def _sorted_rows(self, column, order):
+        import numpy as np
+        rows = np.argsort(self._column_keys(column), kind='stable')
+        return (rows[::-1] if order == Qt.DescendingOrder else rows).tolist()
+
+    def _filtered_rows(self):
+        if not self._filter_text:
+            return self._order
+        names = self.result.names
+        return [row for row in self._order if self._filter_text in names[row].lower()]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort = (column, order)
+        if self.result is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._order = self._sorted_rows(column, order)
+        self._rows = self._filtered_rows()
+        self.layoutChanged.emit()
+
+    def set_name_filter(self, text):
+        self._filter_text = text.strip().lower()
+        if self.result is None:
+            return
+        self.beginResetModel()
+        self._rows = self._filtered_rows()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.FIXED_COLUMNS) + (len(self.result.coins) if self.result is not None else 0)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return None
+        if section < len(self.FIXED_COLUMNS):
+            return self.FIXED_COLUMNS[section]
+        return f"{self.result.coins[section - len(self.FIXED_COLUMNS)]}/day"
+
+    def _value(self, row, col):
+        result = self.result
+        if col == 0:
+            return result.names[row]
+        if col == 1:
+            return float(result.powers_ghs[row])
+        if col == 2:
+            return int(result.tier_index[row])
+        if col == 3:
+            return result.best_coin(row) or ""
+        if col == 4:
+            return result.best_daily_value(row)
+        return float(result.daily[row, col - len(self.FIXED_COLUMNS)])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.result is None:
+            return None
+        row, col = self._rows[index.row()], index.column()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter if col == 0 else Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+        if col == 2:
+            return self.result.tier(row)
+        value = self._value(row, col)
+        if isinstance(value, float):
+            return f"{value:.6g}" if value else "0"
+        return value
+
+class PortfolioWindow(QWidget):
+    """
+    Portfolio mode: loads many accounts (CSV or JSON, see rollercoin_core.portfolio.load_accounts)
+    and computes every account's tier and per-coin daily rewards against the network snapshot
+    currently in the calculator, in one vectorized pass. Shows per-account best coins and
+    portfolio totals; the table sorts by any column and filters by name.
+
+    snapshot_provider returns (network, usdt_prices) as compute_portfolio takes them.
+    """
+    def __init__(self, snapshot_provider, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Portfolio")
+        self.resize(1100, 600)
+        self.snapshot_provider = snapshot_provider
+        self.accounts = []
+        self.accounts_path = None
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        load_btn = QPushButton("Load accounts...")
+        load_btn.clicked.connect(self._choose_accounts_file)
+        controls.addWidget(load_btn)
+        refresh_btn = QPushButton("Recalculate")
+        refresh_btn.setToolTip("Recompute with the network power, block data and prices now in the calculator")
+        refresh_btn.clicked.connect(self.recalculate)
+        controls.addWidget(refresh_btn)
+        self.export_btn = QPushButton("Export CSV...")
+        self.export_btn.clicked.connect(self._export_csv)
+        self.export_btn.setEnabled(False)
+        controls.addWidget(self.export_btn)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter accounts")
+        controls.addWidget(self.filter_input, 1)
+        layout.addLayout(controls)
+
+        self.model = PortfolioTableModel(self)
+        self.filter_input.textChanged.connect(self.model.set_name_filter)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(22)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        layout.addWidget(self.table_view, 1)
+
+        self.summary_label = QLabel("Load a CSV (name,power) or JSON file of accounts.")
+        self.summary_label.setWordWrap(True)
+        self.summary_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.summary_label)
+
+    def _choose_accounts_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load accounts", "", "Accounts (*.csv *.json);;All files (*)")
+        if path:
+            self.load_accounts_file(path)
+
+    def load_accounts_file(self, path):
+        try:
+            with metrics.span("portfolio.load"):
+                accounts = load_accounts(path)
+        except (IOError, OSError, ValueError, KeyError, TypeError) as e:
+            print(f"ERROR: PortfolioWindow: Could not load accounts from {path}: {e}")
+            QMessageBox.warning(self, "Portfolio", f"Could not load accounts from {path}:\n{e}")
+            return
+        self.accounts = accounts
+        self.accounts_path = path
+        self.recalculate()
+
+    def recalculate(self):
+        if not self.accounts:
+            return
+        network, prices = self.snapshot_provider()
+        with metrics.span("portfolio.compute"):
+            result = compute_portfolio(self.accounts, network, prices)
+        self.model.set_result(result)
+        self.export_btn.setEnabled(True)
+        self.table_view.resizeColumnToContents(0)
+        self._show_summary(result)
+
+    def _show_summary(self, result):
+        totals = ", ".join(f"{coin} {total:.6g}" for coin, total in result.coin_totals().items() if total)
+        tiers = ", ".join(f"{tier}: {count}" for tier, count in result.tier_counts().items())
+        missing = [coin for coin, price in zip(result.coins, result.prices) if not price]
+        text = (
+            f"{len(result)} accounts from {os.path.basename(self.accounts_path)}. "
+            f"Best coin per account: {result.best_coin_total_value():.2f} USDT/day in total.\n"
+            f"Daily totals (crypto): {totals or 'none - enter network power and block data in the calculator'}\n"
+            f"Tiers: {tiers}"
+        )
+        if missing:
+            text += f"\nNo USDT price for {', '.join(missing)}: not considered for best coin."
+        self.summary_label.setText(text)
+
+    def _export_csv(self):
+        if self.model.result is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export portfolio", "portfolio.csv", "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            self.model.result.export_csv(path)
+        except (IOError, OSError) as e:
+            QMessageBox.warning(self, "Portfolio", f"Could not write {path}:\n{e}")
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    from rollercoin_core.parsing import KNOWN_TICKERS
+    from rollercoin_core.portfolio import network_snapshot_entry
+
+    rng = random.Random(0)
+    network = {coin: network_snapshot_entry(f"{rng.uniform(1, 900):.3f} Eh/s", "Gh/s", "0.001", "10m 0s") for coin in KNOWN_TICKERS}
+    prices = {coin: rng.uniform(0.1, 100) for coin in KNOWN_TICKERS}
+    accounts_file = os.path.join(tempfile.gettempdir(), "portfolio_demo.csv")
+    with open(accounts_file, "w", encoding="utf-8") as f:
+        f.write("name,power\n")
+        for i in range(5000):
+            f.write(f"acc{i:04d},{rng.uniform(1, 999):.2f} {rng.choice(['Ph/s', 'Eh/s'])}\n")
+
+    app = QApplication(sys.argv)
+    window = PortfolioWindow(lambda: (network, prices))
+    window.load_accounts_file(accounts_file)
+    window.show()
+    sys.exit(app.exec_())
@@ -0,0 +1,141 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+class PriceApiStandIn:
+    """
+    A small local HTTP server that mimics the Binance `/api/v3/ticker/price`
+    endpoint (both the `symbol=` and the `symbols=[...]` forms) so that
+    CryptoSlider can be exercised without touching the real API.
+
+    Latency and failures can be simulated:
+        latency            - seconds to sleep before answering every request
+        failure_rate       - probability (0..1) that a request answers with HTTP 500
+        unknown_symbols    - symbols answered with Binance's 400 "Invalid symbol."
+        rate_limited       - when True every request answers with HTTP 429
+                             and a Retry-After of retry_after seconds
+    """
+    DEFAULT_PRICES = {
+        "BTCUSDT": 60000.0, "LTCUSDT": 80.0, "BNBUSDT": 550.0, "POLYXUSDT": 0.35,
+        "XRPUSDT": 0.6, "DOGEUSDT": 0.12, "ETHUSDT": 3000.0, "TRXUSDT": 0.12,
+        "SOLUSDT": 150.0,
+        "BTCEUR": 55000.0, "LTCEUR": 73.0, "BNBEUR": 505.0, "XRPEUR": 0.55,
+        "DOGEEUR": 0.11, "ETHEUR": 2750.0, "SOLEUR": 138.0,
+        "EURUSDT": 1.09
+    }
+
+    def __init__(self, prices=None, latency=0.0, failure_rate=0.0, unknown_symbols=None, host="127.0.0.1", port=0):
+        self.prices = dict(prices if prices is not None else self.DEFAULT_PRICES)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.unknown_symbols = set(unknown_symbols or [])
+        self.rate_limited = False
+        self.retry_after = 1
+        self.request_count = 0
+        self.request_log = [] # (path, query) of every request served
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _lookup(self, symbol):
+        if symbol in self.unknown_symbols or symbol not in self.prices:
+            return None
+        return {"symbol": symbol, "price": f"{self.prices[symbol]:.8f}"}
+
+    def _make_handler(self):
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass # Keep test output quiet
+
+            def _send_json(self, status, payload, extra_headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                for name, value in (extra_headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                with stand_in._lock:
+                    stand_in.request_count += 1
+                    stand_in.request_log.append((parsed.path, parsed.query))
+
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+
+                if stand_in.rate_limited:
+                    self._send_json(429, {"code": -1003, "msg": "Too many requests."}, {"Retry-After": str(stand_in.retry_after)})
+                    return
+                if stand_in.failure_rate and random.random() < stand_in.failure_rate:
+                    self._send_json(500, {"code": -1000, "msg": "Simulated failure."})
+                    return
+                if parsed.path != "/api/v3/ticker/price":
+                    self._send_json(404, {"code": -1, "msg": "Not found."})
+                    return
+
+                if "symbols" in query:
+                    try:
+                        symbols = json.loads(query["symbols"][0])
+                    except ValueError:
+                        self._send_json(400, {"code": -1100, "msg": "Illegal characters found in parameter 'symbols'."})
+                        return
+                    results = [stand_in._lookup(s) for s in symbols]
+                    # Like Binance, one unknown symbol rejects the whole batch
+                    if any(r is None for r in results):
+                        self._send_json(400, {"code": -1121, "msg": "Invalid symbol."})
+                        return
+                    self._send_json(200, results)
+                elif "symbol" in query:
+                    result = stand_in._lookup(query["symbol"][0])
+                    if result is None:
+                        self._send_json(400, {"code": -1121, "msg": "Invalid symbol."})
+                        return
+                    self._send_json(200, result)
+                else:
+                    self._send_json(200, [{"symbol": s, "price": f"{p:.8f}"} for s, p in stand_in.prices.items()])
+
+        return _Handler
+
+if __name__ == "__main__":
+    # Run the stand-in on a fixed port so it can be used from other scripts
+    server = PriceApiStandIn(port=8765, latency=0.2)
+    server.start()
+    print(f"Price API stand-in listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,136 @@
+# NumPy is imported inside the functions: the first fit or projection pays for it, not app startup
+
+# Horizons projected from the daily reward, in days (keys match CryptoDisplayWidget._original_reward_values)
+PROJECTION_HORIZON_DAYS = {
+    "weekly_reward": 7.0,
+    "monthly_reward": 30.44,
+    "yearly_reward": 365.25
+}
+
+MIN_FIT_SNAPSHOTS = 3     # Fewer points than this and the coin is projected flat
+MIN_FIT_SPAN_DAYS = 3.0   # Snapshots spread over less time than this are projected flat
+MAX_GROWTH_PER_DAY = 0.05 # Fitted growth (and its band) is clamped to +-5%/day
+MAX_EXTRAPOLATION = 4.0   # A horizon longer than this many fit spans is projected flat
+CONFIDENCE_Z = 1.96       # ~95% band on the fitted growth rate
+SECONDS_PER_DAY = 24 * 3600
+
+def fit_network_growth(series_by_coin):
+    """
+    Fits exponential network-power growth, log(power) = a + g * t, for every coin at once
+    with a masked, vectorized least squares.
+
+    Args:
+        series_by_coin (dict): {COIN: [(ts, network_ghs), ...]} in any order.
+
+    Returns:
+        dict: {COIN: (growth_per_day, growth_stderr_per_day, span_days)}. Coins with fewer
+              than MIN_FIT_SNAPSHOTS usable points, or spread over less than MIN_FIT_SPAN_DAYS,
+              get (0.0, 0.0, span_days). Growth is clamped to +-MAX_GROWTH_PER_DAY.
+    """
+    coins = list(series_by_coin)
+    if not coins:
+        return {}
+    max_len = max((len(series) for series in series_by_coin.values()), default=0)
+    if max_len == 0:
+        return {coin: (0.0, 0.0, 0.0) for coin in coins}
+    import numpy as np
+
+    # Pad every series into one (coins x samples) matrix; mask marks real, positive samples
+    t = np.zeros((len(coins), max_len))
+    y = np.zeros((len(coins), max_len))
+    mask = np.zeros((len(coins), max_len), dtype=bool)
+    for row, coin in enumerate(coins):
+        series = series_by_coin[coin]
+        if not series:
+            continue
+        ts, values = np.asarray(series, dtype=float).T
+        valid = values > 0
+        count = len(series)
+        t[row, :count] = (ts - ts.max()) / SECONDS_PER_DAY
+        y[row, :count] = np.log(np.where(valid, values, 1.0))
+        mask[row, :count] = valid
+
+    n = mask.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    t_mean = np.where(mask, t, 0.0).sum(axis=1) / safe_n
+    y_mean = np.where(mask, y, 0.0).sum(axis=1) / safe_n
+    dt = np.where(mask, t - t_mean[:, None], 0.0)
+    dy = np.where(mask, y - y_mean[:, None], 0.0)
+    sxx = (dt * dt).sum(axis=1)
+    sxy = (dt * dy).sum(axis=1)
+    span = np.where(n > 0, np.where(mask, t, -np.inf).max(axis=1) - np.where(mask, t, np.inf).min(axis=1), 0.0)
+
+    # An hour of noise fitted as a trend would compound to absurd yearly rewards
+    fittable = (n >= MIN_FIT_SNAPSHOTS) & (sxx > 0) & (span >= MIN_FIT_SPAN_DAYS)
+    safe_sxx = np.where(fittable, sxx, 1.0)
+    slope = np.where(fittable, sxy / safe_sxx, 0.0)
+    residuals = dy - slope[:, None] * dt
+    sse = (residuals * residuals).sum(axis=1)
+    stderr = np.where(fittable, np.sqrt(sse / np.maximum(n - 2, 1) / safe_sxx), 0.0)
+    slope = np.clip(slope, -MAX_GROWTH_PER_DAY, MAX_GROWTH_PER_DAY)
+
+    return {coin: (float(slope[row]), float(stderr[row]), float(span[row])) for row, coin in enumerate(coins)}
+
+def projected_reward_days(horizon_days, growth_per_day):
+    """
+    Integral of exp(-g * t) over [0, horizon]: how many "days at today's reward" the horizon
+    is worth when network power grows at rate g (the share of the network shrinks as 1/power).
+    Broadcasts over NumPy arrays; g == 0 gives the horizon itself.
+    """
+    import numpy as np
+    horizon_days = np.asarray(horizon_days, dtype=float)
+    growth_per_day = np.asarray(growth_per_day, dtype=float)
+    exponent = growth_per_day * horizon_days
+    flat = np.abs(exponent) < 1e-9
+    safe_growth = np.where(flat, 1.0, growth_per_day)
+    return np.where(flat, horizon_days, -np.expm1(-exponent) / safe_growth)
+
+def project_rewards(daily_rewards, growth_rates, growth_stderrs, fit_spans_days=None,
+                    horizons=PROJECTION_HORIZON_DAYS, z=CONFIDENCE_Z):
+    """
+    Projects daily rewards over each horizon for many coins in one batched call.
+
+    Args:
+        daily_rewards, growth_rates, growth_stderrs: equally long sequences, one entry per coin.
+        fit_spans_days: the days of history behind each fit; a horizon longer than
+            MAX_EXTRAPOLATION spans is projected flat. None trusts every fit for every horizon.
+
+    Returns:
+        dict: {horizon_key: (expected, low, high)}, each a NumPy array with one value per coin.
+              Faster network growth means less reward, so `low` uses growth + z * stderr.
+    """
+    import numpy as np
+    daily = np.asarray(daily_rewards, dtype=float)[:, None]
+    growth = np.asarray(growth_rates, dtype=float)[:, None]
+    spread = z * np.asarray(growth_stderrs, dtype=float)[:, None]
+    horizon_days = np.asarray(list(horizons.values()), dtype=float)[None, :]
+    if fit_spans_days is not None:
+        trusted = horizon_days <= MAX_EXTRAPOLATION * np.asarray(fit_spans_days, dtype=float)[:, None]
+        growth = np.where(trusted, growth, 0.0)
+        spread = np.where(trusted, spread, 0.0)
+
+    def reward_days(rate):
+        return projected_reward_days(horizon_days, np.clip(rate, -MAX_GROWTH_PER_DAY, MAX_GROWTH_PER_DAY))
+
+    expected = daily * reward_days(growth)
+    low = daily * reward_days(growth + spread)
+    high = daily * reward_days(growth - spread)
+    return {key: (expected[:, col], low[:, col], high[:, col]) for col, key in enumerate(horizons)}
+
+if __name__ == "__main__":
+    import time
+    import numpy as np
+    now = time.time()
+    # BTC network growing ~1%/day, LTC flat, SOL with a single snapshot
+    history = {
+        "BTC": [(now - d * SECONDS_PER_DAY, 1e12 * np.exp(-0.01 * d) * (1 + 0.002 * np.sin(d))) for d in range(30)],
+        "LTC": [(now - d * SECONDS_PER_DAY, 5e11) for d in range(30)],
+        "SOL": [(now, 2e11)]
+    }
+    fits = fit_network_growth(history)
+    print("Fits:", fits)
+    coins = list(fits)
+    projections = project_rewards([1.0] * len(coins), *zip(*(fits[c] for c in coins)))
+    for key, (expected, low, high) in projections.items():
+        for i, coin in enumerate(coins):
+            print(f"{coin} {key}: {expected[i]:.3f} ({low[i]:.3f} - {high[i]:.3f}) days of today's reward")
@@ -0,0 +1,189 @@
+import math
+import threading
+import time
+from collections import deque
+
+# Rolling windows kept per coin and metric, in seconds
+ROLLING_WINDOWS = {
+    "24h": 24 * 3600,
+    "7d": 7 * 24 * 3600,
+    "30d": 30 * 24 * 3600
+}
+
+# Snapshot fields the analytics follow (see SnapshotHistory.SNAPSHOT_COIN_FIELDS)
+ROLLING_METRICS = ("network_ghs", "daily_reward")
+
+DEFAULT_EWMA_HALF_LIFE_SECONDS = 6 * 3600
+
+class RollingWindow:
+    """
+    Mean, min and max of the samples from the last span_seconds.
+    Each add()/evict() is amortized O(1): a running sum gives the mean, and two
+    monotonic deques keep the current min and max at their fronts.
+    """
+    def __init__(self, span_seconds):
+        self.span_seconds = span_seconds
+        self._samples = deque()    # (ts, value), oldest first
+        self._min_candidates = deque() # (ts, value), values increasing
+        self._max_candidates = deque() # (ts, value), values decreasing
+        self._sum = 0.0
+
+    def add(self, ts, value):
+        self._samples.append((ts, value))
+        self._sum += value
+        while self._min_candidates and self._min_candidates[-1][1] >= value:
+            self._min_candidates.pop()
+        self._min_candidates.append((ts, value))
+        while self._max_candidates and self._max_candidates[-1][1] <= value:
+            self._max_candidates.pop()
+        self._max_candidates.append((ts, value))
+        self.evict(ts)
+
+    def evict(self, now):
+        """
+        Drops samples older than now - span_seconds.
+        """
+        cutoff = now - self.span_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            _, value = self._samples.popleft()
+            self._sum -= value
+        while self._min_candidates and self._min_candidates[0][0] < cutoff:
+            self._min_candidates.popleft()
+        while self._max_candidates and self._max_candidates[0][0] < cutoff:
+            self._max_candidates.popleft()
+        if not self._samples:
+            self._sum = 0.0 # Reset so float drift does not outlive the samples
+
+    @property
+    def count(self):
+        return len(self._samples)
+
+    @property
+    def mean(self):
+        return self._sum / len(self._samples) if self._samples else None
+
+    @property
+    def minimum(self):
+        return self._min_candidates[0][1] if self._min_candidates else None
+
+    @property
+    def maximum(self):
+        return self._max_candidates[0][1] if self._max_candidates else None
+
+class TimeWeightedEwma:
+    """
+    Exponentially weighted moving average for irregularly spaced samples: the weight
+    of the previous average decays with the time since it was updated.
+    """
+    def __init__(self, half_life_seconds=DEFAULT_EWMA_HALF_LIFE_SECONDS):
+        self.half_life_seconds = half_life_seconds
+        self.value = None
+        self._last_ts = None
+
+    def add(self, ts, value):
+        if self.value is None:
+            self.value = value
+        else:
+            elapsed = max(0.0, ts - self._last_ts)
+            keep = math.pow(0.5, elapsed / self.half_life_seconds)
+            self.value = keep * self.value + (1.0 - keep) * value
+        self._last_ts = ts
+
+class RollingAnalytics:
+    """
+    Per-league, per-coin rolling statistics (moving average, min, max over ROLLING_WINDOWS,
+    plus an EWMA) of network power and projected daily reward. Network power differs from
+    league to league, so samples taken in different tiers are never mixed.
+
+    Fed one snapshot at a time via add_snapshot(), typically as a SnapshotHistory listener;
+    get_stats() answers from the maintained state without scanning history. Thread safe.
+    """
+    def __init__(self, windows=None, metrics=ROLLING_METRICS, ewma_half_life_seconds=DEFAULT_EWMA_HALF_LIFE_SECONDS):
+        self.windows = dict(windows if windows is not None else ROLLING_WINDOWS)
+        self.metrics = tuple(metrics)
+        self.ewma_half_life_seconds = ewma_half_life_seconds
+        self._lock = threading.Lock()
+        self._windows = {} # (tier, coin, metric, window_name) -> RollingWindow
+        self._ewmas = {}   # (tier, coin, metric) -> TimeWeightedEwma
+
+    def _add_sample(self, tier, coin, metric, ts, value):
+        for window_name, span_seconds in self.windows.items():
+            key = (tier, coin, metric, window_name)
+            if key not in self._windows:
+                self._windows[key] = RollingWindow(span_seconds)
+            self._windows[key].add(ts, value)
+        if (tier, coin, metric) not in self._ewmas:
+            self._ewmas[(tier, coin, metric)] = TimeWeightedEwma(self.ewma_half_life_seconds)
+        self._ewmas[(tier, coin, metric)].add(ts, value)
+
+    def add_snapshot(self, snapshot):
+        """
+        Folds one snapshot ({"ts": ..., "tier": ..., "coins": {COIN: {metric: value}}}) into the
+        statistics of its tier. Missing (None) values are skipped. Returns the coins that were updated.
+        """
+        updated_coins = []
+        tier = snapshot.get("tier")
+        with self._lock:
+            for coin, values in snapshot.get("coins", {}).items():
+                updated = False
+                for metric in self.metrics:
+                    value = values.get(metric)
+                    if value is None:
+                        continue
+                    self._add_sample(tier, coin, metric, snapshot["ts"], float(value))
+                    updated = True
+                if updated:
+                    updated_coins.append(coin)
+        return updated_coins
+
+    def seed_from_history(self, history, coins):
+        """
+        Replays the longest window of stored snapshots for the given coins. Done once at
+        startup; afterwards the statistics are only updated incrementally.
+        """
+        since_ts = time.time() - max(self.windows.values())
+        fields = self.metrics + ("tier",)
+        with self._lock:
+            for coin in coins:
+                for ts, values in history.fetch_coin_history(coin, since_ts=since_ts, fields=fields):
+                    for metric in self.metrics:
+                        if values.get(metric) is not None:
+                            self._add_sample(values["tier"], coin, metric, ts, float(values[metric]))
+
+    def get_stats(self, tier, coin, metric, window_name, now=None):
+        """
+        Returns {'mean', 'min', 'max', 'ewma', 'count'} for one tier/coin/metric/window, or None
+        if nothing was recorded for it. Samples that have aged out of the window are dropped first.
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            window = self._windows.get((tier, coin, metric, window_name))
+            if window is None:
+                return None
+            window.evict(now)
+            ewma = self._ewmas.get((tier, coin, metric))
+            return {
+                'mean': window.mean,
+                'min': window.minimum,
+                'max': window.maximum,
+                'ewma': ewma.value if ewma is not None else None,
+                'count': window.count
+            }
+
+    def get_window_samples(self, tier, coin, metric, window_name):
+        """
+        Returns a copy of the [(ts, value), ...] samples currently inside one window, oldest first.
+        """
+        with self._lock:
+            window = self._windows.get((tier, coin, metric, window_name))
+            return list(window._samples) if window is not None else []
+
+if __name__ == "__main__":
+    analytics = RollingAnalytics()
+    start = time.time() - 40 * 24 * 3600
+    # One snapshot per hour for 40 days, network power slowly rising
+    for hour in range(40 * 24):
+        ts = start + hour * 3600
+        analytics.add_snapshot({"ts": ts, "tier": "Gold I", "coins": {"BTC": {"network_ghs": 1e12 + hour * 1e9, "daily_reward": 0.001}}})
+    for window_name in ROLLING_WINDOWS:
+        print(window_name, analytics.get_stats("Gold I", "BTC", "network_ghs", window_name))
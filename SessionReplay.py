@@ -0,0 +1,254 @@
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PerfMetrics import metrics
+from Leagues_Info import TIER_CRYPTO_MAPPING
+
+SESSION_FORMAT_VERSION = 1
+RECORD_SESSION_FLAG = "--record-session"    # Followed by the file to record to
+RECORD_SESSION_ENV_VAR = "RC_RECORD_SESSION" # Or the file name in this variable
+MAIN_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Calculator - MAIN.py")
+
+# Recorded actions and their fields
+ACTION_POWER_TEXT = "power_text"   # text: the whole power box after the keystroke
+ACTION_TIER = "tier"               # tier: picked from the tier combo
+ACTION_CURRENCY = "currency"       # currency: picked from the currency combo
+ACTION_PASTE_TEXT = "paste_text"   # text: pasted value text that was parsed
+ACTION_CLEAR_PASTE = "clear_paste"
+ACTION_CELL_EDIT = "cell_edit"     # coin, key, text: a table cell after the keystroke
+
+MAX_IDLE_WAIT_ITERATIONS = 10000 # Guards the replay against work that never settles
+
+class SessionRecorder:
+    """
+    Logs user input on a MainWindow as JSON lines with timestamps, for SessionReplayer.
+
+    Inputs are recorded at the widget level (the text of the power box after each keystroke,
+    the picked tier, a parsed paste, ...) rather than as raw key events, so a replay drives
+    the same code paths no matter the window geometry or focus. Screenshot OCR is not
+    recorded: replaying it needs PaddleOCR and the image.
+    """
+    def __init__(self, window, path):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._start = time.perf_counter()
+        self._write({"format": SESSION_FORMAT_VERSION, "recorded_at": time.time()})
+
+        analyzer = window.image_analyzer_widget
+        display = window.crypto_display_widget
+        paste_widget = analyzer.value_paste_widget
+        analyzer.power_input_box.textEdited.connect(lambda text: self.record(ACTION_POWER_TEXT, text=text))
+        analyzer.global_tier_combo.activated.connect(
+            lambda index: self.record(ACTION_TIER, tier=analyzer.global_tier_combo.itemText(index))
+        )
+        display.currency_combo.activated.connect(
+            lambda index: self.record(ACTION_CURRENCY, currency=display.currency_combo.itemText(index))
+        )
+        paste_widget.pasted_data_parsed.connect(
+            lambda _: self.record(ACTION_PASTE_TEXT, text=paste_widget.text_input.toPlainText())
+        )
+        paste_widget.data_cleared.connect(lambda: self.record(ACTION_CLEAR_PASTE))
+        display.table_model.cell_edited.connect(
+            lambda coin, key: self.record(ACTION_CELL_EDIT, coin=coin, key=key, text=display.table_model.cell_text(coin, key))
+        )
+        if metrics.debug_logging:
+            print(f"DEBUG: SessionRecorder: Recording user input to {path}")
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def record(self, action, **fields):
+        if self._file.closed:
+            return
+        self._write(dict(t=round(time.perf_counter() - self._start, 4), action=action, **fields))
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+def start_session_recording_if_requested(app, window, argv=None):
+    """
+    Starts a SessionRecorder if argv holds --record-session FILE (both are then removed)
+    or RC_RECORD_SESSION names a file. Returns the recorder, or None.
+    """
+    argv = sys.argv if argv is None else argv
+    path = None
+    if RECORD_SESSION_FLAG in argv:
+        index = argv.index(RECORD_SESSION_FLAG)
+        path = argv[index + 1] if index + 1 < len(argv) else None
+        del argv[index:index + 2]
+        if path is None:
+            print(f"ERROR: SessionRecorder: {RECORD_SESSION_FLAG} needs a file name")
+    else:
+        path = os.environ.get(RECORD_SESSION_ENV_VAR)
+    if not path:
+        return None
+    recorder = SessionRecorder(window, path)
+    app.aboutToQuit.connect(recorder.close)
+    return recorder
+
+def load_session(path):
+    """
+    Returns the recorded actions of a session file, in order.
+    """
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "format" in entry:
+                if entry["format"] != SESSION_FORMAT_VERSION:
+                    raise ValueError(f"{path}: unsupported session format {entry['format']}")
+                continue
+            if "action" not in entry:
+                raise ValueError(f"{path}:{line_number}: entry without an action")
+            events.append(entry)
+    return events
+
+def synthetic_session(action_count=200, seed=0):
+    """
+    Generates a plausible session: power typed one keystroke at a time, tier and currency
+    picks, value pastes and block reward edits.
+    """
+    rng = random.Random(seed)
+    tiers = list(TIER_CRYPTO_MAPPING)
+    events = []
+    while len(events) < action_count:
+        kind = rng.random()
+        if kind < 0.35:
+            power = f"{rng.uniform(0.1, 999):.3f} {rng.choice(['Ph/s', 'Eh/s'])}"
+            events.extend({"action": ACTION_POWER_TEXT, "text": power[:end]} for end in range(1, len(power) + 1))
+        elif kind < 0.65:
+            coins = rng.sample(TIER_CRYPTO_MAPPING[tiers[-1]], 5)
+            text = "\n".join(f"{coin}\n{rng.uniform(1, 999):.3f} {rng.choice(['Ph/s', 'Eh/s'])}" for coin in coins)
+            events.append({"action": ACTION_PASTE_TEXT, "text": text})
+        elif kind < 0.75:
+            events.append({"action": ACTION_TIER, "tier": rng.choice(tiers)})
+        elif kind < 0.9:
+            events.append({"action": ACTION_CURRENCY, "currency": rng.choice(["Crypto", "USDT", "Euro"])})
+        else:
+            reward = f"{rng.uniform(0.0001, 0.01):.5f}"
+            coin = rng.choice(TIER_CRYPTO_MAPPING[tiers[0]])
+            events.extend({"action": ACTION_CELL_EDIT, "coin": coin, "key": "block_reward_output", "text": reward[:end]}
+                          for end in range(1, len(reward) + 1))
+    return events[:action_count]
+
+class SessionReplayer:
+    """
+    Replays recorded actions on a MainWindow as fast as possible.
+
+    Each action is applied the way the widget would receive it, then the event loop is run
+    until the UI is idle again: the analysis debounce timer is fired at once instead of
+    after its 200 ms, and the pass waits for the coalesced recalculation to finish. The
+    time from applying an action to idle is recorded as the "replay.<action>" span.
+    """
+    def __init__(self, app, window):
+        self.app = app
+        self.window = window
+        self.analyzer = window.image_analyzer_widget
+        self.display = window.crypto_display_widget
+
+    def wait_until_idle(self):
+        for _ in range(MAX_IDLE_WAIT_ITERATIONS):
+            self.app.processEvents()
+            if self.analyzer.analysis_debounce_timer.isActive():
+                self.analyzer.analysis_debounce_timer.stop()
+                self.analyzer.analyze_image()
+                continue
+            if (self.display._recalc_timer.isActive() or self.display._dirty_reward_cryptos
+                    or self.display._dirty_display_cryptos):
+                continue
+            return
+        print("ERROR: SessionReplayer: UI did not become idle")
+
+    def apply(self, event):
+        action = event["action"]
+        if action == ACTION_POWER_TEXT:
+            self.analyzer.power_input_box.setText(event["text"])
+        elif action == ACTION_TIER:
+            combo = self.analyzer.global_tier_combo
+            combo.setCurrentIndex(combo.findText(event["tier"]))
+        elif action == ACTION_CURRENCY:
+            combo = self.display.currency_combo
+            combo.setCurrentIndex(combo.findText(event["currency"]))
+        elif action == ACTION_PASTE_TEXT:
+            paste_widget = self.analyzer.value_paste_widget
+            paste_widget.text_input.setPlainText(event["text"])
+            paste_widget._parse_and_emit_data()
+        elif action == ACTION_CLEAR_PASTE:
+            self.analyzer.value_paste_widget._clear_text_and_emit_signal()
+        elif action == ACTION_CELL_EDIT:
+            model = self.display.table_model
+            index = model.index(model.coins.index(event["coin"]), model.column_of(event["key"]))
+            model.setData(index, event["text"])
+        else:
+            print(f"ERROR: SessionReplayer: Unknown action {action!r}, skipped")
+
+    def run(self, events, repeat=1):
+        """
+        Replays events repeat times. Returns (actions replayed, seconds).
+        """
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for event in events:
+                with metrics.span(f"replay.{event['action']}"):
+                    self.apply(event)
+                    self.wait_until_idle()
+        return len(events) * repeat, time.perf_counter() - start
+
+def _load_main_window_class():
+    spec = importlib.util.spec_from_file_location("calculator_main", MAIN_SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MainWindow
+
+def print_replay_report(action_count, seconds):
+    summary = metrics.summary()
+    print(f"=== Replayed {action_count} actions in {seconds:.2f} s: {action_count / seconds:.1f} actions/s ===")
+    print(f"{'':<32} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'total ms':>9}")
+    replay_spans = [name for name in summary["spans"] if name.startswith("replay.")]
+    other_spans = [name for name in summary["spans"] if not name.startswith("replay.")]
+    for names in (replay_spans, other_spans):
+        for name in names:
+            stats = summary["spans"][name]
+            print(f"{name:<32} {stats['count']:>6} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+                  f"{stats['max_ms']:>8.2f} {stats['total_ms']:>9.1f}")
+        print()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replays a recorded session on MainWindow, headless, as fast as possible")
+    parser.add_argument("session", nargs="?", help="Session file written with --record-session; omit for a synthetic one")
+    parser.add_argument("--synthetic", type=int, default=300, metavar="N", help="Actions in the synthetic session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--json", metavar="FILE", help="Also export the metrics to FILE")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from PriceApiStandIn import PriceApiStandIn
+
+    events = load_session(args.session) if args.session else synthetic_session(args.synthetic, args.seed)
+    app = QApplication(sys.argv[:1])
+    MainWindow = _load_main_window_class()
+    with PriceApiStandIn() as stand_in, tempfile.TemporaryDirectory() as data_dir:
+        window = MainWindow(data_dir=data_dir, price_api_base_url=stand_in.base_url)
+        window.show()
+        replayer = SessionReplayer(app, window)
+        replayer.wait_until_idle()
+        metrics.enabled = True
+        metrics.reset()
+        action_count, seconds = replayer.run(events, args.repeat)
+        metrics.enabled = False
+        window.close() # Flushes and stops the writers before the data dir goes away
+    print_replay_report(action_count, seconds)
+    if args.json:
+        metrics.export_json(args.json)
@@ -0,0 +1,186 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from PerfMetrics import metrics
+
+# Where a snapshot's network power numbers came from
+SNAPSHOT_SOURCE_OCR = "ocr"
+SNAPSHOT_SOURCE_PASTE = "paste"
+SNAPSHOT_SOURCE_MANUAL = "manual"
+
+# Per-coin fields stored with every snapshot
+SNAPSHOT_COIN_FIELDS = (
+    "network_ghs", "block_reward", "block_duration_s",
+    "price_usdt", "price_eur", "reward_per_block", "daily_reward"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    source TEXT NOT NULL,
+    user_power_ghs REAL,
+    tier TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshot_coins (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    coin TEXT NOT NULL,
+    ts REAL NOT NULL,
+    network_ghs REAL,
+    block_reward REAL,
+    block_duration_s REAL,
+    price_usdt REAL,
+    price_eur REAL,
+    reward_per_block REAL,
+    daily_reward REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshot_coins_coin_ts ON snapshot_coins(coin, ts);
+CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON snapshots(ts);
+"""
+
+class SnapshotHistory:
+    """
+    Appends network-power snapshots and the rewards computed from them to a local
+    SQLite database (Calconfig/history.sqlite3).
+
+    record_snapshot() only puts the snapshot on a queue; a background writer thread
+    owns the write connection and commits whatever has queued up in one transaction,
+    so recording never adds database latency to the caller.
+    """
+    DB_FILE_NAME = "history.sqlite3"
+
+    def __init__(self, base_dir, batch_size=200, batch_wait_seconds=0.5):
+        self.config_dir = os.path.join(base_dir, "Calconfig")
+        self.db_path = os.path.join(self.config_dir, self.DB_FILE_NAME)
+        self.batch_size = batch_size
+        self.batch_wait_seconds = batch_wait_seconds
+
+        self._queue = queue.Queue()
+        self._listeners = []
+        self._closed = False
+        os.makedirs(self.config_dir, exist_ok=True)
+
+        # Create the schema up front so readers never see a missing table
+        connection = self._connect()
+        connection.executescript(_SCHEMA)
+        connection.close()
+
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="SnapshotHistoryWriter", daemon=True)
+        self._writer_thread.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL") # Readers do not block the writer
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def add_listener(self, callback):
+        """
+        Registers callback(snapshot) called on the writer thread after each snapshot is committed.
+        """
+        self._listeners.append(callback)
+
+    def record_snapshot(self, source, user_power_ghs, tier, coins, ts=None):
+        """
+        Queues one snapshot. coins is {COIN: {field: value}} with fields from SNAPSHOT_COIN_FIELDS
+        (missing fields are stored as NULL). Returns immediately.
+        """
+        if self._closed:
+            return
+        self._queue.put({
+            "ts": ts if ts is not None else time.time(),
+            "source": source,
+            "user_power_ghs": user_power_ghs,
+            "tier": tier,
+            "coins": {coin: dict(values) for coin, values in coins.items()}
+        })
+
+    def _writer_loop(self):
+        connection = self._connect()
+        try:
+            while True:
+                snapshot = self._queue.get()
+                if snapshot is None:
+                    return
+                batch = [snapshot]
+                stop_after_batch = False
+                # Gather whatever else arrives shortly, so bursts share one transaction
+                deadline = time.time() + self.batch_wait_seconds
+                while len(batch) < self.batch_size:
+                    try:
+                        next_snapshot = self._queue.get(timeout=max(0.0, deadline - time.time()))
+                    except queue.Empty:
+                        break
+                    if next_snapshot is None:
+                        stop_after_batch = True
+                        break
+                    batch.append(next_snapshot)
+                self._write_batch(connection, batch)
+                if stop_after_batch:
+                    return
+        finally:
+            connection.close()
+
+    def _write_batch(self, connection, batch):
+        metrics.count("persist.snapshots", len(batch))
+        try:
+            with metrics.span("persist.snapshot_batch"), connection: # One transaction per batch
+                for snapshot in batch:
+                    cursor = connection.execute(
+                        "INSERT INTO snapshots (ts, source, user_power_ghs, tier) VALUES (?, ?, ?, ?)",
+                        (snapshot["ts"], snapshot["source"], snapshot["user_power_ghs"], snapshot["tier"])
+                    )
+                    snapshot_id = cursor.lastrowid
+                    connection.executemany(
+                        "INSERT INTO snapshot_coins (snapshot_id, coin, ts, " + ", ".join(SNAPSHOT_COIN_FIELDS) + ") "
+                        "VALUES (?, ?, ?, " + ", ".join("?" for _ in SNAPSHOT_COIN_FIELDS) + ")",
+                        [
+                            (snapshot_id, coin, snapshot["ts"]) + tuple(values.get(field) for field in SNAPSHOT_COIN_FIELDS)
+                            for coin, values in snapshot["coins"].items()
+                        ]
+                    )
+            if metrics.debug_logging:
+                print(f"DEBUG: SnapshotHistory: Committed {len(batch)} snapshot(s) to {self.db_path}")
+        except sqlite3.Error as e:
+            print(f"ERROR: SnapshotHistory: Failed to write {len(batch)} snapshot(s): {e}")
+            return
+
+        for snapshot in batch:
+            for callback in list(self._listeners):
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    print(f"ERROR: SnapshotHistory: Listener {callback} failed: {e}")
+
+    def fetch_coin_history(self, coin, since_ts=None, fields=SNAPSHOT_COIN_FIELDS):
+        """
+        Returns [(ts, {field: value}), ...] for one coin, oldest first. Uses the (coin, ts) index.
+        fields may also name "tier", the league the snapshot was taken in.
+        Opens its own read connection, so it can be called from any thread.
+        """
+        columns = ", ".join("s.tier" if field == "tier" else f"c.{field}" for field in fields)
+        query = ("SELECT c.ts, " + columns +
+                 " FROM snapshot_coins c JOIN snapshots s ON s.id = c.snapshot_id WHERE c.coin = ?")
+        params = [coin]
+        if since_ts is not None:
+            query += " AND c.ts >= ?"
+            params.append(since_ts)
+        query += " ORDER BY c.ts"
+        connection = self._connect()
+        try:
+            return [(row[0], dict(zip(fields, row[1:]))) for row in connection.execute(query, params)]
+        finally:
+            connection.close()
+
+    def close(self, timeout=5):
+        """
+        Writes everything still queued and stops the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
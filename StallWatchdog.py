@@ -0,0 +1,189 @@
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+
+from PerfMetrics import metrics
+
+STALL_WATCHDOG_FLAG = "--stall-watchdog"
+STALL_WATCHDOG_ENV_VAR = "RC_STALL_WATCHDOG"          # Set to 1 to start the watchdog without the flag
+STALL_THRESHOLD_ENV_VAR = "RC_STALL_THRESHOLD_MS"     # Overrides DEFAULT_STALL_THRESHOLD_MS
+DEFAULT_STALL_THRESHOLD_MS = 50
+PING_INTERVAL_MS = 20   # Pause between two pings while the loop is responsive
+SAMPLE_INTERVAL_MS = 10 # Stack sampling period while a ping is overdue
+REPORTED_STACK_DEPTH = 12
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class StallWatchdog(QObject):
+    """
+    Opt-in detector for GUI event-loop stalls.
+
+    A background thread pings the event loop with a queued signal and waits for the GUI
+    thread to answer. While an answer is overdue by more than the threshold, it samples
+    the GUI thread's Python stack (sys._current_frames) every SAMPLE_INTERVAL_MS. When the
+    loop answers, the stall is attributed to the call site seen in most samples: the
+    innermost frame in this project's code, so a stall inside PyQt or PaddleOCR is blamed
+    on the line that called it. Stalls are aggregated per call site (count, total, worst)
+    and, when metrics recording is on, also recorded as the "ui.event_loop_stall" span.
+    A stall is timed from the first ping it delays, so it may be undercounted by up to
+    PING_INTERVAL_MS.
+
+    Create and start it on the GUI thread.
+    """
+    _ping = pyqtSignal(int)
+
+    def __init__(self, threshold_ms=DEFAULT_STALL_THRESHOLD_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self._main_thread_id = threading.get_ident()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._answered_ping = 0
+        self._answered_at = 0.0
+        self._sites = {} # call site -> [stalls, total s, worst s, example stack]
+        self._ping.connect(self._on_ping, Qt.QueuedConnection)
+
+    def _on_ping(self, ping_id):
+        # Runs on the GUI thread once the event loop gets to the ping
+        self._answered_at = time.perf_counter()
+        self._answered_ping = ping_id
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+        if metrics.debug_logging:
+            print(f"DEBUG: StallWatchdog: Watching the event loop, threshold {self.threshold * 1000:.0f} ms")
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(1.0)
+        self._thread = None
+
+    def _run(self):
+        ping_id = 0
+        while not self._stop_event.is_set():
+            ping_id += 1
+            sent_at = time.perf_counter()
+            self._ping.emit(ping_id)
+            samples = []
+            while self._answered_ping < ping_id:
+                if self._stop_event.wait(SAMPLE_INTERVAL_MS / 1000):
+                    return
+                if self._answered_ping < ping_id and time.perf_counter() - sent_at >= self.threshold:
+                    stack = self._capture_main_stack()
+                    if stack:
+                        samples.append(stack)
+            if samples:
+                self._record_stall(self._answered_at - sent_at, samples)
+            self._stop_event.wait(PING_INTERVAL_MS / 1000)
+
+    def _capture_main_stack(self):
+        frame = sys._current_frames().get(self._main_thread_id)
+        return traceback.extract_stack(frame) if frame is not None else None
+
+    @staticmethod
+    def _call_site(stack):
+        """
+        Returns "File.py:line in function" for the innermost frame of project code in stack.
+        """
+        for frame in reversed(stack):
+            path = os.path.abspath(frame.filename)
+            if path.startswith(PROJECT_DIR) and os.path.basename(path) != os.path.basename(__file__):
+                return f"{os.path.relpath(path, PROJECT_DIR)}:{frame.lineno} in {frame.name}"
+        frame = stack[-1]
+        return f"{os.path.basename(frame.filename)}:{frame.lineno} in {frame.name}"
+
+    def _record_stall(self, duration, samples):
+        site_counts = Counter(self._call_site(stack) for stack in samples)
+        site = site_counts.most_common(1)[0][0]
+        with self._lock:
+            entry = self._sites.get(site)
+            if entry is None:
+                example = "".join(traceback.format_list(samples[0][-REPORTED_STACK_DEPTH:]))
+                entry = self._sites[site] = [0, 0.0, 0.0, example]
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        if metrics.enabled:
+            metrics.record("ui.event_loop_stall", duration)
+            metrics.count("ui.event_loop_stalls")
+        if metrics.debug_logging:
+            print(f"DEBUG: StallWatchdog: Event loop blocked {duration * 1000:.0f} ms at {site}")
+
+    def summary(self):
+        """
+        Returns [{site, stalls, total_ms, worst_ms, stack}, ...], the worst total first.
+        """
+        with self._lock:
+            entries = [(site, list(entry)) for site, entry in self._sites.items()]
+        entries.sort(key=lambda item: item[1][1], reverse=True)
+        return [
+            {"site": site, "stalls": count, "total_ms": total * 1000, "worst_ms": worst * 1000, "stack": stack}
+            for site, (count, total, worst, stack) in entries
+        ]
+
+    def report(self):
+        """
+        Prints the stalls per call site, the worst total first.
+        """
+        summary = self.summary()
+        print(f"=== Event loop stalls over {self.threshold * 1000:.0f} ms: "
+              f"{sum(entry['stalls'] for entry in summary)} at {len(summary)} call site(s) ===")
+        for entry in summary:
+            print(f"{entry['stalls']:4d} x, total {entry['total_ms']:8.1f} ms, worst {entry['worst_ms']:7.1f} ms  {entry['site']}")
+        if summary:
+            print(f"Stack of the first stall at {summary[0]['site']}:")
+            print(summary[0]["stack"], end="")
+
+    def stop_and_report(self):
+        self.stop()
+        self.report()
+
+def start_stall_watchdog_if_requested(app, argv=None):
+    """
+    Starts a StallWatchdog if argv holds --stall-watchdog (which is then removed) or
+    RC_STALL_WATCHDOG=1 is set; its report is printed when the app quits. Returns the
+    watchdog, or None.
+    """
+    argv = sys.argv if argv is None else argv
+    if STALL_WATCHDOG_FLAG in argv:
+        argv.remove(STALL_WATCHDOG_FLAG)
+    elif os.environ.get(STALL_WATCHDOG_ENV_VAR) != "1":
+        return None
+    try:
+        threshold_ms = float(os.environ.get(STALL_THRESHOLD_ENV_VAR, DEFAULT_STALL_THRESHOLD_MS))
+    except ValueError:
+        print(f"ERROR: StallWatchdog: Invalid {STALL_THRESHOLD_ENV_VAR}, using {DEFAULT_STALL_THRESHOLD_MS} ms")
+        threshold_ms = DEFAULT_STALL_THRESHOLD_MS
+    watchdog = StallWatchdog(threshold_ms, app)
+    app.aboutToQuit.connect(watchdog.stop_and_report)
+    watchdog.start()
+    return watchdog
+
+if __name__ == "__main__":
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+    app = QApplication(sys.argv)
+    watchdog = StallWatchdog(threshold_ms=50)
+    watchdog.start()
+
+    def blocking_save():
+        time.sleep(0.12) # Stands in for a synchronous write on the GUI thread
+
+    for delay in (100, 400, 700):
+        QTimer.singleShot(delay, blocking_save)
+    QTimer.singleShot(600, lambda: sum(i * i for i in range(3_000_000)))
+    QTimer.singleShot(1000, app.quit)
+    app.exec_()
+    watchdog.stop_and_report()
@@ -0,0 +1,165 @@
+import builtins
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Only the standard library is imported here: the profiler is imported first so it can time
+# everything else, PyQt5 included.
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+PROFILE_STARTUP_ENV_VAR = "RC_PROFILE_STARTUP" # Set to 1 to profile without the flag
+FIRST_PAINT_TARGET_SECONDS = 1.0 # Launch to first painted window, on a machine without a GPU
+MIN_REPORTED_MS = 1.0 # Imports and spans faster than this are left out of the breakdown
+
+class StartupProfiler:
+    """
+    Records how long app startup spends importing modules and building widgets, and when the
+    main window is first painted.
+
+    Imports are timed by wrapping builtins.__import__ (main thread only, and only modules
+    not loaded yet), keeping both the cumulative time of each import and its self time
+    without the nested imports. Widget construction and other init steps are measured with
+    span(). Everything is a no-op until enable() is called.
+    """
+    def __init__(self):
+        self.enabled = False
+        self._start = time.perf_counter()
+        self._main_thread_id = threading.get_ident()
+        self._original_import = None
+        self._import_stack = [] # time spent in nested imports, one entry per open import
+        self._span_depth = 0
+        self.imports = [] # (module, cumulative s, self s, depth)
+        self.spans = []   # (name, start offset s, duration s, depth)
+        self.first_paint_seconds = None
+
+    def enable_if_requested(self, argv=None):
+        """
+        Enables profiling if argv holds --profile-startup (which is then removed) or
+        RC_PROFILE_STARTUP=1 is set. Returns whether profiling is on.
+        """
+        argv = sys.argv if argv is None else argv
+        if PROFILE_STARTUP_FLAG in argv:
+            argv.remove(PROFILE_STARTUP_FLAG)
+            self.enable()
+        elif os.environ.get(PROFILE_STARTUP_ENV_VAR) == "1":
+            self.enable()
+        return self.enabled
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def disable(self):
+        """
+        Stops timing imports; what was recorded is kept.
+        """
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level != 0 or name in sys.modules or threading.get_ident() != self._main_thread_id:
+            return self._original_import(name, globals, locals, fromlist, level)
+        depth = len(self._import_stack)
+        entry_index = len(self.imports)
+        self.imports.append(None) # Filled in below, so an import is listed before its nested ones
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += cumulative
+            self.imports[entry_index] = (name, cumulative, cumulative - nested, depth)
+
+    @contextmanager
+    def span(self, name):
+        """
+        Times the enclosed block, e.g. `with startup_profiler.span("CryptoDisplayWidget"):`.
+        Spans may nest.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        depth = self._span_depth
+        self._span_depth += 1
+        try:
+            yield
+        finally:
+            self._span_depth -= 1
+            self.spans.append((name, start - self._start, time.perf_counter() - start, depth))
+
+    def mark_first_paint(self):
+        if self.first_paint_seconds is None:
+            self.first_paint_seconds = self.elapsed()
+
+    def report(self):
+        """
+        Prints the import and init breakdown and the time to first paint.
+        """
+        print("=== Startup profile (times in ms, from the profiler import) ===")
+        print("Imports, cumulative (self):")
+        for name, cumulative, self_time, depth in self.imports:
+            if depth <= 1 and cumulative * 1000 >= MIN_REPORTED_MS:
+                print(f"  {'  ' * depth}{name:<{40 - 2 * depth}} {cumulative * 1000:8.1f} ({self_time * 1000:.1f})")
+        slowest = sorted(self.imports, key=lambda entry: entry[2], reverse=True)[:10]
+        print("Slowest imports by self time:")
+        for name, _, self_time, _ in slowest:
+            print(f"  {name:<40} {self_time * 1000:8.1f}")
+        top_level_import_time = sum(cumulative for _, cumulative, _, depth in self.imports if depth == 0)
+        print(f"  Total import time: {top_level_import_time * 1000:.1f}")
+        print("Init spans, start + duration:")
+        for name, start, duration, depth in sorted(self.spans, key=lambda entry: entry[1]):
+            if duration * 1000 >= MIN_REPORTED_MS:
+                print(f"  {'  ' * depth}{name:<{40 - 2 * depth}} {start * 1000:8.1f} + {duration * 1000:.1f}")
+        if self.first_paint_seconds is None:
+            print("Time to first paint: not reached")
+        else:
+            verdict = "met" if self.first_paint_seconds <= FIRST_PAINT_TARGET_SECONDS else "MISSED"
+            print(f"Time to first paint: {self.first_paint_seconds * 1000:.1f} "
+                  f"(target {FIRST_PAINT_TARGET_SECONDS * 1000:.0f}: {verdict})")
+
+startup_profiler = StartupProfiler()
+
+def call_after_first_paint(widget, callback):
+    """
+    Calls callback once, from the event loop, right after widget has been painted for the
+    first time; with profiling on, also records the time to first paint. Used to start
+    slow work (such as loading the OCR models) only once the window is on screen.
+    """
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                watched.removeEventFilter(self)
+                startup_profiler.mark_first_paint()
+                # Deferred, so the paint this event starts finishes first
+                QTimer.singleShot(0, callback)
+                self.deleteLater()
+            return False
+
+    widget.installEventFilter(_FirstPaintFilter(widget))
+
+if __name__ == "__main__":
+    startup_profiler.enable()
+    with startup_profiler.span("Import PyQt5 widgets"):
+        from PyQt5.QtWidgets import QApplication, QLabel
+    with startup_profiler.span("QApplication"):
+        app = QApplication(sys.argv)
+    with startup_profiler.span("Build window"):
+        label = QLabel("Startup profiler demo")
+    call_after_first_paint(label, lambda: (startup_profiler.report(), app.quit()))
+    label.show()
+    sys.exit(app.exec_())
@@ -1,21 +1,11 @@
 import sys
-import re
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QTextEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QApplication
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 
-# Import necessary functions from Leagues_Info.py for power conversion
-try:
-    from Leagues_Info import UNIT_MULTIPLIERS, convert_power_to_ghs
-except ImportError:
-    UNIT_MULTIPLIERS = {"Gh/s": 1, "Th/s": 1e3, "Ph/s": 1e6, "Eh/s": 1e9, "Zh/s": 1e12}
-    def convert_power_to_ghs(value_str, unit, multipliers):
-        try:
-            value = float(value_str.replace(',', ''))
-            return value * multipliers.get(unit, 1)
-        except ValueError:
-            return 0.0
+from rollercoin_core.parsing import KNOWN_TICKERS, match_ticker, parse_pasted_text
+from PerfMetrics import metrics
 
 class ValuePasteWidget(QWidget):
     """
@@ -31,10 +21,7 @@ class ValuePasteWidget(QWidget):
     def __init__(self, known_tickers=None):
         super().__init__()
         self.setFocusPolicy(Qt.NoFocus)
-        self.known_tickers = known_tickers if known_tickers is not None else [
-            "RLT", "RST", "XRP", "TRX", "DOGE",
-            "BTC", "ETH", "BNB", "POL", "SOL", "LTC"
-        ]
+        self.known_tickers = known_tickers if known_tickers is not None else list(KNOWN_TICKERS)
         self.clipboard = QApplication.clipboard()
         self.init_ui()
 
@@ -124,84 +111,12 @@ class ValuePasteWidget(QWidget):
             super().keyPressEvent(event)
 
     def _is_similar_ticker_internal(self, detected_text):
-        if detected_text in self.known_tickers:
-            return detected_text
-
-        error_mappings = {
-            "RRIUT": "RLT", "RRU": "RLT", "R.RU": "RLT", "RLJ": "RLT", "RLY": "RLT",
-            "RSTT": "RST", "RSTU": "RST",
-            "TRXY": "TRX", "YTRX": "TRX", "TX": "TRX",
-            "LIC": "LTC", "LTCC": "LTC",
-            "GC": "DOGE", "DOGE.": "DOGE",
-            "CC": "BTC", "BTCC": "BTC",
-            "EH": "ETH", "ETTH": "ETH",
-            "BNBV": "BNB", "BNN": "BNB",
-            "SOLL": "SOL", "5OL": "SOL",
-            "POOL": "POL", "PQOL": "POL",
-            "XRP": "XRP",
-            "MATIC": "POL",
-        }
-
-        if detected_text in error_mappings:
-            return error_mappings[detected_text]
-
-        for known_ticker in self.known_tickers:
-            if len(detected_text) == len(known_ticker):
-                diff_count = sum(1 for a, b in zip(detected_text, known_ticker) if a != b)
-                if diff_count <= 1:
-                    return known_ticker
-            if known_ticker in detected_text and abs(len(detected_text) - len(known_ticker)) <= 2:
-                return known_ticker
-            if detected_text.startswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
-                return known_ticker
-            if known_ticker.startswith(detected_text) and abs(len(known_ticker) - len(detected_text)) <= 1:
-                return known_ticker
-            if detected_text.endswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
-                return known_ticker
-        return None
+        return match_ticker(detected_text, self.known_tickers)
 
     def _parse_text_data(self):
-        raw_text = self.text_input.toPlainText()
-        lines = raw_text.strip().split('\n')
-        parsed_data = {}
-        current_ticker_context = None
-
-        power_unit_pattern = re.compile(r'(\d[\d,]*\.?\d*)\s*([a-zA-Z/]+)?', re.IGNORECASE)
-
-        known_unit_symbols = {k.upper(): k for k in UNIT_MULTIPLIERS.keys()}
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                current_ticker_context = None
-                continue
-
-            possible_ticker = self._is_similar_ticker_internal(line_stripped.upper())
-            if possible_ticker:
-                current_ticker_context = possible_ticker
-                if current_ticker_context not in parsed_data:
-                    parsed_data[current_ticker_context] = {'rate': "", 'unit': "", 'block_reward': ""}
-                continue
-
-            if current_ticker_context:
-                power_match = power_unit_pattern.match(line_stripped)
-                if power_match:
-                    power_value_str = power_match.group(1).replace(',', '')
-                    power_unit_str_raw = power_match.group(2) if power_match.group(2) else ""
-
-                    effective_unit = power_unit_str_raw
-                    if effective_unit:
-                        effective_unit = known_unit_symbols.get(effective_unit.upper(), effective_unit)
-                        if effective_unit not in UNIT_MULTIPLIERS:
-                            effective_unit = ""
-                    
-                    temp_power_str_for_conversion = power_value_str + (" " + effective_unit if effective_unit else "")
-                    power_in_ghs = convert_power_to_ghs(temp_power_str_for_conversion, effective_unit, UNIT_MULTIPLIERS)
-
-                    if power_in_ghs >= 0 and power_value_str:
-                        parsed_data[current_ticker_context]['rate'] = power_value_str
-                        parsed_data[current_ticker_context]['unit'] = effective_unit if effective_unit else "Gh/s"
-        return parsed_data
+        # Parsing lives in the Qt-free core so scripts can use it without a QApplication
+        with metrics.span("paste.parse"):
+            return parse_pasted_text(self.text_input.toPlainText(), self.known_tickers)
 
     def _parse_and_emit_data(self):
         parsed_data = self._parse_text_data()
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Import the existing single-value helpers so the simulation uses the same parsing and share math
+from reward_calculations import calculate_reward_per_block, calculate_blocks_per_day
+
+# Horizons simulated, in days
+LUCK_HORIZON_DAYS = {
+    "daily": 1.0,
+    "weekly": 7.0,
+    "monthly": 30.44
+}
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_SIMULATIONS = 1_000_000 # Simulated periods per coin and horizon
+DEFAULT_CHUNK_SIZE = 100_000    # Periods drawn at once; bounds memory to chunk_size x coins
+
+def prepare_coin_luck_inputs(user_power_str, user_unit, coin_block_reward_str, network_hashrate_str, network_unit, block_duration_str):
+    """
+    Converts one calculator row into simulation inputs.
+
+    Returns:
+        tuple: (reward_per_block, expected_blocks_per_day). Blocks per day is 0.0 if the duration is unknown.
+    """
+    reward_per_block = calculate_reward_per_block(
+        user_power_str, user_unit, coin_block_reward_str, network_hashrate_str, network_unit
+    )
+    return reward_per_block, calculate_blocks_per_day(block_duration_str)
+
+def _percentiles_from_histogram(histogram, percentiles):
+    """
+    Exact percentiles (lower interpolation) of the block counts summarized by one histogram row.
+    """
+    cumulative = np.cumsum(histogram)
+    total = cumulative[-1]
+    targets = np.ceil(np.asarray(percentiles, dtype=float) / 100.0 * total)
+    targets = np.clip(targets, 1, total)
+    return np.searchsorted(cumulative, targets)
+
+def simulate_block_luck(coin_inputs, horizons=LUCK_HORIZON_DAYS, percentiles=DEFAULT_PERCENTILES,
+                        n_simulations=DEFAULT_SIMULATIONS, chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Monte Carlo of block luck for many coins at once. Blocks arrive as a Poisson process,
+    so the number of blocks in a period is Poisson(blocks_per_day * days) and the reward is
+    that count times the (deterministic) reward per block.
+
+    Draws are streamed in chunks of chunk_size periods and only a histogram of block counts
+    is kept per coin, so memory stays bounded and the percentiles are exact for the sample.
+
+    Args:
+        coin_inputs (dict): {COIN: (reward_per_block, blocks_per_day)}, e.g. from prepare_coin_luck_inputs.
+        horizons (dict): {name: days}.
+        percentiles (sequence): Percentiles to report, 0..100.
+        n_simulations (int): Simulated periods per coin and horizon.
+        chunk_size (int): Periods drawn per batch.
+        seed: Anything numpy.random.default_rng accepts, for reproducible runs.
+
+    Returns:
+        dict: {COIN: {horizon: {'expected': float, 'percentiles': {p: reward}, 'zero_block_probability': float}}}
+    """
+    rng = np.random.default_rng(seed)
+    coins = list(coin_inputs)
+    if not coins:
+        return {}
+    reward_per_block = np.array([coin_inputs[coin][0] for coin in coins], dtype=float)
+    blocks_per_day = np.array([coin_inputs[coin][1] for coin in coins], dtype=float)
+
+    results = {coin: {} for coin in coins}
+    for horizon_name, days in horizons.items():
+        lam = blocks_per_day * days
+        # Counts above this are practically impossible (> 12 sigma); they are clamped into the last bin
+        max_count = int(np.max(lam + 12 * np.sqrt(lam) + 12))
+        n_bins = max_count + 1
+        offsets = np.arange(len(coins)) * n_bins
+        histogram = np.zeros(len(coins) * n_bins, dtype=np.int64)
+
+        remaining = n_simulations
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            counts = rng.poisson(lam, size=(size, len(coins)))
+            np.minimum(counts, max_count, out=counts)
+            histogram += np.bincount((counts + offsets).ravel(), minlength=histogram.size)
+            remaining -= size
+
+        histogram = histogram.reshape(len(coins), n_bins)
+        for row, coin in enumerate(coins):
+            block_counts = _percentiles_from_histogram(histogram[row], percentiles)
+            results[coin][horizon_name] = {
+                'expected': float(lam[row] * reward_per_block[row]),
+                'percentiles': {p: float(count * reward_per_block[row]) for p, count in zip(percentiles, block_counts)},
+                'zero_block_probability': float(histogram[row, 0] / n_simulations)
+            }
+    return results
+
+if __name__ == "__main__":
+    import time
+    inputs = {
+        "BTC": prepare_coin_luck_inputs("5", "Eh/s", "0.0001", "2.5", "Zh/s", "10m 0s"),
+        "DOGE": prepare_coin_luck_inputs("5", "Eh/s", "200", "1.2", "Zh/s", "10m 0s"),
+        "RLT": prepare_coin_luck_inputs("5", "Eh/s", "30", "8", "Zh/s", "2m 30s"),
+    }
+    start = time.perf_counter()
+    luck = simulate_block_luck(inputs, seed=42)
+    print(f"Simulated {DEFAULT_SIMULATIONS:,} periods x {len(inputs)} coins x {len(LUCK_HORIZON_DAYS)} horizons in {time.perf_counter() - start:.2f}s")
+    for coin, by_horizon in luck.items():
+        for horizon_name, stats in by_horizon.items():
+            bands = ", ".join(f"p{p}={value:.6g}" for p, value in stats['percentiles'].items())
+            print(f"{coin} {horizon_name}: expected {stats['expected']:.6g}; {bands}")
@@ -0,0 +1,166 @@
+import numpy as np
+
+# Tiers are classified and rewarded exactly like portfolio mode, so simulated networks plug into it
+from rollercoin_core.portfolio import PORTFOLIO_TIERS, classify_powers, tier_coin_mask, compute_portfolio
+from rollercoin_core.parsing import KNOWN_TICKERS
+
+# Illustrative player population: median ~20 Ph/s, a long tail into the Zh/s leagues.
+# Fit it to real powers with fit_lognormal for anything more than a rough scenario.
+DEFAULT_LOG_MEAN = float(np.log(2e7)) # ln(Gh/s)
+DEFAULT_LOG_SIGMA = 2.3
+DEFAULT_PLAYERS = 1_000_000
+DEFAULT_CHUNK_SIZE = 500_000 # Players drawn at once; bounds memory to chunk_size x coins
+
+# Allocation strategies: how a player spreads power over the coins of their league
+STRATEGY_EQUAL = "equal"       # Power split evenly over every coin of the league
+STRATEGY_WEIGHTED = "weighted" # Power split in proportion to the coin weights
+STRATEGY_SINGLE = "single"     # All power on one coin, drawn with probability proportional to the weights
+ALLOCATION_STRATEGIES = (STRATEGY_EQUAL, STRATEGY_WEIGHTED, STRATEGY_SINGLE)
+
+def fit_lognormal(powers_ghs):
+    """
+    Maximum-likelihood lognormal fit of player powers (Gh/s), e.g. the powers from
+    rollercoin_core.portfolio.load_accounts or a leaderboard export. Zero powers are ignored.
+
+    Returns:
+        tuple: (log_mean, log_sigma) for simulate_league_network.
+    """
+    powers_ghs = np.asarray(powers_ghs, dtype=float)
+    logs = np.log(powers_ghs[powers_ghs > 0])
+    if len(logs) < 2:
+        raise ValueError("At least two positive powers are needed to fit a distribution")
+    return float(logs.mean()), float(logs.std())
+
+def equilibrium_weights(network, prices):
+    """
+    Coin weights proportional to each coin's daily block rewards in USDT. When players
+    allocate like this, every coin of a league pays the same per Gh/s: the allocation
+    players drift to when they chase the best coin.
+
+    Args:
+        network (dict): {coin: {"block_reward", "block_duration_seconds", ...}}, as for compute_portfolio.
+        prices (dict): {coin: USDT price}.
+    """
+    weights = {}
+    for coin, entry in network.items():
+        duration = entry.get("block_duration_seconds", 0.0)
+        if duration > 0:
+            weights[coin] = entry.get("block_reward", 0.0) / duration * float(prices.get(coin) or 0.0)
+    return weights
+
+def allocation_matrix(weights=None, coins=KNOWN_TICKERS):
+    """
+    Returns the (tiers x coins) share of a league's power that goes to each coin. Only the
+    coins the league can mine get a share; a league none of whose coins has a positive weight
+    splits evenly.
+    """
+    mask = tier_coin_mask(coins).astype(float)
+    if weights is None:
+        shares = mask
+    else:
+        shares = mask * np.array([max(float(weights.get(coin, 0.0)), 0.0) for coin in coins])[None, :]
+        shares = np.where(shares.sum(axis=1, keepdims=True) > 0, shares, mask)
+    totals = shares.sum(axis=1, keepdims=True)
+    return shares / np.where(totals > 0, totals, 1.0)
+
+def simulate_league_network(n_players=DEFAULT_PLAYERS, log_mean=DEFAULT_LOG_MEAN, log_sigma=DEFAULT_LOG_SIGMA,
+                            strategy=STRATEGY_EQUAL, weights=None, coins=KNOWN_TICKERS,
+                            chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """
+    Simulates a player population and the network power it puts on every (league, coin).
+
+    Player powers are drawn from a lognormal distribution, binned into leagues with the
+    league table and allocated over their league's coins by strategy. Draws are streamed in
+    chunks of chunk_size players and only per-league sums are kept, so millions of players
+    need little memory.
+
+    Args:
+        n_players (int): Simulated players.
+        log_mean, log_sigma (float): Lognormal parameters of power in Gh/s (see fit_lognormal).
+        strategy (str): One of ALLOCATION_STRATEGIES.
+        weights (dict): {coin: weight} for STRATEGY_WEIGHTED and STRATEGY_SINGLE; equal if None.
+        coins (list): Coins to report.
+        chunk_size (int): Players drawn per batch.
+        seed: Anything numpy.random.default_rng accepts, for reproducible runs.
+
+    Returns:
+        dict: {'network_ghs': {coin: {tier: ghs}}, 'players': {tier: count}, 'tier_power_ghs': {tier: ghs}}
+    """
+    if strategy not in ALLOCATION_STRATEGIES:
+        raise ValueError(f"Unknown allocation strategy {strategy!r}, expected one of {ALLOCATION_STRATEGIES}")
+    rng = np.random.default_rng(seed)
+    n_tiers, n_coins = len(PORTFOLIO_TIERS), len(coins)
+    shares = allocation_matrix(None if strategy == STRATEGY_EQUAL else weights, coins)
+    cumulative_shares = np.cumsum(shares, axis=1)
+    cumulative_shares[:, -1] = np.where(shares.sum(axis=1) > 0, 1.0, 0.0) # Guard against rounding below 1
+
+    players = np.zeros(n_tiers, dtype=np.int64)
+    tier_power = np.zeros(n_tiers)
+    network = np.zeros(n_tiers * n_coins)
+    remaining = n_players
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        powers = rng.lognormal(log_mean, log_sigma, size)
+        tier_index = classify_powers(powers)
+        players += np.bincount(tier_index, minlength=n_tiers)
+        tier_power += np.bincount(tier_index, weights=powers, minlength=n_tiers)
+        if strategy == STRATEGY_SINGLE:
+            # Inverse-CDF draw of each player's coin from their league's row of shares
+            draws = rng.random(size)
+            coin_index = (draws[:, None] >= cumulative_shares[tier_index]).sum(axis=1)
+            np.minimum(coin_index, n_coins - 1, out=coin_index)
+            network += np.bincount(tier_index * n_coins + coin_index, weights=powers, minlength=n_tiers * n_coins)
+        remaining -= size
+
+    if strategy == STRATEGY_SINGLE:
+        network = network.reshape(n_tiers, n_coins)
+    else:
+        network = tier_power[:, None] * shares
+    return {
+        'network_ghs': {
+            coin: {tier: float(network[row, col]) for row, tier in enumerate(PORTFOLIO_TIERS)}
+            for col, coin in enumerate(coins)
+        },
+        'players': {tier: int(players[row]) for row, tier in enumerate(PORTFOLIO_TIERS)},
+        'tier_power_ghs': {tier: float(tier_power[row]) for row, tier in enumerate(PORTFOLIO_TIERS)}
+    }
+
+def fill_missing_network(network, simulation):
+    """
+    Returns a copy of a compute_portfolio network snapshot in which coins without live
+    network power use the simulated per-league network power instead. Block rewards and
+    durations are kept, so the reward engine runs unchanged on the scenario.
+
+    Args:
+        network (dict): {coin: {"network_ghs", "block_reward", "block_duration_seconds"}}.
+        simulation (dict): Result of simulate_league_network.
+    """
+    filled = {}
+    for coin, entry in network.items():
+        entry = dict(entry)
+        live = entry.get("network_ghs", 0.0)
+        if not (isinstance(live, dict) or live > 0) and coin in simulation['network_ghs']:
+            entry["network_ghs"] = simulation['network_ghs'][coin]
+        filled[coin] = entry
+    return filled
+
+if __name__ == "__main__":
+    import time
+    from rollercoin_core.portfolio import network_snapshot_entry
+
+    # Block data is known but live network power is not, so the scenario supplies it
+    network = {coin: network_snapshot_entry("", "Gh/s", "0.001", "10m 0s") for coin in KNOWN_TICKERS}
+    prices = {coin: price for coin, price in zip(KNOWN_TICKERS, (1.0, 0.5, 2.0, 0.3, 0.2, 60000.0, 3000.0, 600.0, 0.5, 150.0, 80.0))}
+    weights = equilibrium_weights(network, prices)
+    for strategy in ALLOCATION_STRATEGIES:
+        start = time.perf_counter()
+        simulation = simulate_league_network(5_000_000, strategy=strategy, weights=weights, seed=42)
+        print(f"{strategy}: simulated 5,000,000 players in {time.perf_counter() - start:.2f}s")
+
+    for tier, count in simulation['players'].items():
+        print(f"{tier:<12} {count:>9,} players, {simulation['tier_power_ghs'][tier] / 1e9:12.1f} Eh/s")
+    accounts = [("Main", 5e9), ("Second", 8e7)]
+    result = compute_portfolio(accounts, fill_missing_network(network, simulation), prices)
+    for row in range(len(result)):
+        print(f"{result.names[row]} ({result.tier(row)}): best coin {result.best_coin(row)}, "
+              f"{result.best_daily_value(row):.4f} USDT/day in this scenario")
@@ -3,6 +3,7 @@ import re # Import re for parsing duration strings
 
 # Import the convert_power_to_ghs function and UNIT_MULTIPLIERS from Leagues_Info.py
 from Leagues_Info import convert_power_to_ghs, UNIT_MULTIPLIERS
+from PerfMetrics import metrics
 
 def parse_duration_to_seconds(duration_str):
     """
@@ -53,7 +54,8 @@ def calculate_reward_per_block(user_power_str, user_unit, coin_block_reward_str,
     Returns:
         float: The estimated reward for mining one block. Returns 0.0 if network hashrate is zero.
     """
-    print(f"DEBUG: calculate_reward_per_block received: user_power_str='{user_power_str}', user_unit='{user_unit}', coin_block_reward_str='{coin_block_reward_str}', network_hashrate_str='{network_hashrate_str}', network_unit='{network_unit}'")
+    if metrics.debug_logging:
+        print(f"DEBUG: calculate_reward_per_block received: user_power_str='{user_power_str}', user_unit='{user_unit}', coin_block_reward_str='{coin_block_reward_str}', network_hashrate_str='{network_hashrate_str}', network_unit='{network_unit}'")
 
     user_power_ghs = convert_power_to_ghs(user_power_str, user_unit, UNIT_MULTIPLIERS)
     network_hashrate_ghs = convert_power_to_ghs(network_hashrate_str, network_unit, UNIT_MULTIPLIERS)
@@ -65,9 +67,10 @@ def calculate_reward_per_block(user_power_str, user_unit, coin_block_reward_str,
         coin_block_reward = 0.0
         print(f"Warning: Invalid coin_block_reward_str '{coin_block_reward_str}'. Using 0.0.")
 
-    print(f"DEBUG: calculate_reward_per_block: user_power_ghs={user_power_ghs}")
-    print(f"DEBUG: calculate_reward_per_block: network_hashrate_ghs={network_hashrate_ghs}")
-    print(f"DEBUG: calculate_reward_per_block: coin_block_reward={coin_block_reward}")
+    if metrics.debug_logging:
+        print(f"DEBUG: calculate_reward_per_block: user_power_ghs={user_power_ghs}")
+        print(f"DEBUG: calculate_reward_per_block: network_hashrate_ghs={network_hashrate_ghs}")
+        print(f"DEBUG: calculate_reward_per_block: coin_block_reward={coin_block_reward}")
 
     if network_hashrate_ghs == 0:
         print("Warning: Network hashrate in Gh/s is zero. Returning 0.0 reward.")
@@ -75,11 +78,13 @@ def calculate_reward_per_block(user_power_str, user_unit, coin_block_reward_str,
 
     # Calculate your share of the network's hashrate
     share_of_network = user_power_ghs / network_hashrate_ghs
-    print(f"DEBUG: calculate_reward_per_block: share_of_network={share_of_network}")
+    if metrics.debug_logging:
+        print(f"DEBUG: calculate_reward_per_block: share_of_network={share_of_network}")
 
     # Calculate the reward per block
     reward = share_of_network * coin_block_reward
-    print(f"DEBUG: calculate_reward_per_block: final reward={reward}")
+    if metrics.debug_logging:
+        print(f"DEBUG: calculate_reward_per_block: final reward={reward}")
     return reward
 
 def calculate_blocks_per_day(block_duration_str):
@@ -93,7 +98,8 @@ def calculate_blocks_per_day(block_duration_str):
         float: The average number of blocks mined per day. Returns 0.0 if duration is invalid.
     """
     block_duration_seconds = parse_duration_to_seconds(block_duration_str)
-    print(f"DEBUG: calculate_blocks_per_day: block_duration_seconds={block_duration_seconds}")
+    if metrics.debug_logging:
+        print(f"DEBUG: calculate_blocks_per_day: block_duration_seconds={block_duration_seconds}")
 
     if block_duration_seconds > 0:
         return (24 * 60 * 60) / block_duration_seconds
@@ -0,0 +1,32 @@
+"""
+Headless core of the RollerCoin calculator: parsing (pasted text and OCR results),
+tier classification, reward math, persistence and prices, without any Qt import.
+
+    from rollercoin_core import Session
+    session = Session()
+    session.set_user_power("5 Eh/s")
+    session.apply_paste(text)
+    session.set_block_data("BTC", block_duration="10m 0s", block_reward="0.0001")
+    print(session.tier, session.compute_all())
+
+Many accounts at once (see rollercoin_core.portfolio):
+
+    from rollercoin_core import load_accounts, compute_portfolio
+    result = compute_portfolio(load_accounts("accounts.csv"), network, prices)
+
+Run from the calculator's folder (the core builds on Leagues_Info and reward_calculations there).
+"""
+from rollercoin_core.parsing import (
+    KNOWN_TICKERS,
+    match_ticker,
+    parse_pasted_text,
+    ocr_results_to_items,
+    extract_numbers_with_units,
+    associate_tickers_with_rates,
+    extract_detected_values
+)
+from rollercoin_core.classify import TIER_NAMES, power_to_ghs, classify_power, coins_for_tier
+from rollercoin_core.compute import compute_rewards
+from rollercoin_core.price import CURRENCY_USDT, CURRENCY_EUR, create_price_source
+from rollercoin_core.session import Session
+from rollercoin_core.portfolio import load_accounts, network_snapshot_entry, compute_portfolio, PortfolioResult
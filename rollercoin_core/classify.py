@@ -0,0 +1,28 @@
+from Leagues_Info import (
+    TIER_CRYPTO_MAPPING,
+    TIER_POWER_RANGES,
+    UNIT_MULTIPLIERS,
+    convert_power_to_ghs,
+    determine_tier_from_power
+)
+
+TIER_NAMES = list(TIER_CRYPTO_MAPPING)
+
+def power_to_ghs(power_str, unit="Gh/s"):
+    """
+    Converts a power string such as "5 Eh/s" (or "5" with a separate unit) to Gh/s.
+    """
+    return convert_power_to_ghs(power_str, unit, UNIT_MULTIPLIERS)
+
+def classify_power(power_str, unit="Gh/s"):
+    """
+    Returns the league tier for a user power string, falling back to the lowest tier
+    for zero/unparsable power (like the analyzer's tier combo does).
+    """
+    return determine_tier_from_power(power_to_ghs(power_str, unit), TIER_POWER_RANGES) or TIER_NAMES[0]
+
+def coins_for_tier(tier):
+    """
+    Coins that can be mined in a tier, in display order.
+    """
+    return list(TIER_CRYPTO_MAPPING.get(tier, []))
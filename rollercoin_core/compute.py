@@ -0,0 +1,37 @@
+from reward_calculations import (
+    calculate_reward_per_block,
+    calculate_blocks_per_day,
+    calculate_reward_per_day,
+    calculate_reward_per_week,
+    calculate_reward_per_month,
+    calculate_reward_per_year
+)
+
+EMPTY_BLOCK_VALUE = "--" # What the grid shows for an unknown block duration/reward
+
+def compute_rewards(user_power_str, network_rate_str, network_unit, block_reward_str, block_duration_str, user_unit="Gh/s"):
+    """
+    Computes one coin's rewards from the same strings the calculator grid holds.
+    Empty or "--" block reward/duration count as zero.
+
+    Returns:
+        dict: reward_per_block, daily_reward, and flat weekly/monthly/yearly rewards.
+    """
+    block_reward_str = block_reward_str.strip()
+    block_duration_str = block_duration_str.strip()
+    reward_for_calc = block_reward_str if block_reward_str and block_reward_str != EMPTY_BLOCK_VALUE else "00"
+    duration_for_calc = block_duration_str if block_duration_str and block_duration_str != EMPTY_BLOCK_VALUE else "00"
+
+    reward_per_block = calculate_reward_per_block(
+        user_power_str, user_unit,
+        reward_for_calc,
+        network_rate_str, network_unit
+    )
+    daily_reward = calculate_reward_per_day(reward_per_block, calculate_blocks_per_day(duration_for_calc))
+    return {
+        'reward_per_block': reward_per_block,
+        'daily_reward': daily_reward,
+        'weekly_reward': calculate_reward_per_week(daily_reward),
+        'monthly_reward': calculate_reward_per_month(daily_reward),
+        'yearly_reward': calculate_reward_per_year(daily_reward)
+    }
@@ -0,0 +1,61 @@
+import gc
+import os
+
+from rollercoin_core.parsing import KNOWN_TICKERS, extract_detected_values
+
+# PaddleOCR, numpy and PIL are heavy; they are imported only when OCR is actually used.
+
+MIN_OCR_WIDTH = 1000 # Narrower screenshots are upscaled before OCR
+
+def create_ocr_reader(paddlex_home=None):
+    """
+    Creates the PaddleOCR reader. With paddlex_home (or PADDLEX_HOME set), the models are
+    loaded from its official_models folder like the desktop app does.
+    """
+    from paddleocr import PaddleOCR
+    paddlex_home = paddlex_home or os.environ.get('PADDLEX_HOME')
+    if not paddlex_home:
+        return PaddleOCR(use_angle_cls=True, lang='en')
+    return PaddleOCR(
+        use_angle_cls=True,
+        lang='en',
+        det_model_dir=os.path.join(paddlex_home, "official_models", "PP-OCRv5_server_det"),
+        rec_model_dir=os.path.join(paddlex_home, "official_models", "en_PP-OCRv5_mobile_rec"),
+        cls_model_dir=os.path.join(paddlex_home, "official_models", "PP-LCNet_x1_0_textline_ori")
+    )
+
+def preprocess_image(pil_image, apply_preprocessing=True):
+    """
+    Grayscale, contrast boost, upscaling of small screenshots and denoising; returns an RGB NumPy array for OCR.
+    """
+    import numpy as np
+    from PIL import Image, ImageEnhance, ImageFilter
+
+    if apply_preprocessing:
+        processed_pil_image = pil_image.convert("L")
+        processed_pil_image = ImageEnhance.Contrast(processed_pil_image).enhance(1.5)
+        if processed_pil_image.width < MIN_OCR_WIDTH:
+            upscale_factor = MIN_OCR_WIDTH / processed_pil_image.width
+            processed_pil_image = processed_pil_image.resize(
+                (int(processed_pil_image.width * upscale_factor), int(processed_pil_image.height * upscale_factor)),
+                Image.LANCZOS
+            )
+        processed_pil_image = processed_pil_image.filter(ImageFilter.MedianFilter(3))
+        processed_pil_image = processed_pil_image.convert("RGB")
+    else:
+        processed_pil_image = pil_image.convert("RGB")
+
+    img_np_array = np.array(processed_pil_image)
+    del processed_pil_image
+    gc.collect()
+    return img_np_array
+
+def recognize(reader, pil_image, known_tickers=KNOWN_TICKERS, apply_preprocessing=True):
+    """
+    Runs OCR on a screenshot and returns {ticker: {'rate', 'unit', ...}}.
+    """
+    img_np_array = preprocess_image(pil_image, apply_preprocessing)
+    ocr_results = reader.ocr(img_np_array)
+    del img_np_array
+    gc.collect()
+    return extract_detected_values(ocr_results, known_tickers)
@@ -0,0 +1,234 @@
+import re
+
+from Leagues_Info import UNIT_MULTIPLIERS, convert_power_to_ghs
+
+KNOWN_TICKERS = [
+    "RLT", "RST", "XRP", "TRX", "DOGE",
+    "BTC", "ETH", "BNB", "POL", "SOL", "LTC"
+]
+
+# Common misreads of tickers (OCR and copy/paste from the game page)
+TICKER_ERROR_MAPPINGS = {
+    "RRIUT": "RLT", "RRU": "RLT", "R.RU": "RLT", "RLJ": "RLT", "RLY": "RLT",
+    "RSTT": "RST", "RSTU": "RST",
+    "TRXY": "TRX", "YTRX": "TRX", "TX": "TRX",
+    "LIC": "LTC", "LTCC": "LTC",
+    "GC": "DOGE", "DOGE.": "DOGE",
+    "CC": "BTC", "BTCC": "BTC",
+    "EH": "ETH", "ETTH": "ETH",
+    "BNBV": "BNB", "BNN": "BNB",
+    "SOLL": "SOL", "5OL": "SOL",
+    "POOL": "POL", "PQOL": "POL",
+    "XRP": "XRP",
+    "MATIC": "POL",
+}
+
+# OCR unit spellings and the unit they stand for
+OCR_UNIT_PATTERN = r"(GH/S|TH/S|PH/S|EH/S|ZH/S|GHS|THS|PHS|EHS|ZHS|T|P|B|E|ES|PVS)"
+
+# Limits used when pairing an OCR'd ticker with the number to its right (in image pixels)
+VERTICAL_ALIGNMENT_TOLERANCE = 50
+MAX_HORIZONTAL_DISTANCE = 900
+
+def match_ticker(detected_text, known_tickers=KNOWN_TICKERS):
+    """
+    Maps an upper-cased piece of text to a known ticker, tolerating common misreads
+    and one-character differences. Returns None if nothing matches.
+    """
+    if detected_text in known_tickers:
+        return detected_text
+
+    if detected_text in TICKER_ERROR_MAPPINGS:
+        return TICKER_ERROR_MAPPINGS[detected_text]
+
+    for known_ticker in known_tickers:
+        if len(detected_text) == len(known_ticker):
+            diff_count = sum(1 for a, b in zip(detected_text, known_ticker) if a != b)
+            if diff_count <= 1:
+                return known_ticker
+        if known_ticker in detected_text and abs(len(detected_text) - len(known_ticker)) <= 2:
+            return known_ticker
+        if detected_text.startswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
+            return known_ticker
+        if known_ticker.startswith(detected_text) and abs(len(known_ticker) - len(detected_text)) <= 1:
+            return known_ticker
+        if detected_text.endswith(known_ticker) and abs(len(detected_text) - len(known_ticker)) <= 1:
+            return known_ticker
+    return None
+
+def parse_pasted_text(raw_text, known_tickers=KNOWN_TICKERS):
+    """
+    Parses text copied from the game's network power page: a ticker line followed by
+    a "<value> <unit>" line.
+
+    Returns:
+        dict: {ticker: {'rate': str, 'unit': str, 'block_reward': ""}}
+    """
+    lines = raw_text.strip().split('\n')
+    parsed_data = {}
+    current_ticker_context = None
+
+    power_unit_pattern = re.compile(r'(\d[\d,]*\.?\d*)\s*([a-zA-Z/]+)?', re.IGNORECASE)
+
+    known_unit_symbols = {k.upper(): k for k in UNIT_MULTIPLIERS.keys()}
+
+    for line in lines:
+        line_stripped = line.strip()
+        if not line_stripped:
+            current_ticker_context = None
+            continue
+
+        possible_ticker = match_ticker(line_stripped.upper(), known_tickers)
+        if possible_ticker:
+            current_ticker_context = possible_ticker
+            if current_ticker_context not in parsed_data:
+                parsed_data[current_ticker_context] = {'rate': "", 'unit': "", 'block_reward': ""}
+            continue
+
+        if current_ticker_context:
+            power_match = power_unit_pattern.match(line_stripped)
+            if power_match:
+                power_value_str = power_match.group(1).replace(',', '')
+                power_unit_str_raw = power_match.group(2) if power_match.group(2) else ""
+
+                effective_unit = power_unit_str_raw
+                if effective_unit:
+                    effective_unit = known_unit_symbols.get(effective_unit.upper(), effective_unit)
+                    if effective_unit not in UNIT_MULTIPLIERS:
+                        effective_unit = ""
+
+                temp_power_str_for_conversion = power_value_str + (" " + effective_unit if effective_unit else "")
+                power_in_ghs = convert_power_to_ghs(temp_power_str_for_conversion, effective_unit, UNIT_MULTIPLIERS)
+
+                if power_in_ghs >= 0 and power_value_str:
+                    parsed_data[current_ticker_context]['rate'] = power_value_str
+                    parsed_data[current_ticker_context]['unit'] = effective_unit if effective_unit else "Gh/s"
+    return parsed_data
+
+def ocr_results_to_items(ocr_results):
+    """
+    Flattens PaddleOCR results into [{'text', 'left', 'top', 'width', 'height', 'conf'}, ...].
+    """
+    processed_data = []
+    if ocr_results and ocr_results[0] is not None:
+        if isinstance(ocr_results[0], dict):
+            rec_texts = ocr_results[0].get('rec_texts', [])
+            rec_scores = ocr_results[0].get('rec_scores', [])
+            dt_polys = ocr_results[0].get('dt_polys', [])
+        else:
+            return []
+
+        min_len = min(len(rec_texts), len(rec_scores), len(dt_polys))
+        for i in range(min_len):
+            text = rec_texts[i].strip()
+            prob = rec_scores[i]
+            bbox = dt_polys[i]
+
+            x_coords = [p[0] for p in bbox]
+            y_coords = [p[1] for p in bbox]
+
+            x_min = int(min(x_coords))
+            y_min = int(min(y_coords))
+            x_max = int(max(x_coords))
+            y_max = int(max(y_coords))
+
+            if text:
+                processed_data.append({
+                    'text': text,
+                    'left': x_min,
+                    'top': y_min,
+                    'width': x_max - x_min,
+                    'height': y_max - y_min,
+                    'conf': prob * 100
+                })
+    return processed_data
+
+def extract_numbers_with_units(ocr_items):
+    """
+    Picks out "<value> <unit>" readings from OCR items, normalizing OCR unit spellings.
+    """
+    numbers_with_units = []
+    for item in ocr_items:
+        text = item['text'].strip()
+        if not text:
+            continue
+
+        number_unit_match = re.search(r'(\d[\d,]*\.?\d*)\s*(' + OCR_UNIT_PATTERN + r')?', text, re.IGNORECASE)
+        value_str = None
+        unit_str = None
+
+        if number_unit_match:
+            value_str = number_unit_match.group(1).replace(',', '')
+            unit_part_from_regex = number_unit_match.group(2)
+
+            if unit_part_from_regex:
+                unit_str = unit_part_from_regex.upper()
+                if unit_str == 'T' or unit_str == 'THS': unit_str = 'Th/s'
+                elif unit_str == 'P' or unit_str == 'PVS' or unit_str == 'PHS': unit_str = 'Ph/s'
+                elif unit_str == 'E' or unit_str == 'ES' or unit_str == 'EHS': unit_str = 'Eh/s'
+                elif unit_str == 'B' or unit_str == 'ZHS': unit_str = 'Zh/s'
+                elif unit_str == 'GHS': unit_str = 'Gh/s'
+            else:
+                unit_str = "Gh/s"
+
+        if value_str:
+            numbers_with_units.append({
+                'value': value_str,
+                'unit': unit_str,
+                'x_scaled': item['left'],
+                'y_scaled': item['top'],
+                'width_scaled': item['width'],
+                'height_scaled': item['height']
+            })
+    return numbers_with_units
+
+def associate_tickers_with_rates(ocr_items, numbers_with_units, known_tickers=KNOWN_TICKERS):
+    """
+    Pairs every recognized ticker with the closest reading to its right on roughly the same line.
+
+    Returns:
+        dict: {ticker: {'rate': float, 'unit': str, 'icon_box': None, 'ticker_x', 'ticker_y', 'ticker_height'}}
+    """
+    detected_values = {}
+    for item in ocr_items:
+        text = item['text'].strip()
+        if not text:
+            continue
+
+        matched_ticker = match_ticker(text.upper(), known_tickers)
+        if not matched_ticker:
+            continue
+
+        ticker_x = item['left']
+        ticker_y = item['top']
+
+        closest_rate_unit_info = None
+        min_distance = float('inf')
+        for num_unit_info in numbers_with_units:
+            x_distance = abs(num_unit_info['x_scaled'] - ticker_x)
+            y_distance = abs(num_unit_info['y_scaled'] - ticker_y)
+            if y_distance > VERTICAL_ALIGNMENT_TOLERANCE:
+                continue
+            if num_unit_info['x_scaled'] > ticker_x and x_distance < MAX_HORIZONTAL_DISTANCE:
+                current_distance = x_distance + y_distance * 5
+                if current_distance < min_distance:
+                    min_distance = current_distance
+                    closest_rate_unit_info = num_unit_info
+
+        if closest_rate_unit_info and matched_ticker not in detected_values:
+            detected_values[matched_ticker] = {
+                'rate': float(closest_rate_unit_info['value']),
+                'unit': closest_rate_unit_info['unit'],
+                'icon_box': None,
+                'ticker_x': int(ticker_x),
+                'ticker_y': int(ticker_y),
+                'ticker_height': int(item['height'])
+            }
+    return detected_values
+
+def extract_detected_values(ocr_results, known_tickers=KNOWN_TICKERS):
+    """
+    Full OCR post-processing: raw PaddleOCR results -> {ticker: {'rate', 'unit', ...}}.
+    """
+    ocr_items = ocr_results_to_items(ocr_results)
+    return associate_tickers_with_rates(ocr_items, extract_numbers_with_units(ocr_items), known_tickers)
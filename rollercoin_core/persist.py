@@ -0,0 +1,8 @@
+from ConfigStore import ConfigStore
+from BlockDurationRewardSave import BlockDataPersistenceManager
+from SnapshotHistory import (
+    SnapshotHistory,
+    SNAPSHOT_SOURCE_OCR,
+    SNAPSHOT_SOURCE_PASTE,
+    SNAPSHOT_SOURCE_MANUAL
+)
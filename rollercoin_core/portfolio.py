@@ -0,0 +1,201 @@
+# NumPy is imported on first use, like in RewardProjection, so importing the core stays fast.
+import csv
+import json
+import os
+
+from Leagues_Info import TIER_CRYPTO_MAPPING, TIER_POWER_RANGES
+from rollercoin_core.parsing import KNOWN_TICKERS
+from rollercoin_core.classify import power_to_ghs
+from rollercoin_core.compute import EMPTY_BLOCK_VALUE
+from reward_calculations import parse_duration_to_seconds
+
+SECONDS_PER_DAY = 24 * 3600
+TIER_BOUNDARY_EPSILON = 1e-9 # Same boundary tolerance as Leagues_Info.determine_tier_from_power
+PORTFOLIO_TIERS = list(TIER_POWER_RANGES) # Ascending and contiguous, so a tier is found by binary search
+
+def load_accounts(path):
+    """
+    Reads accounts from a CSV or JSON file.
+
+    CSV: one "name,power" row per account ("Main,5 Eh/s"); an optional third column holds the
+    unit of a bare number ("Main,5,Eh/s"). A header row is skipped.
+    JSON: [{"name": "Main", "power": "5 Eh/s"}, ...] or {"Main": "5 Eh/s", ...}.
+
+    Returns:
+        list: [(name, power_ghs), ...] in file order.
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        entries = data.items() if isinstance(data, dict) else ((entry["name"], entry["power"]) for entry in data)
+        return [(str(name), power_to_ghs(str(power))) for name, power in entries]
+
+    accounts = []
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip():
+                continue
+            name, power = row[0].strip(), row[1].strip()
+            unit = row[2].strip() if len(row) > 2 and row[2].strip() else "Gh/s"
+            if not accounts and not any(ch.isdigit() for ch in power):
+                continue # Header
+            accounts.append((name, power_to_ghs(power, unit)))
+    return accounts
+
+def network_snapshot_entry(network_rate_str, network_unit, block_reward_str, block_duration_str):
+    """
+    Converts one coin's grid strings into a network snapshot entry for compute_portfolio.
+    Empty or "--" block reward/duration count as zero, like compute_rewards.
+    """
+    block_reward_str = (block_reward_str or "").strip()
+    block_duration_str = (block_duration_str or "").strip()
+    try:
+        block_reward = float(block_reward_str) if block_reward_str not in ("", EMPTY_BLOCK_VALUE) else 0.0
+    except ValueError:
+        block_reward = 0.0
+    block_duration_seconds = (
+        parse_duration_to_seconds(block_duration_str) if block_duration_str not in ("", EMPTY_BLOCK_VALUE) else 0.0
+    )
+    network_ghs = power_to_ghs(network_rate_str, network_unit) if (network_rate_str or "").strip() else 0.0
+    return {"network_ghs": network_ghs, "block_reward": block_reward, "block_duration_seconds": block_duration_seconds}
+
+def classify_powers(powers_ghs):
+    """
+    Vectorized Leagues_Info.determine_tier_from_power: returns the index into PORTFOLIO_TIERS
+    of every power (Gh/s). Zero or invalid power falls back to the lowest tier.
+    """
+    import numpy as np
+    lower_bounds = np.array([lower for lower, _ in TIER_POWER_RANGES.values()]) - TIER_BOUNDARY_EPSILON
+    powers_ghs = np.nan_to_num(np.asarray(powers_ghs, dtype=float), nan=0.0)
+    return np.clip(np.searchsorted(lower_bounds, powers_ghs, side='right') - 1, 0, len(PORTFOLIO_TIERS) - 1)
+
+def tier_coin_mask(coins=KNOWN_TICKERS):
+    """
+    Returns a (tiers x coins) boolean matrix of which coins each tier can mine.
+    """
+    import numpy as np
+    return np.array([[coin in TIER_CRYPTO_MAPPING.get(tier, ()) for coin in coins] for tier in PORTFOLIO_TIERS])
+
+def daily_reward_per_ghs(network, coins=KNOWN_TICKERS):
+    """
+    Daily reward of one Gh/s for every (tier, coin), in crypto units.
+
+    Args:
+        network (dict): {coin: {"network_ghs", "block_reward", "block_duration_seconds"}}.
+            network_ghs is either one value for every league or {tier: value} (e.g. from
+            the league simulator); coins or tiers without network power earn nothing.
+    """
+    import numpy as np
+    network_ghs = np.zeros((len(PORTFOLIO_TIERS), len(coins)))
+    daily_pool = np.zeros(len(coins)) # Coins mined per day by the whole network
+    for col, coin in enumerate(coins):
+        entry = network.get(coin)
+        if not entry:
+            continue
+        coin_network = entry.get("network_ghs", 0.0)
+        if isinstance(coin_network, dict):
+            network_ghs[:, col] = [coin_network.get(tier, 0.0) for tier in PORTFOLIO_TIERS]
+        else:
+            network_ghs[:, col] = coin_network
+        duration = entry.get("block_duration_seconds", 0.0)
+        if duration > 0:
+            daily_pool[col] = entry.get("block_reward", 0.0) * SECONDS_PER_DAY / duration
+    minable = tier_coin_mask(coins) & (network_ghs > 0)
+    return np.where(minable, daily_pool[None, :] / np.where(network_ghs > 0, network_ghs, 1.0), 0.0)
+
+class PortfolioResult:
+    """
+    Per-account, per-coin daily rewards of a portfolio (see compute_portfolio).
+
+    Attributes:
+        names (list), powers_ghs (N), tier_index (N, into PORTFOLIO_TIERS), coins (list),
+        daily (N x coins, crypto units), prices (coins, USDT; zero where unknown).
+    """
+    def __init__(self, names, powers_ghs, tier_index, coins, daily, prices):
+        import numpy as np
+        self.names = names
+        self.powers_ghs = powers_ghs
+        self.tier_index = tier_index
+        self.coins = list(coins)
+        self.daily = daily
+        self.prices = prices
+        self.daily_value = daily * prices[None, :]
+        # Crypto amounts of different coins are not comparable, so the best coin is the one worth the most
+        self.best_coin_index = np.where(self.daily_value.max(axis=1) > 0, self.daily_value.argmax(axis=1), -1)
+
+    def __len__(self):
+        return len(self.names)
+
+    def tier(self, row):
+        return PORTFOLIO_TIERS[self.tier_index[row]]
+
+    def best_coin(self, row):
+        index = self.best_coin_index[row]
+        return self.coins[index] if index >= 0 else None
+
+    def best_daily_value(self, row):
+        index = self.best_coin_index[row]
+        return float(self.daily_value[row, index]) if index >= 0 else 0.0
+
+    def coin_totals(self):
+        """
+        {coin: total daily reward of every account}, in crypto units.
+        """
+        totals = self.daily.sum(axis=0)
+        return {coin: float(totals[col]) for col, coin in enumerate(self.coins)}
+
+    def best_coin_total_value(self):
+        """
+        Daily USDT value if every account mines its best coin.
+        """
+        return float(self.daily_value.max(axis=1, initial=0.0).sum())
+
+    def tier_counts(self):
+        import numpy as np
+        counts = np.bincount(self.tier_index, minlength=len(PORTFOLIO_TIERS))
+        return {tier: int(counts[i]) for i, tier in enumerate(PORTFOLIO_TIERS) if counts[i]}
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "power_ghs", "tier", "best_coin", "best_daily_usdt"] + [f"{coin}_daily" for coin in self.coins])
+            for row in range(len(self)):
+                writer.writerow(
+                    [self.names[row], f"{self.powers_ghs[row]:.6g}", self.tier(row), self.best_coin(row) or "",
+                     f"{self.best_daily_value(row):.6g}"] + [f"{value:.8g}" for value in self.daily[row]]
+                )
+
+def compute_portfolio(accounts, network, prices=None, coins=KNOWN_TICKERS):
+    """
+    Classifies every account's tier and computes its daily reward for every coin against one
+    shared network snapshot, in one vectorized pass.
+
+    Args:
+        accounts: [(name, power_ghs), ...], e.g. from load_accounts.
+        network (dict): see daily_reward_per_ghs.
+        prices (dict): {coin: USDT price}, used to pick each account's best coin.
+
+    Returns:
+        PortfolioResult
+    """
+    import numpy as np
+    names = [name for name, _ in accounts]
+    powers_ghs = np.array([power for _, power in accounts], dtype=float).reshape(-1)
+    tier_index = classify_powers(powers_ghs)
+    daily = powers_ghs[:, None] * daily_reward_per_ghs(network, coins)[tier_index]
+    price_vector = np.array([float((prices or {}).get(coin) or 0.0) for coin in coins])
+    return PortfolioResult(names, powers_ghs, tier_index, coins, daily, price_vector)
+
+if __name__ == "__main__":
+    import random
+    import time
+    rng = random.Random(1)
+    accounts = [(f"acc{i:05d}", 10 ** rng.uniform(5, 11)) for i in range(10000)]
+    network = {coin: network_snapshot_entry(f"{rng.uniform(1, 900):.3f} Eh/s", "Gh/s", "0.001", "10m 0s") for coin in KNOWN_TICKERS}
+    prices = {coin: rng.uniform(0.1, 100) for coin in KNOWN_TICKERS}
+    start = time.perf_counter()
+    result = compute_portfolio(accounts, network, prices)
+    elapsed = time.perf_counter() - start
+    print(f"{len(result)} accounts in {elapsed * 1000:.1f} ms; tiers: {result.tier_counts()}")
+    print(f"{result.names[0]}: {result.tier(0)}, best coin {result.best_coin(0)} ({result.best_daily_value(0):.4f} USDT/day)")
+    print(f"Best-coin total: {result.best_coin_total_value():.2f} USDT/day")
@@ -0,0 +1,12 @@
+# Price access pulls in `requests`; it is imported on first use so the core stays fast to import.
+
+CURRENCY_USDT = "USDT" # Same keys as Crypto_Slider.CURRENCY_USDT / CURRENCY_EUR
+CURRENCY_EUR = "EUR"
+
+def create_price_source(**kwargs):
+    """
+    Returns a Crypto_Slider.CryptoSlider; keyword arguments are passed through
+    (base_url, base_dir, config_store, price_ttl, ...).
+    """
+    from Crypto_Slider import CryptoSlider
+    return CryptoSlider(**kwargs)
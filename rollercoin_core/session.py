@@ -0,0 +1,137 @@
+from rollercoin_core.parsing import KNOWN_TICKERS, parse_pasted_text, extract_detected_values
+from rollercoin_core.classify import classify_power, coins_for_tier, power_to_ghs, TIER_NAMES
+from rollercoin_core.compute import compute_rewards, EMPTY_BLOCK_VALUE
+from rollercoin_core.price import CURRENCY_USDT, CURRENCY_EUR, create_price_source
+
+class Session:
+    """
+    Headless calculator state: user power, tier, network power per coin and block
+    duration/reward per coin, with the same rules as the GUI (OCR readings win over
+    pasted ones; the tier follows the power unless overridden).
+
+    With a base_dir, block data is loaded from and saved to the calculator's Calconfig
+    files. Prices are only fetched if fiat_rewards() is used.
+    """
+    def __init__(self, base_dir=None, known_tickers=KNOWN_TICKERS, price_source=None):
+        self.known_tickers = list(known_tickers)
+        self.user_power = ""
+        self.tier_override = None
+        self.detected_values = {} # From OCR
+        self.pasted_values = {}   # From pasted text
+        self.block_data = {}      # {ticker: {'block_duration': str, 'block_reward': str}}
+        self._price_source = price_source
+        self._block_data_manager = None
+        if base_dir is not None:
+            from rollercoin_core.persist import BlockDataPersistenceManager
+            self._block_data_manager = BlockDataPersistenceManager(base_dir)
+            self.block_data = self._block_data_manager.load_block_data()
+
+    # --- Inputs ---
+
+    def set_user_power(self, power_str):
+        self.user_power = power_str
+
+    def set_tier(self, tier):
+        """
+        Pins the tier (like picking it in the GUI); None goes back to deriving it from the power.
+        """
+        if tier is not None and tier not in TIER_NAMES:
+            raise ValueError(f"Unknown tier '{tier}'")
+        self.tier_override = tier
+
+    def apply_paste(self, raw_text):
+        parsed = parse_pasted_text(raw_text, self.known_tickers)
+        self.pasted_values.update(parsed)
+        return parsed
+
+    def apply_ocr(self, ocr_results):
+        """
+        Takes raw PaddleOCR results (running OCR itself is left to the caller).
+        """
+        detected = extract_detected_values(ocr_results, self.known_tickers)
+        self.detected_values.update(detected)
+        return detected
+
+    def set_network_power(self, ticker, rate, unit):
+        self.pasted_values[ticker] = {'rate': str(rate), 'unit': unit, 'block_reward': ""}
+
+    def set_block_data(self, ticker, block_duration=None, block_reward=None):
+        """
+        Sets a coin's block duration and/or reward (strings as typed in the grid) and saves them if persisting.
+        """
+        entry = dict(self.block_data.get(ticker, {}))
+        if block_duration is not None:
+            entry['block_duration'] = block_duration
+        if block_reward is not None:
+            entry['block_reward'] = block_reward
+        self.block_data[ticker] = entry
+        if self._block_data_manager is not None:
+            self._block_data_manager.mark_dirty(ticker, entry)
+
+    # --- Derived state ---
+
+    @property
+    def tier(self):
+        return self.tier_override or classify_power(self.user_power)
+
+    @property
+    def active_coins(self):
+        return coins_for_tier(self.tier)
+
+    @property
+    def user_power_ghs(self):
+        return power_to_ghs(self.user_power) if self.user_power.strip() else 0.0
+
+    def network_power(self, ticker):
+        """
+        Returns (rate_str, unit) for a coin, OCR first, then paste; ("", "") if unknown.
+        """
+        for source in (self.detected_values, self.pasted_values):
+            info = source.get(ticker)
+            if info and info.get('rate') not in (None, ""):
+                return str(info['rate']), info.get('unit', '')
+        return "", ""
+
+    def compute(self, ticker):
+        rate_str, unit = self.network_power(ticker)
+        block_entry = self.block_data.get(ticker, {})
+        return compute_rewards(
+            self.user_power, rate_str, unit,
+            block_entry.get('block_reward', EMPTY_BLOCK_VALUE),
+            block_entry.get('block_duration', EMPTY_BLOCK_VALUE)
+        )
+
+    def compute_all(self):
+        """
+        Rewards of every coin active in the current tier, in crypto units.
+        """
+        return {ticker: self.compute(ticker) for ticker in self.active_coins}
+
+    # --- Prices ---
+
+    @property
+    def price_source(self):
+        if self._price_source is None:
+            self._price_source = create_price_source()
+        return self._price_source
+
+    def fiat_rewards(self, currency=CURRENCY_USDT, wait_seconds=10):
+        """
+        Rewards of the active coins converted to USDT or EUR. Refreshes stale prices
+        first, waiting up to wait_seconds for them.
+        """
+        source = self.price_source
+        if source.get_stale_symbols(currency):
+            fetch = source.fetch_euro_conversion_rates if currency == CURRENCY_EUR else source.fetch_usdt_conversion_rates
+            fetch().wait(wait_seconds)
+        rates = source.get_usdt_rates() if currency == CURRENCY_USDT else source.get_euro_rates()
+        return {
+            ticker: {key: value * rates.get(ticker, 0.0) for key, value in rewards.items()}
+            for ticker, rewards in self.compute_all().items()
+        }
+
+    def close(self):
+        if self._block_data_manager is not None:
+            self._block_data_manager.flush()
+        if self._price_source is not None:
+            self._price_source.shutdown()